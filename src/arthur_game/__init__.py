@@ -2,10 +2,16 @@
 
 __version__ = "0.1.0"
 
+import os
+
+# Keep pygame's import banner out of command output (e.g. simulate writing CSV to stdout)
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
 from .game import Game
+from .simulation import Simulation
 from .towers import create_tower, TOWER_CLASSES
 from .enemy import Enemy
 from .projectile import Projectile
 from . import constants
 
-__all__ = ["Game", "create_tower", "TOWER_CLASSES", "Enemy", "Projectile", "constants"]
+__all__ = ["Game", "Simulation", "create_tower", "TOWER_CLASSES", "Enemy", "Projectile", "constants"]
@@ -0,0 +1,215 @@
+"""Headless batch simulation of a tower layout across many seeds.
+
+``arthur-game simulate LAYOUT`` plays the layout through a wave range once
+per seed, spreading the runs over a ``ProcessPoolExecutor``. Each finished
+run is written straight away as a CSV row or a JSON line, so long batches can
+be watched (or cut short) while they run.
+"""
+
+import csv
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .economy import money_by_wave
+from .layout import Layout, UpgradeSchedule
+from .simulation import Simulation
+
+RUN_FIELDS = (
+    "seed",
+    "start_wave",
+    "end_wave",
+    "reached_wave",
+    "completed",
+    "lives_lost",
+    "money",
+    "score",
+    "kills",
+    "kills_per_tower",
+    "ticks",
+    "seconds",
+    "ticks_per_second",
+)
+
+
+def run_layout(layout, start_wave, end_wave, seed, money=None, max_ticks=None, stop=None, **sim_kwargs):
+    """
+    Play a layout headless from ``start_wave`` until ``end_wave`` is cleared or the game is lost.
+
+    Args:
+        layout: ``Layout`` to place
+        start_wave: First wave to play
+        end_wave: Last wave to play
+        seed: Simulation seed
+        money: Starting money (default: ``economy.money_by_wave(start_wave)``)
+        max_ticks: Give up after this many ticks (default: no limit)
+        stop: Optional ``stop(sim)`` checked whenever a wave ends; returning
+            True ends the run early (e.g. a hopeless candidate)
+        **sim_kwargs: Extra ``Simulation`` options
+
+    Returns:
+        Tuple of (simulation, placed towers parallel to ``layout.towers``)
+    """
+    if money is None:
+        money = money_by_wave(start_wave)
+    sim = Simulation(starting_wave=start_wave, starting_money=money, seed=seed, **sim_kwargs)
+    placed = layout.place(sim)
+    schedule = UpgradeSchedule(layout, placed)
+    sim.auto_advance = True
+
+    wave = sim.wave
+    while not sim.game_over and sim.wave <= end_wave:
+        if max_ticks is not None and sim.tick >= max_ticks:
+            break
+        schedule.update(sim)
+        sim.update()
+        if sim.wave != wave:
+            wave = sim.wave
+            if stop is not None and stop(sim):
+                break
+    return sim, placed
+
+
+def simulate_run(layout_data, start_wave, end_wave, seed, money=None, max_ticks=None):
+    """
+    Run one seed and summarize it (a top-level function so worker processes can run it).
+
+    Returns:
+        Dict with a value for each of ``RUN_FIELDS``
+    """
+    layout = Layout.from_dict(layout_data)
+    start = time.perf_counter()
+    sim, placed = run_layout(layout, start_wave, end_wave, seed, money, max_ticks)
+    seconds = time.perf_counter() - start
+    return {
+        "seed": seed,
+        "start_wave": start_wave,
+        "end_wave": end_wave,
+        "reached_wave": sim.wave,
+        "completed": not sim.game_over and sim.wave > end_wave,
+        "lives_lost": min(20, 20 - sim.lives),
+        "money": sim.money,
+        "score": sim.score,
+        "kills": sim.kills,
+        "kills_per_tower": [tower.kills if tower is not None else 0 for tower in placed],
+        "ticks": sim.tick,
+        "seconds": round(seconds, 4),
+        "ticks_per_second": round(sim.tick / seconds) if seconds > 0 else 0,
+    }
+
+
+class _CsvWriter:
+    """Writes run results as CSV rows (kills_per_tower joined with ';')."""
+
+    def __init__(self, stream):
+        self.writer = csv.DictWriter(stream, fieldnames=RUN_FIELDS)
+        self.writer.writeheader()
+
+    def write(self, result):
+        row = dict(result, kills_per_tower=";".join(str(kills) for kills in result["kills_per_tower"]))
+        self.writer.writerow(row)
+
+
+class _JsonLinesWriter:
+    """Writes run results as one JSON object per line."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, result):
+        self.stream.write(json.dumps(result) + "\n")
+
+
+def run_batch(layout, start_wave, end_wave, seeds, jobs=None, money=None, max_ticks=None, on_result=None):
+    """
+    Run ``layout`` once per seed across a process pool.
+
+    Args:
+        layout: ``Layout`` to play
+        start_wave: First wave to play
+        end_wave: Last wave to play
+        seeds: Iterable of seeds, one run each
+        jobs: Worker processes (default: CPU count); 1 runs in this process
+        money: Starting money (default: the calibrated estimate for ``start_wave``)
+        max_ticks: Per-run tick limit (default: none)
+        on_result: Called with each result dict as runs finish
+
+    Returns:
+        List of result dicts, in the order the runs finished
+    """
+    layout_data = layout.to_dict()
+    results = []
+
+    def finish(result):
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+
+    if jobs == 1:
+        for seed in seeds:
+            finish(simulate_run(layout_data, start_wave, end_wave, seed, money, max_ticks))
+        return results
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(simulate_run, layout_data, start_wave, end_wave, seed, money, max_ticks)
+            for seed in seeds
+        ]
+        for future in as_completed(futures):
+            finish(future.result())
+    return results
+
+
+def parse_wave_range(text):
+    """Parse "START-END" (or a single wave) into a (start, end) tuple."""
+    start, _, end = text.partition("-")
+    start = int(start)
+    end = int(end) if end else start
+    if start < 1 or end < start:
+        raise ValueError(f"Bad wave range: {text}")
+    return start, end
+
+
+def simulate_main(args):
+    """Run the ``simulate`` subcommand with parsed ``args``."""
+    try:
+        start_wave, end_wave = parse_wave_range(args.waves)
+        if args.jobs is not None and args.jobs < 1:
+            raise ValueError(f"--jobs must be at least 1, got {args.jobs}")
+        layout = Layout.load(args.layout)
+        stream = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    except (OSError, ValueError, KeyError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+
+    output_format = args.format
+    if output_format is None:
+        output_format = "jsonl" if args.output.endswith((".jsonl", ".json")) else "csv"
+    writer = (_JsonLinesWriter if output_format == "jsonl" else _CsvWriter)(stream)
+
+    def write(result):
+        writer.write(result)
+        stream.flush()
+
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    start = time.perf_counter()
+    try:
+        results = run_batch(
+            layout, start_wave, end_wave, seeds, args.jobs, args.money, args.max_ticks, on_result=write
+        )
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    seconds = time.perf_counter() - start
+
+    completed = sum(result["completed"] for result in results)
+    ticks = sum(result["ticks"] for result in results)
+    lives_lost = sum(result["lives_lost"] for result in results) / max(len(results), 1)
+    print(
+        f"{len(results)} runs of waves {start_wave}-{end_wave} in {seconds:.1f}s "
+        f"({ticks / seconds:.0f} ticks/s overall): {completed} cleared, "
+        f"{lives_lost:.1f} lives lost on average",
+        file=sys.stderr,
+    )
+    return 0
@@ -0,0 +1,35 @@
+"""Performance benchmarks for the simulation and the renderer.
+
+Fixed, seeded scenarios (waves 10, 30 and 50 with 10, 50 and 200 towers of
+mixed types and levels, and a crowd of 10 enemies per wave number kept on the
+path) measure ``Game.update`` ticks per second, memory
+allocated per tick (traced with ``tracemalloc``) and full frame draw time.
+The draw cost of every enemy look and of every tower class at each level is
+measured separately. Results are written as JSON and can be compared against
+a stored baseline::
+
+    python -m arthur_game.bench --output bench.json
+    python -m arthur_game.bench --baseline bench.json --max-regression 10
+
+The command always uses SDL's dummy video driver, so rendering numbers don't
+depend on a window or a display server.
+
+``--check`` runs the correctness checks in ``bench.checks`` instead, which
+compare batched hit resolution against resolving each hit on its own.
+"""
+
+from .checks import check_hit_resolution
+from .runner import compare, load_results, run_suite, save_results
+from .scenarios import SCENARIOS, Crowd, Scenario, build_simulation
+
+__all__ = [
+    "SCENARIOS",
+    "Crowd",
+    "Scenario",
+    "build_simulation",
+    "check_hit_resolution",
+    "compare",
+    "load_results",
+    "run_suite",
+    "save_results",
+]
@@ -0,0 +1,101 @@
+"""Command line for the benchmarks: ``python -m arthur_game.bench``."""
+
+import argparse
+import os
+import sys
+
+import pygame
+
+from .checks import check_hit_resolution
+from .runner import compare, load_results, run_suite, save_results
+from .scenarios import SCENARIOS
+
+
+def print_comparison(rows, threshold):
+    """Print baseline comparison rows; returns the metrics that regressed past ``threshold``."""
+    regressions = []
+    print(f"{'metric':<52} {'baseline':>12} {'current':>12} {'change':>8}")
+    for metric, before, value, improvement in rows:
+        flag = ""
+        if improvement < -threshold:
+            flag = "  REGRESSION"
+            regressions.append(metric)
+        print(f"{metric:<52} {before:>12} {value:>12} {improvement:>+8.1%}{flag}")
+    return regressions
+
+
+def run_checks():
+    """Run the correctness checks; returns the exit status (1 if any check failed)."""
+    failed = 0
+    for tower_type, tick in check_hit_resolution().items():
+        if tick is None:
+            print(f"hit resolution, {tower_type} only: batched matches per-hit")
+        else:
+            print(f"hit resolution, {tower_type} only: batched differs from per-hit at tick {tick}")
+            failed += 1
+    if failed:
+        print(f"{failed} checks failed", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main():
+    """Run the benchmarks, write the results and optionally compare them to a baseline."""
+    parser = argparse.ArgumentParser(description="Benchmark simulation ticks and per-entity draw cost")
+    parser.add_argument("--output", default="bench.json", help="Results file to write (default: bench.json)")
+    parser.add_argument("--baseline", default=None, help="Earlier results file to compare against")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="Only run this scenario (repeatable; default: all)",
+    )
+    parser.add_argument("--ticks", type=int, default=1000, help="Timed updates per scenario (default: 1000)")
+    parser.add_argument("--quick", action="store_true", help="Fewer ticks, frames and draws, for a fast check")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=None,
+        metavar="PCT",
+        help="With --baseline: exit with status 1 if any metric is more than PCT%% worse",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only run the correctness checks (batched vs per-hit resolution); exit with status 1 on a mismatch",
+    )
+    args = parser.parse_args()
+    if args.check:
+        return run_checks()
+
+    scenarios = [scenario for scenario in SCENARIOS if not args.scenario or scenario.name in args.scenario]
+    if args.quick:
+        settings = {"ticks": min(args.ticks, 200), "warmup": 50, "alloc_ticks": 50, "frames": 10,
+                    "draw_iterations": 50}
+    else:
+        settings = {"ticks": args.ticks}
+    baseline = load_results(args.baseline) if args.baseline else None
+
+    # Rendering is always measured off-screen, so results don't depend on a display
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    pygame.init()
+
+    def progress(name, metrics):
+        print(f"{name}: {metrics}", file=sys.stderr)
+
+    results = run_suite(scenarios, on_progress=progress, **settings)
+    pygame.quit()
+    save_results(results, args.output)
+    print(f"Wrote {args.output}", file=sys.stderr)
+
+    if baseline is not None:
+        threshold = (args.max_regression if args.max_regression is not None else 5) / 100
+        regressions = print_comparison(compare(results, baseline), threshold)
+        if regressions and args.max_regression is not None:
+            print(f"{len(regressions)} metrics regressed by more than {args.max_regression}%", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+"""Benchmark measurements, result files and baseline comparison."""
+
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import pygame
+
+from ..constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from ..game import Game
+from ..path import PATH_LENGTH, point_at
+from ..towers import TOWER_CLASSES, create_tower
+from ..waves import ARCHETYPES, SpawnEntry, default_stats, make_enemy
+from .scenarios import SCENARIOS, SCENARIO_SEED, build_simulation
+
+RESULTS_VERSION = 2
+# Metrics where a bigger number is better; every other metric is a cost
+HIGHER_IS_BETTER = ("ticks_per_second",)
+# Updates between crowd top-ups
+REFILL_INTERVAL = 20
+
+
+def _runs(ticks, crowd):
+    """Split ``ticks`` into runs of at most ``REFILL_INTERVAL``, topping up ``crowd`` before each."""
+    done = 0
+    while done < ticks:
+        crowd.fill()
+        run = min(REFILL_INTERVAL, ticks - done)
+        yield run
+        done += run
+
+
+def measure_ticks(game, crowd, ticks):
+    """
+    Run ``game.update`` ``ticks`` times, topping up the crowd (untimed) between runs.
+
+    Returns:
+        Tuple of (ticks per second, mean enemies on the field at the start and end of each run)
+    """
+    seconds = 0.0
+    counts = []
+    for run in _runs(ticks, crowd):
+        counts.append(len(game.sim.enemies))
+        start = time.perf_counter()
+        for _ in range(run):
+            game.update()
+        seconds += time.perf_counter() - start
+        counts.append(len(game.sim.enemies))
+    return ticks / seconds, sum(counts) / len(counts)
+
+
+def measure_allocations(game, crowd, ticks):
+    """
+    Trace memory allocations over ``ticks`` updates, topping up the crowd between runs.
+
+    Returns:
+        Tuple of (mean bytes allocated within a tick above the memory in use at
+        its start, mean memory blocks left allocated per tick)
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        allocated = 0
+        for run in _runs(ticks, crowd):
+            for _ in range(run):
+                in_use = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                game.update()
+                allocated += tracemalloc.get_traced_memory()[1] - in_use
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return allocated / ticks, blocks / ticks
+
+
+def measure_frames(game, crowd, frames):
+    """
+    Time ``game.draw`` (without the updates between frames); returns milliseconds per frame.
+
+    Each frame is drawn once untimed first, so sprite caches are measured warm.
+    The crowd is topped up before every frame.
+    """
+    seconds = 0.0
+    for _ in range(frames):
+        crowd.fill()
+        game.update()
+        game.draw()
+        start = time.perf_counter()
+        game.draw()
+        seconds += time.perf_counter() - start
+    return seconds / frames * 1000
+
+
+def run_scenario(scenario, ticks=1000, warmup=100, alloc_ticks=200, frames=60, seed=SCENARIO_SEED):
+    """
+    Measure one scenario in a fresh ``Game`` (the display must already be initialized).
+
+    Args:
+        scenario: ``Scenario`` to run
+        ticks: Timed updates
+        warmup: Updates before measuring, so towers have targets and shots in flight
+        alloc_ticks: Updates traced for allocations
+        frames: Frames drawn for the frame time
+        seed: Scenario seed
+
+    Returns:
+        Dict of the scenario's metrics
+    """
+    game = Game(starting_wave=scenario.wave, seed=seed)
+    game.sim, crowd = build_simulation(scenario, seed)
+    for run in _runs(warmup, crowd):
+        for _ in range(run):
+            game.update()
+    ticks_per_second, enemies = measure_ticks(game, crowd, ticks)
+    alloc_bytes, net_blocks = measure_allocations(game, crowd, alloc_ticks)
+    frame_ms = measure_frames(game, crowd, frames)
+    return {
+        "wave": scenario.wave,
+        "towers": scenario.towers,
+        "crowd": scenario.enemies,
+        "enemies_on_field": round(enemies, 1),
+        "ticks_per_second": round(ticks_per_second, 1),
+        "alloc_bytes_per_tick": round(alloc_bytes),
+        "net_blocks_per_tick": round(net_blocks, 2),
+        "frame_ms": round(frame_ms, 3),
+    }
+
+
+def _draw_time(draw, advance, iterations):
+    """
+    Microseconds per call of ``draw()``, calling ``advance(i)`` (untimed) before each.
+
+    One untimed pass over the same frames comes first, so sprite caches are
+    measured warm, as they are in a running game.
+    """
+    for i in range(iterations):
+        advance(i)
+        draw()
+    seconds = 0.0
+    for i in range(iterations):
+        advance(i)
+        start = time.perf_counter()
+        draw()
+        seconds += time.perf_counter() - start
+    return seconds / iterations * 1_000_000
+
+
+def measure_enemy_draws(screen, iterations=300, wave=30):
+    """
+    Cost of ``Enemy.draw`` for each distinct enemy look, across its animation frames.
+
+    Archetypes that look alike (the wave 50 elites) are measured once.
+
+    Returns:
+        Dict of archetype name -> microseconds per draw
+    """
+    results = {}
+    seen = set()
+    for name, archetype in ARCHETYPES.items():
+        if archetype in seen:
+            continue
+        seen.add(archetype)
+        enemy = make_enemy(SpawnEntry(0, name, *default_stats(name, wave)))
+        enemy.distance = PATH_LENGTH / 2
+        enemy.x, enemy.y = point_at(enemy.distance)
+        enemy.health = enemy.max_health * 0.6  # Show a partly drained health bar
+
+        def advance(i, enemy=enemy):
+            enemy.animation_frame = i
+
+        results[name] = round(_draw_time(lambda: enemy.draw(screen), advance, iterations), 2)
+    return results
+
+
+def measure_tower_draws(screen, iterations=300):
+    """
+    Cost of ``draw`` for each tower class at each level, across its animation frames.
+
+    Every tenth frame shows the shoot flash.
+
+    Returns:
+        Dict of "type:level" -> microseconds per draw
+    """
+    results = {}
+    for tower_type in TOWER_CLASSES:
+        for level in (1, 2, 3):
+            tower = create_tower(tower_type, SCREEN_WIDTH // 2, 300)
+            while tower.level < level:
+                tower.upgrade()
+
+            def advance(i, tower=tower):
+                tower.clock.tick = i
+                tower.shot_tick = i if i % 10 == 0 else None
+
+            key = f"{tower_type}:{level}"
+            results[key] = round(_draw_time(lambda: tower.draw(screen), advance, iterations), 2)
+    return results
+
+
+def run_suite(scenarios=SCENARIOS, ticks=1000, warmup=100, alloc_ticks=200, frames=60, draw_iterations=300,
+              on_progress=None):
+    """
+    Run every scenario plus the per-entity draw benchmarks.
+
+    pygame must already be initialized (with the dummy video driver for
+    comparable numbers, see ``bench.__main__``).
+
+    Args:
+        scenarios: ``Scenario`` list to run
+        ticks: Timed updates per scenario
+        warmup: Updates before measuring each scenario
+        alloc_ticks: Updates traced for allocations per scenario
+        frames: Frames drawn per scenario
+        draw_iterations: Draw calls per enemy look and per tower class/level
+        on_progress: Optional ``on_progress(name, metrics)`` after each measurement
+
+    Returns:
+        Results dict, as written by ``save_results``
+    """
+    results = {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "video_driver": pygame.display.get_driver(),
+            "ticks": ticks,
+        },
+        "scenarios": {},
+        "enemy_draw_us": {},
+        "tower_draw_us": {},
+    }
+    for scenario in scenarios:
+        metrics = run_scenario(scenario, ticks, warmup, alloc_ticks, frames)
+        results["scenarios"][scenario.name] = metrics
+        if on_progress is not None:
+            on_progress(scenario.name, metrics)
+
+    screen = pygame.display.get_surface() or pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    results["enemy_draw_us"] = measure_enemy_draws(screen, draw_iterations)
+    if on_progress is not None:
+        on_progress("enemy draws", results["enemy_draw_us"])
+    results["tower_draw_us"] = measure_tower_draws(screen, draw_iterations)
+    if on_progress is not None:
+        on_progress("tower draws", results["tower_draw_us"])
+    return results
+
+
+def save_results(results, path):
+    """Write results as JSON."""
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+
+
+def load_results(path):
+    """Read results written by ``save_results``."""
+    with open(path) as f:
+        results = json.load(f)
+    if results.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Unsupported benchmark results version in {path}")
+    return results
+
+
+def flatten(results):
+    """Turn results into a flat dict of "section/name/metric" -> number (counts and settings excluded)."""
+    flat = {}
+    for name, metrics in results["scenarios"].items():
+        for metric in ("ticks_per_second", "alloc_bytes_per_tick", "net_blocks_per_tick", "frame_ms"):
+            flat[f"scenarios/{name}/{metric}"] = metrics[metric]
+    for section in ("enemy_draw_us", "tower_draw_us"):
+        for name, value in results[section].items():
+            flat[f"{section}/{name}"] = value
+    return flat
+
+
+def compare(results, baseline):
+    """
+    Compare results against a baseline.
+
+    Args:
+        results: Current results dict
+        baseline: Baseline results dict
+
+    Returns:
+        List of (metric, baseline value, current value, improvement) for the
+        metrics both have; improvement is relative, positive when the current
+        run is better (faster, fewer allocations)
+    """
+    current = flatten(results)
+    old = flatten(baseline)
+    rows = []
+    for metric, value in current.items():
+        if metric not in old:
+            continue
+        before = old[metric]
+        change = (value - before) / abs(before) if before else 0.0
+        improvement = change if metric.endswith(HIGHER_IS_BETTER) else -change
+        rows.append((metric, before, value, improvement))
+    return rows
@@ -0,0 +1,129 @@
+"""Fixed, seeded benchmark scenarios.
+
+Each scenario is a game at a given wave with a given number of towers already
+on the board and a fixed crowd of that wave's enemies on the path. The towers
+cycle through every tower type, with levels and spots drawn from the scenario
+seed, so a scenario always builds the same board.
+
+Left to itself a wave trickles in a few enemies at a time, so the board would
+mostly measure idle towers. Instead the crowd starts spread along the whole
+path, and ``Crowd.fill`` tops it back up between measured runs of ticks as
+enemies die or escape.
+"""
+
+import random
+from collections import namedtuple
+
+from ..path import PATH_LENGTH, point_at
+from ..placement import TOWER_SPACING, candidate_spots
+from ..simulation import Simulation
+from ..towers import TOWER_CLASSES, create_tower
+from ..waves import compile_wave, make_enemy
+
+SCENARIO_WAVES = (10, 30, 50)
+SCENARIO_TOWERS = (10, 50, 200)
+# Enemies kept on the field per wave number (wave 50: 500 enemies)
+CROWD_PER_WAVE = 10
+SCENARIO_SEED = 2024
+# Spots are taken from further out than the solver uses, so 200 towers fit
+SPOT_REACH = 200
+# Lives in a benchmark game, so weak boards keep running instead of ending
+BENCH_LIVES = 1_000_000
+# Share of the path the starting crowd is spread over (the rest is left to walk)
+CROWD_SPREAD = 0.9
+
+Scenario = namedtuple("Scenario", ["name", "wave", "towers", "enemies"])
+
+SCENARIOS = tuple(
+    Scenario(f"wave{wave}_towers{towers}", wave, towers, wave * CROWD_PER_WAVE)
+    for wave in SCENARIO_WAVES
+    for towers in SCENARIO_TOWERS
+)
+
+
+class Crowd:
+    """
+    Keeps a scenario's enemy count topped up with enemies of its wave.
+
+    Enemies are taken from the wave's compiled plan in order, starting over at
+    the end, so every run spawns the same enemies.
+    """
+
+    def __init__(self, sim, size, wave, seed=SCENARIO_SEED):
+        """
+        Args:
+            sim: ``Simulation`` to spawn into
+            size: Enemies to keep on the field
+            wave: Wave whose enemies to spawn
+            seed: Seed for compiling the wave plan
+        """
+        self.sim = sim
+        self.size = size
+        self.entries = compile_wave(wave, random.Random(seed)).entries
+        self.spawned = 0
+
+    def fill(self, spread=False):
+        """
+        Spawn enemies until ``size`` are on the field (call between ticks).
+
+        Args:
+            spread: Place the new enemies evenly along the path instead of at its start
+
+        Returns:
+            Number of enemies spawned
+        """
+        missing = self.size - len(self.sim.enemies)
+        for index in range(missing):
+            enemy = make_enemy(self.entries[self.spawned % len(self.entries)])
+            self.spawned += 1
+            if spread:
+                enemy.distance = PATH_LENGTH * CROWD_SPREAD * index / missing
+                enemy.x, enemy.y = point_at(enemy.distance)
+            self.sim.add_enemy(enemy)
+        return max(missing, 0)
+
+
+def tower_spots(count, rng):
+    """
+    Pick ``count`` legal, non-overlapping tower spots near the path.
+
+    Raises:
+        ValueError: If the board can't hold that many towers
+    """
+    spots = candidate_spots(reach=SPOT_REACH)
+    rng.shuffle(spots)
+    chosen = []
+    for x, y in spots:
+        if all((x - cx)**2 + (y - cy)**2 >= TOWER_SPACING**2 for cx, cy in chosen):
+            chosen.append((x, y))
+            if len(chosen) == count:
+                return chosen
+    raise ValueError(f"Only {len(chosen)} tower spots fit on the board, {count} requested")
+
+
+def build_simulation(scenario, seed=SCENARIO_SEED, **sim_kwargs):
+    """
+    Create the simulation for a scenario, with its towers placed and its crowd spread along the path.
+
+    Waves don't advance on their own; the crowd is the only source of enemies.
+
+    Args:
+        scenario: ``Scenario`` to build
+        seed: Seed for the tower layout, the crowd and the simulation
+        **sim_kwargs: Extra ``Simulation`` options
+
+    Returns:
+        Tuple of (``Simulation``, ``Crowd`` that keeps its enemy count up)
+    """
+    rng = random.Random(seed)
+    sim = Simulation(starting_wave=scenario.wave, starting_money=0, seed=seed, **sim_kwargs)
+    sim.lives = BENCH_LIVES
+    tower_types = list(TOWER_CLASSES)
+    for index, (x, y) in enumerate(tower_spots(scenario.towers, rng)):
+        tower = create_tower(tower_types[index % len(tower_types)], x, y)
+        for _ in range(rng.randrange(3)):
+            tower.upgrade()
+        sim.add_tower(tower)
+    crowd = Crowd(sim, scenario.enemies, scenario.wave, seed)
+    crowd.fill(spread=True)
+    return sim, crowd
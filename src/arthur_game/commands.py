@@ -0,0 +1,45 @@
+"""Command-line options of the ``simulate`` and ``solve`` subcommands.
+
+They live apart from ``batch`` and ``solver`` so ``main`` can build its
+parser without importing those modules, whose process pools the pygbag web
+build can't run; ``main`` imports them only to run a subcommand.
+"""
+
+
+def add_simulate_arguments(parser):
+    """Add the ``simulate`` subcommand's options to ``parser``."""
+    parser.add_argument("layout", help="Tower layout file (JSON, see arthur_game/layout.py)")
+    parser.add_argument("--waves", default="1-10", help="Wave range to play, e.g. 10-30 (default: 1-10)")
+    parser.add_argument("--seeds", type=int, default=100, help="Number of seeded runs (default: 100)")
+    parser.add_argument("--first-seed", type=int, default=0, help="Seed of the first run (default: 0)")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument(
+        "--money", type=int, default=None, help="Starting money (default: calibrated estimate for the first wave)"
+    )
+    parser.add_argument("--max-ticks", type=int, default=None, help="Per-run tick limit (default: none)")
+    parser.add_argument("--output", default="-", help="Output file, or - for stdout (default: -)")
+    parser.add_argument(
+        "--format",
+        choices=("csv", "jsonl"),
+        default=None,
+        help="Output format (default: from the output file extension, else csv)",
+    )
+
+
+def add_solve_arguments(parser):
+    """Add the ``solve`` subcommand's options to ``parser``."""
+    parser.add_argument("--waves", default="1-10", help="Wave range to optimize for, e.g. 10-20 (default: 1-10)")
+    parser.add_argument(
+        "--money", type=int, default=None, help="Budget (default: calibrated estimate for the first wave)"
+    )
+    parser.add_argument("--seeds", type=int, default=3, help="Seeds each candidate is played on (default: 3)")
+    parser.add_argument("--population", type=int, default=24, help="Candidates per generation (default: 24)")
+    parser.add_argument("--generations", type=int, default=20, help="Generations to run (default: 20)")
+    parser.add_argument("--elite", type=int, default=4, help="Best candidates kept each generation (default: 4)")
+    parser.add_argument(
+        "--towers", default=None, help="Comma-separated tower types to use (default: all)"
+    )
+    parser.add_argument("--start", metavar="LAYOUT", default=None, help="Layout file to seed the search with")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--search-seed", type=int, default=None, help="Seed for the search itself (default: random)")
+    parser.add_argument("--output", default="layout.json", help="Layout file to write (default: layout.json)")
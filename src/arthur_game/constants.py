@@ -6,6 +6,11 @@ SCREEN_HEIGHT = 720
 TILE_SIZE = 40
 FPS = 60
 
+# Game speed multipliers offered in the speed menu
+SPEED_OPTIONS = (1, 2, 3, 5, 10, 50)
+# Real seconds between turbo-mode progress HUD refreshes
+TURBO_HUD_INTERVAL = 0.25
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -0,0 +1,119 @@
+"""Economy calibration: expected money by wave.
+
+``--wave N`` starts a game as if waves 1..N-1 had been played. The money a
+player has by then is estimated from the real wave plans (``waves.compile_wave``)
+rolled across many seeds, assuming a fixed share of enemies is killed, plus
+the completion bonus the simulation pays after every wave.
+
+Running the calibration takes a while, so its result is shipped as the
+generated module ``economy_table.py``. Regenerate it whenever the wave or
+reward code changes::
+
+    python -m arthur_game.economy
+"""
+
+import argparse
+import random
+from pathlib import Path
+
+from .waves import compile_wave
+
+STARTING_MONEY = 200
+WAVE_BONUS = 50  # Paid by Simulation.update when a wave ends
+KILL_RATE = 0.9
+TABLE_PATH = Path(__file__).with_name("economy_table.py")
+
+
+def money_by_wave(wave):
+    """
+    Expected money when starting at ``wave``, from the generated table.
+
+    Waves past the end of the table grow by its last step.
+    """
+    # Imported here so the calibration still runs when the table is missing or stale
+    from .economy_table import MONEY_BY_WAVE
+
+    if wave < len(MONEY_BY_WAVE):
+        return MONEY_BY_WAVE[max(wave, 0)]
+    last_step = MONEY_BY_WAVE[-1] - MONEY_BY_WAVE[-2]
+    return MONEY_BY_WAVE[-1] + (wave - len(MONEY_BY_WAVE) + 1) * last_step
+
+
+def expected_wave_rewards(max_wave, seeds):
+    """
+    Average total reward of each wave's enemies over many seeds.
+
+    Args:
+        max_wave: Last wave to measure
+        seeds: Number of seeds to average over
+
+    Returns:
+        List where index ``w`` is the mean reward of wave ``w`` (index 0 is unused)
+    """
+    totals = [0.0] * (max_wave + 1)
+    for seed in range(seeds):
+        rng = random.Random(seed)
+        for wave in range(1, max_wave + 1):
+            totals[wave] += sum(entry.reward for entry in compile_wave(wave, rng).entries)
+    return [total / seeds for total in totals]
+
+
+def calibrate(max_wave=100, seeds=1000, kill_rate=KILL_RATE):
+    """
+    Build the money-by-wave table.
+
+    Args:
+        max_wave: Last starting wave in the table
+        seeds: Number of seeds to average the spawn rolls over
+        kill_rate: Share of each wave's reward the player is assumed to earn
+
+    Returns:
+        List where index ``w`` is the expected money when starting at wave ``w``
+        (index 0 mirrors wave 1)
+    """
+    rewards = expected_wave_rewards(max_wave - 1, seeds)
+    money = [STARTING_MONEY, STARTING_MONEY]
+    for wave in range(1, max_wave):
+        money.append(money[-1] + int(rewards[wave] * kill_rate) + WAVE_BONUS)
+    return money
+
+
+def write_table(money, path=TABLE_PATH, seeds=None, kill_rate=KILL_RATE):
+    """Write ``money`` as the generated ``economy_table`` module."""
+    rows = []
+    for start in range(0, len(money), 10):
+        rows.append("    " + " ".join(f"{value}," for value in money[start:start + 10]))
+    lines = [
+        '"""Expected starting money by wave, generated by ``python -m arthur_game.economy``.',
+        "",
+        f"Averaged over {seeds} seeds of the real wave plans with a {kill_rate:.0%} kill rate",
+        "plus the per-wave completion bonus. Do not edit by hand; regenerate instead.",
+        '"""',
+        "",
+        "# MONEY_BY_WAVE[w] is the money to start wave w with (index 0 mirrors wave 1)",
+        "MONEY_BY_WAVE = (",
+        *rows,
+        ")",
+        "",
+    ]
+    Path(path).write_text("\n".join(lines))
+
+
+def main():
+    """Regenerate ``economy_table.py``."""
+    parser = argparse.ArgumentParser(description="Calibrate starting money by wave from the real wave plans")
+    parser.add_argument("--waves", type=int, default=100, help="Last starting wave in the table (default: 100)")
+    parser.add_argument("--seeds", type=int, default=1000, help="Seeds to average over (default: 1000)")
+    parser.add_argument(
+        "--kill-rate", type=float, default=KILL_RATE, help="Share of rewards earned (default: 0.9)"
+    )
+    parser.add_argument("--output", default=str(TABLE_PATH), help="Where to write the table module")
+    args = parser.parse_args()
+
+    money = calibrate(args.waves, args.seeds, args.kill_rate)
+    write_table(money, args.output, args.seeds, args.kill_rate)
+    print(f"Wrote starting money for waves 1-{args.waves} to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""Expected starting money by wave, generated by ``python -m arthur_game.economy``.
+
+Averaged over 1000 seeds of the real wave plans with a 90% kill rate
+plus the per-wave completion bonus. Do not edit by hand; regenerate instead.
+"""
+
+# MONEY_BY_WAVE[w] is the money to start wave w with (index 0 mirrors wave 1)
+MONEY_BY_WAVE = (
+    200, 200, 271, 348, 443, 554, 684, 823, 1013, 1214,
+    1426, 1697, 1983, 2281, 2593, 2933, 3286, 3655, 4052, 4464,
+    4888, 5336, 5800, 6278, 6768, 7287, 7821, 8366, 8943, 9532,
+    10136, 10766, 11407, 12063, 12732, 13427, 14141, 14867, 15621, 16390,
+    17172, 17981, 18805, 19643, 20496, 21374, 22266, 23173, 24108, 25060,
+    26019, 26838, 27840, 28864, 29896, 30955, 32030, 33117, 34234, 35367,
+    36512, 37682, 38862, 40060, 41270, 42509, 43764, 45034, 46331, 47640,
+    48961, 50313, 51678, 53063, 54454, 55875, 57304, 58752, 60231, 61722,
+    63224, 64755, 66297, 67854, 69433, 71030, 72644, 74272, 75928, 77601,
+    79286, 80991, 82709, 84446, 86194, 87979, 89779, 91586, 93419, 95268,
+    97136,
+)
@@ -5,6 +5,19 @@ import math
 from .constants import (
     PATH, RED, NEON_GREEN, CYAN, WHITE
 )
+from .path import PATH_LENGTH, SEGMENT_DIRECTIONS, point_at, segment_at
+from .sprites import SpriteSheet, blend
+
+# Shared sprite sheets, keyed by everything an enemy's look depends on (see Enemy.sprite_sheet)
+_SPRITE_SHEETS = {}
+# Freeze rings, keyed by (radius, alpha)
+_FROST_RINGS = {}
+# The alien king's energy rings turn 0.02 revolutions per tick and have 8
+# particles each, so they look the same every 25 ticks. That doesn't divide the
+# body sheet's period, so they are baked on a sheet of their own
+RING_PERIOD = 25
+# Energy ring sheets, keyed by radius
+_RING_SHEETS = {}
 
 
 class Enemy:
@@ -18,7 +31,10 @@ class Enemy:
         self.color = color
         self.enemy_type = enemy_type
         self.shield = shield  # Shield enemies take 50% less damage
-        self.path_index = 0
+        self.distance = 0.0  # Distance travelled along the path
+        self.spawn_order = 0  # Set by the simulation; breaks targeting ties
+        self.alive = True  # Cleared when killed or escaped; culled at the end of the tick
+        self.handle = None
         self.x = PATH[0][0]
         self.y = PATH[0][1]
 
@@ -41,11 +57,21 @@ class Enemy:
         self.immune_to_freeze = False
         self.immune_to_knockback = False
 
+    @property
+    def path_index(self):
+        """Index of the last path vertex this enemy has passed."""
+        return segment_at(self.distance)
+
+    @property
+    def progress(self):
+        """Fraction of the path covered so far (0.0 at the start, 1.0 at the exit)."""
+        return self.distance / PATH_LENGTH
+
     def move(self):
         """Move enemy along the path. Returns True if reached the end."""
         self.animation_frame += 1
 
-        if self.path_index >= len(PATH) - 1:
+        if self.distance >= PATH_LENGTH:
             return True  # Reached end
 
         # Apply slow effect
@@ -54,21 +80,28 @@ class Enemy:
             current_speed *= 0.5
             self.slow_timer -= 1
 
-        target_x, target_y = PATH[self.path_index + 1]
-        dx = target_x - self.x
-        dy = target_y - self.y
-        distance = math.sqrt(dx**2 + dy**2)
-
-        if distance < current_speed:
-            self.path_index += 1
-            if self.path_index >= len(PATH) - 1:
-                return True
-        else:
-            self.x += (dx / distance) * current_speed
-            self.y += (dy / distance) * current_speed
+        self.distance += current_speed
+        if self.distance >= PATH_LENGTH:
+            return True
 
+        self.x, self.y = point_at(self.distance)
         return False
 
+    def push_back(self, amount):
+        """Move the enemy ``amount`` pixels back toward the start of the path."""
+        self.distance = max(0.0, self.distance - amount)
+        self.x, self.y = point_at(self.distance)
+
+    def ticks_to_exit(self):
+        """Number of ticks until this enemy leaves the path at its current speed."""
+        remaining = PATH_LENGTH - self.distance
+        if remaining <= 0:
+            return 0
+        slowed_distance = self.slow_timer * self.speed * 0.5
+        if remaining <= slowed_distance:
+            return math.ceil(remaining / (self.speed * 0.5))
+        return self.slow_timer + math.ceil((remaining - slowed_distance) / self.speed)
+
     def take_damage(self, damage):
         """Apply damage to enemy. Returns True if enemy dies."""
         # Shield enemies take reduced damage
@@ -85,10 +118,95 @@ class Enemy:
         self.slow_timer = max(self.slow_timer, duration)
 
     def draw(self, screen):
-        """Draw the enemy on screen with sci-fi alien designs."""
+        """Draw the enemy: its pre-rendered animation frame, then the health bar and freeze ring."""
+        self.sprite_sheet().blit(screen, self.x, self.y, self.animation_frame)
+        if self.enemy_type == "alien_king":
+            self.blit_rings(screen)
+        self.draw_overlays(screen)
+
+    def sprite_sheet(self):
+        """
+        The shared ``SpriteSheet`` of this enemy's look.
+
+        Enemies of the same type, shield, radius and color look alike, except
+        that scouts tilt along the path segment they are on, so they get a sheet
+        per segment.
+        """
+        heading = self.path_index if self.enemy_type == "scout" else None
+        key = (self.enemy_type, self.shield, self.radius, self.color, heading)
+        sheet = _SPRITE_SHEETS.get(key)
+        if sheet is None:
+            if heading is None:
+                angle = 0.0
+            else:
+                dx, dy = SEGMENT_DIRECTIONS[heading]
+                angle = math.atan2(dy, dx)
+
+            def draw(surface, x, y, tick):
+                self.draw_body(surface, x, y, tick, angle, rings=False)
+
+            # Big enemies step the animation coarser so their sheets stay small
+            step = 4 if self.radius >= 40 else 2
+            sheet = _SPRITE_SHEETS[key] = SpriteSheet(draw, self.radius * 3 + 40, step)
+        return sheet
+
+    def blit_rings(self, screen):
+        """Draw the alien king's energy rings from their own sheet (see ``RING_PERIOD``)."""
+        sheet = _RING_SHEETS.get(self.radius)
+        if sheet is None:
+            def draw(surface, x, y, tick):
+                self.draw_rings(surface, x, y, tick)
+
+            sheet = _RING_SHEETS[self.radius] = SpriteSheet(draw, self.radius * 1.5 + 4, 1, RING_PERIOD)
+        tick = self.animation_frame
+        surface, (dx, dy) = sheet.frame(tick)
+        # Bob and fade as draw_body does; the baked particles are opaque, so
+        # surface alpha gives the same result as drawing them translucent
+        surface.set_alpha(int(80 + abs(math.sin(tick * 0.05)) * 40))
+        y = self.y + math.sin(tick * 0.1) * 2 * 0.4
+        screen.blit(surface, (int(self.x) + dx, int(y) + dy))
+
+    def draw_rings(self, screen, x, y, tick, alpha=255):
+        """
+        Draw the alien king's three rings of rotating energy particles.
+
+        Args:
+            screen: Surface to draw on
+            x: X position of the king
+            y: Y position of the king (after its bobbing)
+            tick: Animation tick
+            alpha: Opacity of the particles
+        """
+        size = self.radius
+        for i in range(3):
+            ring_angle = (tick * 0.02 + i * 0.33) * math.pi * 2
+            ring_radius = size * (0.9 + i * 0.15)
+
+            ring_surf = pygame.Surface((size * 3, size * 3), pygame.SRCALPHA)
+            # Draw rotating energy particles
+            for j in range(8):
+                particle_angle = ring_angle + (j / 8) * math.pi * 2
+                px = size * 1.5 + math.cos(particle_angle) * ring_radius
+                py = size * 1.5 + math.sin(particle_angle) * ring_radius
+                pygame.draw.circle(ring_surf, (255, 215, 0, alpha), (int(px), int(py)), 3)
+            blend(screen, ring_surf, (int(x - size * 1.5), int(y - size * 1.5)))
+
+    def draw_body(self, screen, x, base_y, tick, heading=0.0, rings=True):
+        """
+        Draw the enemy's body (everything but the health bar and freeze ring) with sci-fi alien designs.
+
+        Args:
+            screen: Surface to draw on (the screen, or a sprite being baked)
+            x: X position of the enemy
+            base_y: Y position of the enemy (before its bobbing)
+            tick: Animation tick
+            heading: Direction of travel in radians (tilts scouts)
+            rings: Whether to draw the alien king's energy rings (sheets bake them
+                separately, see ``blit_rings``)
+        """
         # Animation helpers
-        bob = math.sin(self.animation_frame * 0.1) * 2
-        pulse = abs(math.sin(self.animation_frame * 0.05))
+        bob = math.sin(tick * 0.1) * 2
+        pulse = abs(math.sin(tick * 0.05))
 
         # Draw shield effect first (behind enemy)
         if self.shield:
@@ -96,12 +214,12 @@ class Enemy:
             shield_alpha = int(60 + pulse * 40)
             pygame.draw.circle(shield_surface, (100, 200, 255, shield_alpha),
                              (self.radius * 1.5, self.radius * 1.5), int(self.radius * 1.3))
-            screen.blit(shield_surface, (int(self.x - self.radius * 1.5), int(self.y - self.radius * 1.5)))
+            blend(screen, shield_surface, (int(x - self.radius * 1.5), int(base_y - self.radius * 1.5)))
 
         # ALIEN KING: Massive boss with crown and tentacles
         if self.enemy_type == "alien_king":
             size = self.radius
-            y = self.y + bob * 0.4
+            y = base_y + bob * 0.4
 
             # Massive pulsating body with dark aura
             body_size = int(size * (0.95 + pulse * 0.08))
@@ -113,11 +231,11 @@ class Enemy:
                 aura_radius = int(size * (1.2 + i * 0.15))
                 pygame.draw.circle(aura_surface, (100, 0, 100, aura_alpha),
                                  (int(size * 1.5), int(size * 1.5)), aura_radius)
-            screen.blit(aura_surface, (int(self.x - size * 1.5), int(y - size * 1.5)))
+            blend(screen, aura_surface, (int(x - size * 1.5), int(y - size * 1.5)))
 
             # Main body with darker, more menacing colors
             body_color = (int(self.color[0] * 0.6), int(self.color[1] * 0.3), int(self.color[2] * 0.3))
-            pygame.draw.circle(screen, body_color, (int(self.x), int(y)), body_size)
+            pygame.draw.circle(screen, body_color, (int(x), int(y)), body_size)
 
             # Multiple pulsing layers for depth
             for i in range(3):
@@ -126,14 +244,14 @@ class Enemy:
                 layer_radius = body_size - i * 8
                 pygame.draw.circle(layer_surf, (*self.color, layer_alpha),
                                  (body_size + 5, body_size + 5), layer_radius, 3)
-                screen.blit(layer_surf, (int(self.x - body_size - 5), int(y - body_size - 5)))
+                blend(screen, layer_surf, (int(x - body_size - 5), int(y - body_size - 5)))
 
             # Giant eye stalks (4 of them, more menacing)
             for i in range(4):
                 angle = (i / 4) * math.pi * 2
-                stalk_sway = math.sin(self.animation_frame * 0.1 + i) * 4
+                stalk_sway = math.sin(tick * 0.1 + i) * 4
                 stalk_len = size * 0.4
-                stalk_x = self.x + math.cos(angle) * (size * 0.7)
+                stalk_x = x + math.cos(angle) * (size * 0.7)
                 stalk_y = y - size * 0.5 + math.sin(angle) * (size * 0.3)
 
                 # Stalk
@@ -153,12 +271,12 @@ class Enemy:
             gem_color = (200, 0, 200)
 
             # Crown base (thicker)
-            pygame.draw.rect(screen, crown_color, (int(self.x - size * 0.5), int(crown_y), size, 8), border_radius=2)
-            pygame.draw.rect(screen, (200, 150, 0), (int(self.x - size * 0.5), int(crown_y), size, 8), 2, border_radius=2)
+            pygame.draw.rect(screen, crown_color, (int(x - size * 0.5), int(crown_y), size, 8), border_radius=2)
+            pygame.draw.rect(screen, (200, 150, 0), (int(x - size * 0.5), int(crown_y), size, 8), 2, border_radius=2)
 
             # Crown points (5 large points)
             for i in range(5):
-                point_x = self.x - size * 0.4 + i * (size * 0.2)
+                point_x = x - size * 0.4 + i * (size * 0.2)
                 points = [
                     (int(point_x - 6), int(crown_y)),
                     (int(point_x), int(crown_y - 20)),
@@ -175,10 +293,10 @@ class Enemy:
             # Many thick tentacles (12 tentacles for massive boss)
             for i in range(12):
                 angle = (i / 12) * math.pi * 2
-                wave = math.sin(self.animation_frame * 0.08 + i) * 6
-                wave2 = math.cos(self.animation_frame * 0.1 + i * 0.5) * 5
+                wave = math.sin(tick * 0.08 + i) * 6
+                wave2 = math.cos(tick * 0.1 + i * 0.5) * 5
 
-                start_x = self.x + math.cos(angle) * (size * 0.8)
+                start_x = x + math.cos(angle) * (size * 0.8)
                 start_y = y + math.sin(angle) * (size * 0.8)
 
                 # Multi-segment tentacles
@@ -192,34 +310,23 @@ class Enemy:
                     start_x, start_y = end_x, end_y
 
             # Energy rings around the king
-            for i in range(3):
-                ring_angle = (self.animation_frame * 0.02 + i * 0.33) * math.pi * 2
-                ring_radius = size * (0.9 + i * 0.15)
-                ring_alpha = int(80 + pulse * 40)
-
-                ring_surf = pygame.Surface((size * 3, size * 3), pygame.SRCALPHA)
-                # Draw rotating energy particles
-                for j in range(8):
-                    particle_angle = ring_angle + (j / 8) * math.pi * 2
-                    px = size * 1.5 + math.cos(particle_angle) * ring_radius
-                    py = size * 1.5 + math.sin(particle_angle) * ring_radius
-                    pygame.draw.circle(ring_surf, (255, 215, 0, ring_alpha), (int(px), int(py)), 3)
-                screen.blit(ring_surf, (int(self.x - size * 1.5), int(y - size * 1.5)))
+            if rings:
+                self.draw_rings(screen, x, y, tick, int(80 + pulse * 40))
 
         # UFO: Flying Saucer
         elif self.enemy_type == "ufo":
             size = self.radius
-            y = self.y + bob * 1.2  # More pronounced floating
+            y = base_y + bob * 1.2  # More pronounced floating
 
             # Rotation for spinning effect
-            rotation = self.animation_frame * 0.05
+            rotation = tick * 0.05
 
             # Top dome (metallic)
             dome_points = []
             for i in range(10):
                 angle = (i / 10) * math.pi
                 radius = size * 0.7 * (0.95 + pulse * 0.05)
-                px = self.x + math.cos(angle + math.pi) * radius
+                px = x + math.cos(angle + math.pi) * radius
                 py = y - size * 0.3 + math.sin(angle + math.pi) * radius * 0.5
                 dome_points.append((int(px), int(py)))
             pygame.draw.polygon(screen, (150, 150, 180), dome_points)
@@ -228,8 +335,8 @@ class Enemy:
             # Cockpit window (large glowing dome window)
             cockpit_glow = int(100 + pulse * 155)
             pygame.draw.circle(screen, (cockpit_glow, cockpit_glow, 255),
-                             (int(self.x), int(y - size * 0.3)), int(size * 0.3))
-            pygame.draw.circle(screen, (200, 200, 255), (int(self.x), int(y - size * 0.3)), int(size * 0.3), 2)
+                             (int(x), int(y - size * 0.3)), int(size * 0.3))
+            pygame.draw.circle(screen, (200, 200, 255), (int(x), int(y - size * 0.3)), int(size * 0.3), 2)
 
             # Main saucer disk (wide ellipse)
             disk_points = []
@@ -237,7 +344,7 @@ class Enemy:
                 angle = (i / 16) * math.pi * 2 + rotation
                 radius_x = size * 1.3
                 radius_y = size * 0.4
-                px = self.x + math.cos(angle) * radius_x
+                px = x + math.cos(angle) * radius_x
                 py = y + math.sin(angle) * radius_y
                 disk_points.append((int(px), int(py)))
             pygame.draw.polygon(screen, self.color, disk_points)
@@ -246,7 +353,7 @@ class Enemy:
             # Spinning lights around the rim
             for i in range(8):
                 light_angle = rotation + (i / 8) * math.pi * 2
-                light_x = self.x + math.cos(light_angle) * (size * 1.2)
+                light_x = x + math.cos(light_angle) * (size * 1.2)
                 light_y = y + math.sin(light_angle) * (size * 0.35)
 
                 # Alternating colors
@@ -262,7 +369,7 @@ class Enemy:
                     beam_surf = pygame.Surface((8, 8), pygame.SRCALPHA)
                     beam_alpha = int((pulse - 0.7) * 300)
                     pygame.draw.circle(beam_surf, (*light_color, beam_alpha), (4, 4), 4)
-                    screen.blit(beam_surf, (int(light_x - 4), int(light_y - 4)))
+                    blend(screen, beam_surf, (int(light_x - 4), int(light_y - 4)))
 
             # Tractor beam effect (underneath)
             beam_alpha = int(30 + pulse * 30)
@@ -275,98 +382,94 @@ class Enemy:
                                (size, 0), (size - beam_width, beam_y), 2)
                 pygame.draw.line(beam_surf, (100, 255, 100, beam_alpha),
                                (size, 0), (size + beam_width, beam_y), 2)
-            screen.blit(beam_surf, (int(self.x - size), int(y)))
+            blend(screen, beam_surf, (int(x - size), int(y)))
 
         # BOSS: Alien Battleship/Cruiser
         elif self.enemy_type == "boss":
             size = self.radius
-            y = self.y + bob * 0.5
+            y = base_y + bob * 0.5
 
             # Main hull (wide rectangle)
             hull_w = size * 2.2
             hull_h = size * 1.6
             pygame.draw.rect(screen, self.color,
-                           (int(self.x - hull_w/2), int(y - hull_h/2), hull_w, hull_h), border_radius=4)
+                           (int(x - hull_w/2), int(y - hull_h/2), hull_w, hull_h), border_radius=4)
             pygame.draw.rect(screen, RED,
-                           (int(self.x - hull_w/2), int(y - hull_h/2), hull_w, hull_h), 2, border_radius=4)
+                           (int(x - hull_w/2), int(y - hull_h/2), hull_w, hull_h), 2, border_radius=4)
 
             # Command bridge (top)
             bridge_w = size * 1.2
             bridge_h = size * 0.8
             pygame.draw.rect(screen, (self.color[0]//2, self.color[1]//2, self.color[2]//2),
-                           (int(self.x - bridge_w/2), int(y - hull_h/2 - bridge_h), bridge_w, bridge_h), border_radius=3)
+                           (int(x - bridge_w/2), int(y - hull_h/2 - bridge_h), bridge_w, bridge_h), border_radius=3)
 
             # Windows/eyes (glowing)
             glow_color = (255, int(100 + pulse * 155), 100)
-            pygame.draw.circle(screen, glow_color, (int(self.x - 8), int(y - hull_h/2 - bridge_h/2)), 4)
-            pygame.draw.circle(screen, glow_color, (int(self.x + 8), int(y - hull_h/2 - bridge_h/2)), 4)
+            pygame.draw.circle(screen, glow_color, (int(x - 8), int(y - hull_h/2 - bridge_h/2)), 4)
+            pygame.draw.circle(screen, glow_color, (int(x + 8), int(y - hull_h/2 - bridge_h/2)), 4)
 
             # Weapon turrets (sides)
-            pygame.draw.circle(screen, (150, 50, 50), (int(self.x - hull_w/2 - 3), int(y)), 4)
-            pygame.draw.circle(screen, (150, 50, 50), (int(self.x + hull_w/2 + 3), int(y)), 4)
+            pygame.draw.circle(screen, (150, 50, 50), (int(x - hull_w/2 - 3), int(y)), 4)
+            pygame.draw.circle(screen, (150, 50, 50), (int(x + hull_w/2 + 3), int(y)), 4)
 
             # Reactor core (glowing center)
             core_size = int(4 + pulse * 3)
-            pygame.draw.circle(screen, (255, 255, 100), (int(self.x), int(y)), core_size)
+            pygame.draw.circle(screen, (255, 255, 100), (int(x), int(y)), core_size)
 
         # TANK: Armored Beetle Alien
         elif self.enemy_type == "tank":
             size = self.radius - 2
-            y = self.y + bob * 0.3
+            y = base_y + bob * 0.3
 
             # Thick armored carapace (segmented)
             for i in range(3):
                 segment_y = y - size + i * (size * 0.7)
                 segment_w = size * 1.8 - i * 2
                 pygame.draw.rect(screen, self.color,
-                               (int(self.x - segment_w/2), int(segment_y), segment_w, size * 0.6), border_radius=2)
+                               (int(x - segment_w/2), int(segment_y), segment_w, size * 0.6), border_radius=2)
                 pygame.draw.rect(screen, (self.color[0]//2, self.color[1]//2, self.color[2]//2),
-                               (int(self.x - segment_w/2), int(segment_y), segment_w, size * 0.6), 2, border_radius=2)
+                               (int(x - segment_w/2), int(segment_y), segment_w, size * 0.6), 2, border_radius=2)
 
             # Glowing vents (sides)
             vent_pulse = int(100 + pulse * 155)
-            pygame.draw.circle(screen, (vent_pulse, vent_pulse, 255), (int(self.x - size), int(y)), 3)
-            pygame.draw.circle(screen, (vent_pulse, vent_pulse, 255), (int(self.x + size), int(y)), 3)
+            pygame.draw.circle(screen, (vent_pulse, vent_pulse, 255), (int(x - size), int(y)), 3)
+            pygame.draw.circle(screen, (vent_pulse, vent_pulse, 255), (int(x + size), int(y)), 3)
 
             # Mechanical legs (6 legs, 3 per side)
             leg_color = (self.color[0]//3, self.color[1]//3, self.color[2]//3)
             for i in range(3):
                 leg_y = y - size/2 + i * (size * 0.6)
                 # Left legs
-                pygame.draw.line(screen, leg_color, (self.x - size * 0.8, leg_y),
-                               (self.x - size * 1.3, leg_y + 5), 2)
+                pygame.draw.line(screen, leg_color, (x - size * 0.8, leg_y),
+                               (x - size * 1.3, leg_y + 5), 2)
                 # Right legs
-                pygame.draw.line(screen, leg_color, (self.x + size * 0.8, leg_y),
-                               (self.x + size * 1.3, leg_y + 5), 2)
+                pygame.draw.line(screen, leg_color, (x + size * 0.8, leg_y),
+                               (x + size * 1.3, leg_y + 5), 2)
 
         # SCOUT: Dart Ship (fast spacecraft)
         elif self.enemy_type == "scout":
             size = self.radius
-            y = self.y + bob
+            y = base_y + bob
 
-            # Calculate movement direction for tilt
-            if self.path_index < len(PATH) - 1:
-                target_x, target_y = PATH[self.path_index + 1]
-                angle = math.atan2(target_y - self.y, target_x - self.x)
-            else:
-                angle = 0
+            # Tilt along the current path segment
+            angle = heading
 
             # Ship body (sleek triangle)
-            nose = (int(self.x + math.cos(angle) * size), int(y + math.sin(angle) * size))
-            left_wing = (int(self.x + math.cos(angle + 2.5) * size), int(y + math.sin(angle + 2.5) * size))
-            right_wing = (int(self.x + math.cos(angle - 2.5) * size), int(y + math.sin(angle - 2.5) * size))
+            nose = (int(x + math.cos(angle) * size), int(y + math.sin(angle) * size))
+            left_wing = (int(x + math.cos(angle + 2.5) * size), int(y + math.sin(angle + 2.5) * size))
+            right_wing = (int(x + math.cos(angle - 2.5) * size), int(y + math.sin(angle - 2.5) * size))
 
             pygame.draw.polygon(screen, self.color, [nose, left_wing, right_wing])
             pygame.draw.polygon(screen, (255, 200, 0), [nose, left_wing, right_wing], 2)
 
             # Cockpit window (glowing)
-            cockpit_x = self.x + math.cos(angle) * (size * 0.4)
+            cockpit_x = x + math.cos(angle) * (size * 0.4)
             cockpit_y = y + math.sin(angle) * (size * 0.4)
             glow_val = int(150 + pulse * 105)
             pygame.draw.circle(screen, (glow_val, glow_val, 255), (int(cockpit_x), int(cockpit_y)), 3)
 
             # Engine trails (glowing lines behind)
-            trail_start_x = self.x - math.cos(angle) * (size * 0.5)
+            trail_start_x = x - math.cos(angle) * (size * 0.5)
             trail_start_y = y - math.sin(angle) * (size * 0.5)
             trail_end_x = trail_start_x - math.cos(angle) * (size * 0.8)
             trail_end_y = trail_start_y - math.sin(angle) * (size * 0.8)
@@ -381,39 +484,39 @@ class Enemy:
                                (size + offset_x, size + offset_y),
                                (size + offset_x - math.cos(angle) * size * 0.8,
                                 size + offset_y - math.sin(angle) * size * 0.8), 2)
-                screen.blit(trail_surf, (int(self.x - size), int(y - size)))
+                blend(screen, trail_surf, (int(x - size), int(y - size)))
 
         # NORMAL with CROWN: Alien King
         elif self.enemy_type == "normal" and hasattr(self, 'is_king') and self.is_king:
             size = self.radius
-            y = self.y + bob
+            y = base_y + bob
 
             # Blob body
-            pygame.draw.circle(screen, self.color, (int(self.x), int(y)), size)
+            pygame.draw.circle(screen, self.color, (int(x), int(y)), size)
             pygame.draw.circle(screen, (self.color[0]//2, self.color[1]//2, self.color[2]//2),
-                             (int(self.x), int(y)), size, 2)
+                             (int(x), int(y)), size, 2)
 
             # Eye stalks (animated)
-            stalk_sway = math.sin(self.animation_frame * 0.15) * 2
+            stalk_sway = math.sin(tick * 0.15) * 2
             # Left eye
-            pygame.draw.line(screen, self.color, (self.x - 5, y - size),
-                           (self.x - 5 + stalk_sway, y - size - 6), 2)
-            pygame.draw.circle(screen, NEON_GREEN, (int(self.x - 5 + stalk_sway), int(y - size - 6)), 3)
-            pygame.draw.circle(screen, WHITE, (int(self.x - 5 + stalk_sway), int(y - size - 6)), 2)
+            pygame.draw.line(screen, self.color, (x - 5, y - size),
+                           (x - 5 + stalk_sway, y - size - 6), 2)
+            pygame.draw.circle(screen, NEON_GREEN, (int(x - 5 + stalk_sway), int(y - size - 6)), 3)
+            pygame.draw.circle(screen, WHITE, (int(x - 5 + stalk_sway), int(y - size - 6)), 2)
             # Right eye
-            pygame.draw.line(screen, self.color, (self.x + 5, y - size),
-                           (self.x + 5 - stalk_sway, y - size - 6), 2)
-            pygame.draw.circle(screen, NEON_GREEN, (int(self.x + 5 - stalk_sway), int(y - size - 6)), 3)
-            pygame.draw.circle(screen, WHITE, (int(self.x + 5 - stalk_sway), int(y - size - 6)), 2)
+            pygame.draw.line(screen, self.color, (x + 5, y - size),
+                           (x + 5 - stalk_sway, y - size - 6), 2)
+            pygame.draw.circle(screen, NEON_GREEN, (int(x + 5 - stalk_sway), int(y - size - 6)), 3)
+            pygame.draw.circle(screen, WHITE, (int(x + 5 - stalk_sway), int(y - size - 6)), 2)
 
             # Crown (golden)
             crown_y = y - size - 8
             crown_color = (255, 215, 0)
             # Crown base
-            pygame.draw.rect(screen, crown_color, (int(self.x - 8), int(crown_y), 16, 3))
+            pygame.draw.rect(screen, crown_color, (int(x - 8), int(crown_y), 16, 3))
             # Crown points
             for i in range(3):
-                point_x = self.x - 6 + i * 6
+                point_x = x - 6 + i * 6
                 points = [
                     (int(point_x - 2), int(crown_y)),
                     (int(point_x), int(crown_y - 5)),
@@ -424,8 +527,8 @@ class Enemy:
             # Tentacles (wavy)
             for i in range(4):
                 angle = (i / 4) * math.pi * 2
-                wave = math.sin(self.animation_frame * 0.1 + i) * 3
-                start_x = self.x + math.cos(angle) * (size * 0.7)
+                wave = math.sin(tick * 0.1 + i) * 3
+                start_x = x + math.cos(angle) * (size * 0.7)
                 start_y = y + math.sin(angle) * (size * 0.7)
                 end_x = start_x + math.cos(angle) * (size * 0.8) + wave
                 end_y = start_y + math.sin(angle) * (size * 0.8) + size * 0.3
@@ -434,32 +537,32 @@ class Enemy:
         # NORMAL: Blob Alien (original design enhanced)
         elif self.enemy_type == "normal":
             size = self.radius
-            y = self.y + bob
+            y = base_y + bob
 
             # Blob body (pulsating)
             body_size = int(size * (0.95 + pulse * 0.05))
-            pygame.draw.circle(screen, self.color, (int(self.x), int(y)), body_size)
+            pygame.draw.circle(screen, self.color, (int(x), int(y)), body_size)
             pygame.draw.circle(screen, (self.color[0]//2, self.color[1]//2, self.color[2]//2),
-                             (int(self.x), int(y)), body_size, 2)
+                             (int(x), int(y)), body_size, 2)
 
             # Eye stalks (animated)
-            stalk_sway = math.sin(self.animation_frame * 0.15) * 2
+            stalk_sway = math.sin(tick * 0.15) * 2
             # Left eye
-            pygame.draw.line(screen, self.color, (self.x - 5, y - size),
-                           (self.x - 5 + stalk_sway, y - size - 6), 2)
-            pygame.draw.circle(screen, NEON_GREEN, (int(self.x - 5 + stalk_sway), int(y - size - 6)), 3)
-            pygame.draw.circle(screen, WHITE, (int(self.x - 5 + stalk_sway), int(y - size - 6)), 2)
+            pygame.draw.line(screen, self.color, (x - 5, y - size),
+                           (x - 5 + stalk_sway, y - size - 6), 2)
+            pygame.draw.circle(screen, NEON_GREEN, (int(x - 5 + stalk_sway), int(y - size - 6)), 3)
+            pygame.draw.circle(screen, WHITE, (int(x - 5 + stalk_sway), int(y - size - 6)), 2)
             # Right eye
-            pygame.draw.line(screen, self.color, (self.x + 5, y - size),
-                           (self.x + 5 - stalk_sway, y - size - 6), 2)
-            pygame.draw.circle(screen, NEON_GREEN, (int(self.x + 5 - stalk_sway), int(y - size - 6)), 3)
-            pygame.draw.circle(screen, WHITE, (int(self.x + 5 - stalk_sway), int(y - size - 6)), 2)
+            pygame.draw.line(screen, self.color, (x + 5, y - size),
+                           (x + 5 - stalk_sway, y - size - 6), 2)
+            pygame.draw.circle(screen, NEON_GREEN, (int(x + 5 - stalk_sway), int(y - size - 6)), 3)
+            pygame.draw.circle(screen, WHITE, (int(x + 5 - stalk_sway), int(y - size - 6)), 2)
 
             # Tentacles (wavy, dangling below)
             for i in range(4):
                 angle = (i / 4) * math.pi * 2
-                wave = math.sin(self.animation_frame * 0.1 + i) * 3
-                start_x = self.x + math.cos(angle) * (size * 0.7)
+                wave = math.sin(tick * 0.1 + i) * 3
+                start_x = x + math.cos(angle) * (size * 0.7)
                 start_y = y + math.sin(angle) * (size * 0.7)
                 end_x = start_x + math.cos(angle) * (size * 0.8) + wave
                 end_y = start_y + math.sin(angle) * (size * 0.8) + size * 0.3
@@ -470,19 +573,19 @@ class Enemy:
             glow_alpha = int(30 + pulse * 20)
             pygame.draw.circle(glow_surface, (*NEON_GREEN, glow_alpha),
                              (int(size * 1.5), int(size * 1.5)), size)
-            screen.blit(glow_surface, (int(self.x - size * 1.5), int(y - size * 1.5)))
+            blend(screen, glow_surface, (int(x - size * 1.5), int(y - size * 1.5)))
 
         # SHIELD NORMAL: Jellyfish Alien
         elif self.shield:
             size = self.radius
-            y = self.y + bob * 1.5  # More floating motion
+            y = base_y + bob * 1.5  # More floating motion
 
             # Dome/bell head
             dome_points = []
             for i in range(8):
                 angle = (i / 8) * math.pi
                 radius = size * (0.8 + pulse * 0.1)
-                px = self.x + math.cos(angle + math.pi) * radius
+                px = x + math.cos(angle + math.pi) * radius
                 py = y - size + math.sin(angle + math.pi) * radius * 0.6
                 dome_points.append((int(px), int(py)))
             pygame.draw.polygon(screen, self.color, dome_points)
@@ -491,7 +594,7 @@ class Enemy:
             # Glowing spots on dome
             for i in range(3):
                 angle = (i / 3) * math.pi + math.pi
-                spot_x = self.x + math.cos(angle) * (size * 0.5)
+                spot_x = x + math.cos(angle) * (size * 0.5)
                 spot_y = y - size * 0.7 + math.sin(angle) * (size * 0.3)
                 spot_pulse = int(150 + pulse * 105)
                 pygame.draw.circle(screen, (spot_pulse, spot_pulse, 255), (int(spot_x), int(spot_y)), 2)
@@ -499,11 +602,11 @@ class Enemy:
             # Long flowing tentacles
             for i in range(6):
                 angle = (i / 6) * math.pi * 2
-                wave = math.sin(self.animation_frame * 0.08 + i) * 4
-                wave2 = math.cos(self.animation_frame * 0.12 + i) * 3
+                wave = math.sin(tick * 0.08 + i) * 4
+                wave2 = math.cos(tick * 0.12 + i) * 3
 
                 # Start from dome edge
-                start_x = self.x + math.cos(angle) * (size * 0.6)
+                start_x = x + math.cos(angle) * (size * 0.6)
                 start_y = y
 
                 # Multiple segments for flowing effect
@@ -524,8 +627,10 @@ class Enemy:
             aura_alpha = int(40 + pulse * 30)
             pygame.draw.circle(aura_surface, (100, 200, 255, aura_alpha),
                              (size * 2, size * 2), int(size * 1.5))
-            screen.blit(aura_surface, (int(self.x - size * 2), int(y - size * 2)))
+            blend(screen, aura_surface, (int(x - size * 2), int(y - size * 2)))
 
+    def draw_overlays(self, screen):
+        """Draw the parts that change with game state rather than animation: health bar and freeze ring."""
         # Draw health bar
         health_width = int(self.radius * 2)
         health_height = 4
@@ -539,8 +644,12 @@ class Enemy:
 
         # Draw freeze effect
         if self.slow_timer > 0:
+            pulse = abs(math.sin(self.animation_frame * 0.05))
             ice_alpha = int(100 + pulse * 50)
-            ice_surface = pygame.Surface((self.radius * 3, self.radius * 3), pygame.SRCALPHA)
-            pygame.draw.circle(ice_surface, (*CYAN, ice_alpha),
-                             (int(self.radius * 1.5), int(self.radius * 1.5)), self.radius + 3, 3)
+            ice_surface = _FROST_RINGS.get((self.radius, ice_alpha))
+            if ice_surface is None:
+                ice_surface = pygame.Surface((self.radius * 3, self.radius * 3), pygame.SRCALPHA)
+                pygame.draw.circle(ice_surface, (*CYAN, ice_alpha),
+                                 (int(self.radius * 1.5), int(self.radius * 1.5)), self.radius + 3, 3)
+                _FROST_RINGS[(self.radius, ice_alpha)] = ice_surface
             screen.blit(ice_surface, (int(self.x - self.radius * 1.5), int(self.y - self.radius * 1.5)))
@@ -0,0 +1,216 @@
+"""Array-backed (structure-of-arrays) enemy storage.
+
+Keeps the per-tick enemy fields in contiguous NumPy arrays so movement, slow
+decay and death culling run as a handful of vectorized operations instead of a
+Python loop over ``Enemy`` objects. NumPy is optional: the pygbag web build may
+not ship it, so the simulation only uses this store when asked to.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+from .constants import PATH
+from .enemy import Enemy
+from .path import LAST_SEGMENT, PATH_LENGTH, SEGMENT_DIRECTIONS, VERTEX_DISTANCES
+
+# Numeric codes for Enemy.enemy_type, stored in EnemyStore.type_code
+ENEMY_TYPE_CODES = {
+    "normal": 0,
+    "scout": 1,
+    "tank": 2,
+    "ufo": 3,
+    "boss": 4,
+    "alien_king": 5,
+}
+
+# (attribute name, dtype) for every array in the store
+_FIELDS = (
+    ("x", "float64"),
+    ("y", "float64"),
+    ("distance", "float64"),
+    ("speed", "float64"),
+    ("health", "float64"),
+    ("slow_timer", "int64"),
+    ("animation_frame", "int64"),
+    ("shield", "bool"),
+    ("type_code", "int8"),
+    ("alive", "bool"),
+)
+
+
+def numpy_available():
+    """Return True if NumPy can be imported."""
+    return np is not None
+
+
+def _array_field(name):
+    """Property that reads/writes ``name`` in the owning store at this view's slot."""
+
+    def fget(self):
+        return getattr(self._store, name)[self._slot].item()
+
+    def fset(self, value):
+        getattr(self._store, name)[self._slot] = value
+
+    return property(fget, fset, doc=f"``{name}`` stored in the enemy's array slot.")
+
+
+class EnemyView(Enemy):
+    """
+    An ``Enemy`` whose hot fields live in an ``EnemyStore``.
+
+    Behaves like a regular enemy for rendering and hit effects; movement is done
+    for all views at once by ``EnemyStore.advance``.
+    """
+
+    x = _array_field("x")
+    y = _array_field("y")
+    distance = _array_field("distance")
+    speed = _array_field("speed")
+    health = _array_field("health")
+    slow_timer = _array_field("slow_timer")
+    animation_frame = _array_field("animation_frame")
+    shield = _array_field("shield")
+    alive = _array_field("alive")
+
+    def move(self):
+        """Movement is vectorized in ``EnemyStore.advance``; calling this is a bug."""
+        raise TypeError("EnemyView positions are advanced by EnemyStore.advance()")
+
+
+class _DetachedSlot:
+    """One-slot copy of a removed enemy's fields, so stale views keep their last values."""
+
+    def __init__(self, store, slot):
+        for name, _ in _FIELDS:
+            setattr(self, name, getattr(store, name)[slot:slot + 1].copy())
+
+
+class EnemyStore:
+    """
+    Structure-of-arrays storage for enemies.
+
+    Slots ``0..count-1`` hold live data in spawn order; ``views[i]`` is the
+    ``EnemyView`` for slot ``i``.
+
+    Attributes:
+        count: Number of occupied slots
+        views: EnemyView for each occupied slot, in slot order
+    """
+
+    def __init__(self, capacity=64):
+        if np is None:
+            raise ImportError("EnemyStore requires NumPy (pip install numpy)")
+        self.count = 0
+        self.views = []
+        self._capacity = 0
+        self._released = False
+        self._path_x = np.array([p[0] for p in PATH], dtype="float64")
+        self._path_y = np.array([p[1] for p in PATH], dtype="float64")
+        self._dir_x = np.array([d[0] for d in SEGMENT_DIRECTIONS], dtype="float64")
+        self._dir_y = np.array([d[1] for d in SEGMENT_DIRECTIONS], dtype="float64")
+        self._vertex_distances = np.array(VERTEX_DISTANCES, dtype="float64")
+        for name, dtype in _FIELDS:
+            setattr(self, name, np.zeros(0, dtype=dtype))
+        self.reserve(capacity)
+
+    def reserve(self, capacity):
+        """Grow the arrays so at least ``capacity`` enemies fit without reallocating."""
+        if capacity <= self._capacity:
+            return
+        new_capacity = max(capacity, self._capacity * 2)
+        for name, dtype in _FIELDS:
+            grown = np.zeros(new_capacity, dtype=dtype)
+            grown[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, grown)
+        self._capacity = new_capacity
+
+    def add(self, enemy):
+        """
+        Move a freshly built ``Enemy`` into the store.
+
+        Returns:
+            The ``EnemyView`` that replaces ``enemy``
+        """
+        self.reserve(self.count + 1)
+        slot = self.count
+        self.count += 1
+
+        view = EnemyView.__new__(EnemyView)
+        view._store = self
+        view._slot = slot
+        for name, value in vars(enemy).items():
+            setattr(view, name, value)
+        self.type_code[slot] = ENEMY_TYPE_CODES.get(enemy.enemy_type, 0)
+        self.alive[slot] = True
+        self.views.append(view)
+        return view
+
+    def release(self, view):
+        """Mark an enemy as gone; its slot is reclaimed by the next ``compact``."""
+        self.alive[view._slot] = False
+        self._released = True
+
+    def advance(self):
+        """
+        Move every live enemy one tick along the path.
+
+        Returns:
+            List of views that reached the end of the path this tick (already
+            marked as not alive)
+        """
+        n = self.count
+        if n == 0:
+            return []
+
+        self.animation_frame[:n] += 1
+
+        slow_timer = self.slow_timer[:n]
+        slowed = slow_timer > 0
+        speed = self.speed[:n]
+        distance = self.distance[:n]
+        distance += np.where(slowed, speed * 0.5, speed)
+        slow_timer -= slowed
+
+        alive = self.alive[:n]
+        escaped = np.flatnonzero(alive & (distance >= PATH_LENGTH))
+        if len(escaped):
+            alive[escaped] = False
+            self._released = True
+
+        segment = np.searchsorted(self._vertex_distances, distance, side="right") - 1
+        np.clip(segment, 0, LAST_SEGMENT, out=segment)
+        offset = distance - self._vertex_distances[segment]
+        on_path = distance < PATH_LENGTH
+        self.x[:n] = np.where(on_path, self._path_x[segment] + self._dir_x[segment] * offset, self.x[:n])
+        self.y[:n] = np.where(on_path, self._path_y[segment] + self._dir_y[segment] * offset, self.y[:n])
+
+        views = self.views
+        return [views[i] for i in escaped.tolist()]
+
+    def compact(self):
+        """Drop released slots in one pass, keeping the survivors in spawn order."""
+        if not self._released:
+            return
+        self._released = False
+
+        n = self.count
+        keep = self.alive[:n].copy()
+        kept = np.flatnonzero(keep)
+        # Projectiles may still reference removed enemies; freeze their data
+        # before the slots are reused
+        for slot in np.flatnonzero(~keep).tolist():
+            view = self.views[slot]
+            view._store = _DetachedSlot(self, slot)
+            view._slot = 0
+        first_gap = int(np.argmin(keep)) if len(kept) < n else n
+        for name, _ in _FIELDS:
+            array = getattr(self, name)
+            array[:len(kept)] = array[:n][keep]
+
+        self.views = [view for view, alive in zip(self.views, keep.tolist()) if alive]
+        self.count = len(kept)
+        for slot in range(first_gap, self.count):
+            self.views[slot]._slot = slot
@@ -5,14 +5,16 @@ Manages the main game loop, state, rendering, and event handling.
 """
 
 import asyncio
+import time
+
 import pygame
-import math
-import random
 
 from .constants import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
     FPS,
+    SPEED_OPTIONS,
+    TURBO_HUD_INTERVAL,
     WHITE,
     BLACK,
     SPACE_BG,
@@ -28,80 +30,118 @@ from .constants import (
     STEEL_BLUE,
     PATH,
 )
-from .enemy import Enemy
-from .towers import create_tower
-from .projectile import Projectile
+from .layout import UpgradeSchedule
+from .replay import Command, Replay, apply_command, state_hash
+from .savestate import load_game, save_game
+from .simulation import Simulation
+from .sprites import circle_overlay
+from .text import draw_counter, get_font, render_text
+from .timestep import FixedTimestep
+from .towers import TARGETING_MODES, TOWER_CLASSES
+
+# File written by quicksave (F5) and read by quickload (F9)
+QUICKSAVE_PATH = "quicksave.atds"
 
 
 class Game:
     """
-    Main game class that manages the tower defense game state, rendering, and event handling.
+    Main game class that renders a simulation and handles player input.
+
+    All game rules and state live in ``self.sim`` (a ``Simulation``); this class only
+    adds the display, UI state and event handling on top.
 
     Attributes:
         screen: Pygame display surface
         clock: Pygame clock for FPS control
+        timestep: ``FixedTimestep`` turning real time into simulation ticks
         fullscreen: Whether the game is in fullscreen mode
-        money: Current player money
-        lives: Remaining player lives
-        wave: Current wave number
-        score: Current game score
-        enemies: List of active enemies
-        towers: List of placed towers
-        projectiles: List of active projectiles
+        sim: Display-free simulation holding money, lives, waves, enemies, towers and projectiles
         selected_tower_type: Currently selected tower type for placement
         selected_tower: Currently selected tower for upgrades
-        spawn_timer: Timer for enemy spawning
-        spawn_interval: Frames between enemy spawns
-        enemies_to_spawn: Number of enemies left to spawn in current wave
-        wave_in_progress: Whether a wave is currently active
-        game_speed: Game speed multiplier (1x, 2x, or 3x)
-        auto_advance: Whether to automatically start next wave
+        show_all_ranges: Whether every tower shows its range disc, or only the
+            selected tower and the one under the mouse (toggled with R)
+        game_speed: Game speed multiplier (one of ``SPEED_OPTIONS``)
+        turbo: Whether turbo mode is on (updates as fast as possible, no full renders)
+        recording: ``Replay`` being recorded, or None
+        record_path: File the recording is saved to when the game exits
+        playback: ``Replay`` driving the game instead of player input, or None
+        load_path: Save file the game started from (restarts reload it), or None
+        layout: ``Layout`` placed at the start of every new game, or None
+        layout_schedule: ``UpgradeSchedule`` buying the layout's upgrade order, or None
+            (also after a quickload, since the loaded game has other towers)
         show_restart_confirmation: Whether to show restart confirmation dialog
     """
 
-    def __init__(self, starting_wave: int = 1, starting_money: int = 200):
+    def __init__(
+        self,
+        starting_wave: int = 1,
+        starting_money: int = 200,
+        seed: int = None,
+        record_path: str = None,
+        playback: Replay = None,
+        load_path: str = None,
+        layout=None,
+        show_all_ranges: bool = True,
+    ):
         """
         Initialize the game.
 
         Args:
             starting_wave: Initial wave number (default: 1)
             starting_money: Initial money amount (default: 200)
+            seed: Seed for the game's random streams (default: None, random each game)
+            record_path: Record the player's commands and save them here on exit (default: None)
+            playback: Play back this ``Replay`` instead of taking player commands;
+                the other arguments are ignored (default: None)
+            load_path: Start from this save file instead of a new game; the wave,
+                money and seed arguments are ignored (default: None)
+            layout: ``Layout`` to place at the start of a new game, whose upgrade
+                order is then bought as the waves come (default: None)
+            show_all_ranges: Show every tower's range disc, rather than only the
+                selected or hovered tower's (default: True)
         """
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
         pygame.display.set_caption("Arthur's Tower Defense")
         self.clock = pygame.time.Clock()
+        self.timestep = FixedTimestep()
         self.fullscreen = False
 
-        self.money = starting_money
-        self.lives = 20
-        self.wave = starting_wave
-        self.score = 0
-
-        # Store initial values for reset
-        self.initial_money = starting_money
-        self.initial_wave = starting_wave
-
-        self.enemies = []
-        self.towers = []
-        self.projectiles = []
+        self.playback = playback
+        self._playback_position = 0
+        self.load_path = load_path
+        if playback is not None:
+            self.sim = playback.new_simulation()
+        elif load_path is not None:
+            self.sim = load_game(load_path)
+        else:
+            self.sim = Simulation(starting_wave=starting_wave, starting_money=starting_money, seed=seed)
+        self.record_path = record_path
+        self.recording = Replay.start(self.sim) if record_path else None
+        self.layout = layout
+        self.layout_schedule = None
+        if playback is None and load_path is None:
+            self.place_layout()
 
         self.selected_tower_type = None
         self.selected_tower = None  # For upgrades
-        self.spawn_timer = 0
-        self.spawn_interval = 60  # frames between spawns
-        self.enemies_to_spawn = 5
-        self.wave_in_progress = False
+        self.show_all_ranges = show_all_ranges
 
-        # Speed and auto-advance controls
-        self.game_speed = 1  # 1x, 2x, or 3x
-        self.auto_advance = False
+        # Speed control
+        self.game_speed = 1  # One of SPEED_OPTIONS
+        self.turbo = False
+        self._turbo_hud_time = 0.0
+        self._turbo_ticks = 0
 
         # Confirmation dialog state
         self.show_restart_confirmation = False
 
-        self.font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 24)
-        self.tiny_font = pygame.font.Font(None, 18)
+        # Short status line (e.g. after a quicksave) and when it disappears (pygame ticks in ms)
+        self.message = None
+        self.message_until = 0
+
+        self.font = get_font(32)
+        self.small_font = get_font(24)
+        self.tiny_font = get_font(18)
 
     def toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode."""
@@ -112,85 +152,131 @@ class Game:
             self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
 
     def reset_game(self):
-        """Reset the game to initial state (respects starting wave/money from CLI)."""
-        self.money = self.initial_money
-        self.lives = 20
-        self.wave = self.initial_wave
-        self.score = 0
-        self.enemies = []
-        self.towers = []
-        self.projectiles = []
+        """
+        Reset the game to initial state (respects starting wave/money/seed from CLI).
+
+        A recording starts over with the new game; a playback rewinds to the start.
+        """
+        if self.playback is not None:
+            self.sim = self.playback.new_simulation()
+            self._playback_position = 0
+        elif self.load_path is not None:
+            try:
+                self.sim = load_game(self.load_path)
+            except (OSError, ValueError) as error:
+                # The file may have changed since the game started; keep playing
+                self.show_message(f"Could not reload {self.load_path}: {error}")
+                self.show_restart_confirmation = False
+                return
+        else:
+            auto_advance = self.sim.auto_advance
+            self.sim = Simulation(
+                starting_wave=self.sim.initial_wave,
+                starting_money=self.sim.initial_money,
+                seed=self.sim.initial_seed,
+            )
+            self.sim.auto_advance = auto_advance
+            if self.recording is not None:
+                self.recording = Replay.start(self.sim)
+            self.place_layout()
         self.selected_tower_type = None
         self.selected_tower = None
-        self.spawn_timer = 0
-        self.enemies_to_spawn = 5
-        self.wave_in_progress = False
         self.show_restart_confirmation = False
+        self.stop_turbo()
 
-    def spawn_wave(self):
-        """Start spawning a new wave of enemies."""
-        if not self.wave_in_progress and len(self.enemies) == 0:
-            self.wave_in_progress = True
-            # Wave 50: Special boss wave with 1 king + minions
-            if self.wave == 50:
-                self.enemies_to_spawn = 11  # 1 king + 10 minions
-                self.alien_king_spawned = False  # Track if king has been spawned
-            else:
-                # Reduced by 35%: (5 + wave * 2) * 0.65 = 3 + wave * 1.3
-                self.enemies_to_spawn = max(3, int(3 + self.wave * 1.3))
-            self.spawn_timer = 0
+    def place_layout(self):
+        """
+        Place the starting layout, if any, through player commands (so recordings include it).
+
+        Towers that don't fit the money or the spot are skipped, as in ``Layout.place``.
+        """
+        self.layout_schedule = None
+        if self.layout is None:
+            return
+        placed = []
+        for spec in self.layout.towers:
+            tower = None
+            if self.command("place", spec.tower_type, spec.x, spec.y):
+                index = len(self.sim.towers) - 1
+                tower = self.sim.towers[index]
+                while tower.level < spec.level and self.command("upgrade", index):
+                    pass
+                if tower.targeting_mode != spec.mode:
+                    self.command("target", index, spec.mode)
+            placed.append(tower)
+        self.layout_schedule = UpgradeSchedule(
+            self.layout, placed, upgrade=lambda tower: self.command("upgrade", self.sim.towers.index(tower))
+        )
+
+    def start_turbo(self):
+        """Turn on turbo mode, starting the next wave if none is playing."""
+        if self.sim.game_over:
+            return
+        if self.sim.wave_ready:
+            self.command("wave")
+        self.turbo = True
+        self.selected_tower_type = None
+        self._turbo_hud_time = 0.0
+        self._turbo_ticks = 0
 
-    def spawn_enemy(self):
+    def stop_turbo(self):
+        """Leave turbo mode and go back to fixed-timestep play."""
+        self.turbo = False
+        self.timestep.reset()
+
+    def run_turbo_frame(self):
         """
-        Create a new enemy for the current wave.
+        Spend one frame's budget on updates, refreshing only the progress HUD.
 
-        Returns different enemy types based on wave number.
+        Turbo mode ends when the wave is over (unless auto-advance keeps
+        starting new ones) or the game is lost.
         """
-        # Speed multiplier increases every 3 waves
-        speed_mult = 1 + (self.wave // 3) * 0.1
-
-        # WAVE 50: ALIEN KING BOSS - Epic final boss with minions
-        if self.wave == 50:
-            # First spawn: The Alien King (only once!)
-            if not hasattr(self, 'alien_king_spawned') or not self.alien_king_spawned:
-                self.alien_king_spawned = True
-                # Massive alien king with crown - 5x size, extremely tough, immune to freeze and knockback
-                boss = Enemy(20000, 0.5 * speed_mult, 500, (150, 0, 150), "alien_king")
-                boss.immune_to_knockback = True
-                boss.immune_to_freeze = True
-                return boss
+        sim = self.sim
+
+        def done():
+            return (
+                sim.game_over
+                or self.playback_finished
+                or (not sim.wave_in_progress and not sim.auto_advance)
+            )
+
+        self._turbo_ticks += self.timestep.run_for(1 / FPS, self.update, done)
+        if done():
+            self.stop_turbo()
+            self.draw()
+            return
+
+        now = time.perf_counter()
+        if now - self._turbo_hud_time >= TURBO_HUD_INTERVAL:
+            if self._turbo_hud_time:
+                ticks_per_second = self._turbo_ticks / (now - self._turbo_hud_time)
             else:
-                # Elite minions: Mix of tough enemies to support the king
-                roll = random.random()
-                if roll < 0.4:
-                    # Elite battleships
-                    return Enemy(800, 0.8 * speed_mult, 40, PURPLE, "boss")
-                elif roll < 0.7:
-                    # Elite UFOs
-                    return Enemy(400, 1.8 * speed_mult, 35, (180, 180, 200), "ufo")
-                else:
-                    # Elite tanks
-                    return Enemy(600, 1.0 * speed_mult, 30, STEEL_BLUE, "tank")
-
-        # Different enemy types based on wave
-        if self.wave >= 10 and random.random() < 0.2:
-            # UFO - Flying saucer, stronger than scout
-            return Enemy(120 + self.wave * 15, 1.8 * speed_mult, 25, (180, 180, 200), "ufo")
-        elif self.wave >= 7 and random.random() < 0.15:
-            # Boss battleship - huge health, slow, high reward
-            return Enemy(400 + self.wave * 50, 0.8 * speed_mult, 30, PURPLE, "boss")
-        elif self.wave >= 5 and random.random() < 0.25:
-            # Shield jellyfish - protected
-            return Enemy(80 + self.wave * 15, 1.3 * speed_mult, 15, (100, 150, 255), "normal", shield=True)
-        elif self.wave >= 5 and random.random() < 0.3:
-            # Scout dart ship - fast and weak
-            return Enemy(30 + self.wave * 5, 2.5 * speed_mult, 8, ORANGE, "scout")
-        elif self.wave >= 3 and random.random() < 0.2:
-            # Tank beetle - slow but tough
-            return Enemy(100 + self.wave * 20, 1 * speed_mult, 18, STEEL_BLUE, "tank")
-        else:
-            # Standard blob alien
-            return Enemy(50 + self.wave * 10, 1.5 * speed_mult, 6, RED, "normal")
+                ticks_per_second = 0
+            self.draw_turbo_hud(ticks_per_second)
+            self._turbo_hud_time = now
+            self._turbo_ticks = 0
+
+    def draw_turbo_hud(self, ticks_per_second):
+        """
+        Draw the small progress panel shown instead of the game during turbo mode.
+
+        Args:
+            ticks_per_second: Simulation ticks run per real second since the last refresh
+        """
+        sim = self.sim
+        self.screen.fill(SPACE_BG)
+        lines = [
+            (render_text(self.font, "TURBO", NEON_GREEN), 0),
+            (self.small_font.render(f"Wave {sim.wave}   Lives: {sim.lives}   ${sim.money}   Score: {sim.score}", True, WHITE), 40),
+            (self.tiny_font.render(
+                f"Enemies: {len(sim.enemies)} on field, {sim.enemies_to_spawn} to spawn   "
+                f"{ticks_per_second:.0f} ticks/s ({ticks_per_second / FPS:.0f}x)", True, YELLOW), 70),
+            (render_text(self.tiny_font, "Click anywhere to return to normal speed", GRAY), 95),
+        ]
+        for surface, offset in lines:
+            rect = surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50 + offset))
+            self.screen.blit(surface, rect)
+        pygame.display.flip()
 
     def handle_click(self, pos, right_click=False):
         """
@@ -201,209 +287,160 @@ class Game:
             right_click: Whether this is a right-click (default: False)
         """
         x, y = pos
+        money = self.sim.money
 
         # Right click - select tower for upgrade
         if right_click and y < 620:
-            for tower in self.towers:
-                dist = math.sqrt((x - tower.x)**2 + (y - tower.y)**2)
-                if dist < 30:
-                    self.selected_tower = tower
-                    return
-            self.selected_tower = None
+            self.selected_tower = self.sim.tower_at(x, y)
             return
 
         # Check tower selection buttons (8 towers in 2 rows)
         if y > 625:
             # Row 1
             if 630 <= y < 675:
-                if 5 < x < 100 and self.money >= 50:
+                if 5 < x < 100 and money >= 50:
                     self.selected_tower_type = "basic"
-                elif 105 < x < 200 and self.money >= 75:
+                elif 105 < x < 200 and money >= 75:
                     self.selected_tower_type = "freeze"
-                elif 205 < x < 300 and self.money >= 100:
+                elif 205 < x < 300 and money >= 100:
                     self.selected_tower_type = "sniper"
-                elif 305 < x < 400 and self.money >= 125:
+                elif 305 < x < 400 and money >= 125:
                     self.selected_tower_type = "missile"
             # Row 2
             elif 680 <= y < 725:
-                if 5 < x < 100 and self.money >= 200:
+                if 5 < x < 100 and money >= 200:
                     self.selected_tower_type = "tesla"
-                elif 105 < x < 200 and self.money >= 350:
+                elif 105 < x < 200 and money >= 350:
                     self.selected_tower_type = "plasma"
-                elif 205 < x < 300 and self.money >= 500:
+                elif 205 < x < 300 and money >= 500:
                     self.selected_tower_type = "ion"
-                elif 305 < x < 400 and self.money >= 750:
+                elif 305 < x < 400 and money >= 750:
                     self.selected_tower_type = "quantum"
             self.selected_tower = None
             return
 
         # Place tower
         if self.selected_tower_type and y < 620:
-            tower = create_tower(self.selected_tower_type, x, y)
-
-            if self.money >= tower.cost:
-                # Check if not placing on path
-                too_close = False
-                for px, py in PATH:
-                    if math.sqrt((x - px)**2 + (y - py)**2) < 50:
-                        too_close = True
-                        break
-
-                # Check if not overlapping other towers
-                for other_tower in self.towers:
-                    if math.sqrt((x - other_tower.x)**2 + (y - other_tower.y)**2) < 40:
-                        too_close = True
-                        break
-
-                if not too_close:
-                    self.towers.append(tower)
-                    self.money -= tower.cost
-                    self.selected_tower_type = None
+            if self.command("place", self.selected_tower_type, x, y):
+                self.selected_tower_type = None
 
     def handle_upgrade(self):
         """Handle tower upgrade when upgrade button is clicked."""
         if self.selected_tower:
-            cost = self.selected_tower.get_upgrade_cost()
-            if cost and self.money >= cost:
-                if self.selected_tower.upgrade():
-                    self.money -= cost
+            self.command("upgrade", self.sim.towers.index(self.selected_tower))
 
-    def update(self):
+    def handle_targeting_mode(self):
+        """Cycle the selected tower to the next targeting mode."""
+        if self.selected_tower:
+            tower = self.selected_tower
+            index = TARGETING_MODES.index(tower.targeting_mode)
+            self.command("target", self.sim.towers.index(tower), TARGETING_MODES[(index + 1) % len(TARGETING_MODES)])
+
+    def command(self, kind, *args):
         """
-        Update game state: spawn enemies, move entities, handle collisions, and update towers.
-
-        This includes:
-        - Spawning enemies in waves
-        - Moving enemies along the path
-        - Updating towers and shooting
-        - Moving and checking projectile hits
-        - Applying special effects based on tower types
+        Apply a state-changing player command (see ``replay.Command``), recording it if recording.
+
+        Ignored while a playback is driving the game.
+
+        Returns:
+            True if the command changed the game
         """
-        # Auto-advance: automatically start next wave
-        if self.auto_advance and not self.wave_in_progress and len(self.enemies) == 0:
-            self.spawn_wave()
-
-        # Spawn wave
-        if self.wave_in_progress:
-            self.spawn_timer += 1
-            if self.spawn_timer >= self.spawn_interval and self.enemies_to_spawn > 0:
-                self.enemies.append(self.spawn_enemy())
-                self.enemies_to_spawn -= 1
-                self.spawn_timer = 0
-
-            if self.enemies_to_spawn == 0 and len(self.enemies) == 0:
-                self.wave_in_progress = False
-                self.wave += 1
-                self.money += 50  # Wave completion bonus
-
-        # Move enemies
-        for enemy in self.enemies[:]:
-            if enemy.move():
-                self.lives -= 1
-                self.enemies.remove(enemy)
-
-        # Update towers and shoot
-        for tower in self.towers:
-            tower.update()
-            target = tower.find_target(self.enemies)
-            if target:
-                projectile = tower.shoot(target)
-                if projectile:
-                    self.projectiles.append(projectile)
-
-        # Move projectiles and check hits
-        for projectile in self.projectiles[:]:
-            if projectile.move():
-                if projectile.target in self.enemies:
-                    killed = projectile.target.take_damage(projectile.damage)
-
-                    # Special effects based on tower type
-                    if projectile.color == CYAN:  # Freeze tower
-                        projectile.target.slow(90)
-                        # Level 3: Area freeze
-                        if projectile.tower_level == 3:
-                            for enemy in self.enemies:
-                                dist = math.sqrt((enemy.x - projectile.target.x)**2 +
-                                               (enemy.y - projectile.target.y)**2)
-                                if dist < 100:
-                                    enemy.slow(60)
-
-                    elif projectile.color == ORANGE:  # Missile tower (area damage)
-                        area_radius = 70 if projectile.tower_level < 3 else 100
-                        for enemy in self.enemies:
-                            dist = math.sqrt((enemy.x - projectile.target.x)**2 +
-                                           (enemy.y - projectile.target.y)**2)
-                            if dist < area_radius:
-                                enemy.take_damage(projectile.damage // 2)
-
-                    elif projectile.color == YELLOW:  # Laser tower
-                        # Level 3: Chain lightning
-                        if projectile.tower_level == 3 and not killed:
-                            for enemy in self.enemies:
-                                if enemy != projectile.target:
-                                    dist = math.sqrt((enemy.x - projectile.target.x)**2 +
-                                                   (enemy.y - projectile.target.y)**2)
-                                    if dist < 80:
-                                        enemy.take_damage(projectile.damage // 3)
-                                        break  # Chain to one enemy
-
-                    elif projectile.color == PURPLE:  # Sniper tower
-                        # Level 3: Piercing shot (handled by hitting multiple enemies)
-                        if projectile.tower_level == 3:
-                            for enemy in self.enemies:
-                                if enemy != projectile.target:
-                                    # Check if enemy is along the shot path
-                                    dist = math.sqrt((enemy.x - projectile.target.x)**2 +
-                                                   (enemy.y - projectile.target.y)**2)
-                                    if dist < 50:
-                                        enemy.take_damage(projectile.damage // 2)
-
-                    elif projectile.tower_type == "tesla":  # Tesla tower - chain lightning
-                        # Chain to nearby enemies
-                        chain_count = 2 + projectile.tower_level
-                        chained = [projectile.target]
-                        for _ in range(chain_count):
-                            for enemy in self.enemies:
-                                if enemy not in chained:
-                                    # Check distance from last chained enemy
-                                    dist = math.sqrt((enemy.x - chained[-1].x)**2 +
-                                                   (enemy.y - chained[-1].y)**2)
-                                    if dist < 100:
-                                        enemy.take_damage(projectile.damage // 2)
-                                        chained.append(enemy)
-                                        break
-
-                    elif projectile.tower_type == "plasma":  # Plasma cannon - huge damage + burn
-                        # Extra damage over time (burn effect)
-                        projectile.target.slow(30)  # "Stunned" by plasma hit
-
-                    elif projectile.tower_type == "ion":  # Ion beam - continuous damage
-                        # Already handled by fast fire rate, no special effect needed
-                        pass
-
-                    elif projectile.tower_type == "quantum":  # Quantum disruptor - teleport enemies back
-                        # Push enemy back on the path (unless immune to knockback)
-                        if not projectile.target.immune_to_knockback and projectile.target.path_index > 1:
-                            projectile.target.path_index = max(0, projectile.target.path_index - 2)
-                            projectile.target.x = PATH[projectile.target.path_index][0]
-                            projectile.target.y = PATH[projectile.target.path_index][1]
-                        # Level 3: Area teleport
-                        if projectile.tower_level == 3:
-                            for enemy in self.enemies:
-                                if enemy != projectile.target:
-                                    dist = math.sqrt((enemy.x - projectile.target.x)**2 +
-                                                   (enemy.y - projectile.target.y)**2)
-                                    if dist < 80 and not enemy.immune_to_knockback and enemy.path_index > 1:
-                                        enemy.path_index = max(0, enemy.path_index - 1)
-                                        enemy.x = PATH[enemy.path_index][0]
-                                        enemy.y = PATH[enemy.path_index][1]
-
-                    if killed:
-                        self.money += projectile.target.reward
-                        self.score += projectile.target.reward
-                        self.enemies.remove(projectile.target)
-
-                self.projectiles.remove(projectile)
+        if self.playback is not None:
+            return False
+        return self._apply(Command(self.sim.tick, kind, args))
+
+    def _apply(self, command):
+        """Apply a live or played-back command."""
+        if command.kind == "speed":
+            self.game_speed = command.args[0]
+            self.timestep.reset()
+            changed = True
+        else:
+            changed = apply_command(self.sim, command)
+        if changed and self.recording is not None:
+            self.recording.record(command)
+        return changed
+
+    @property
+    def playback_finished(self):
+        """Whether a playback has reached the end of its recording."""
+        return self.playback is not None and self.sim.tick >= self.playback.end_tick
+
+    def update(self):
+        """Advance the wrapped simulation by one tick (applying due commands and layout upgrades first)."""
+        if self.playback is not None:
+            if self.playback_finished:
+                return
+            self._play_due_commands()
+        if self.layout_schedule is not None:
+            self.layout_schedule.update(self.sim)
+        self.sim.update()
+        if self.playback_finished:
+            self._play_due_commands()  # Commands issued after the last update
+            self.report_playback()
+
+    def _play_due_commands(self):
+        """Apply the playback's commands stamped with the current tick (or earlier)."""
+        commands = self.playback.commands
+        while (self._playback_position < len(commands)
+               and commands[self._playback_position].tick <= self.sim.tick):
+            self._apply(commands[self._playback_position])
+            self._playback_position += 1
+
+    def report_playback(self):
+        """Print the final state hash of a finished playback."""
+        digest = state_hash(self.sim)
+        if not self.playback.final_hash:
+            verdict = "recording has no hash to compare"
+        elif digest == self.playback.final_hash:
+            verdict = "matches recording"
+        else:
+            verdict = f"DIFFERS from recording {self.playback.final_hash}"
+        print(f"Replay finished at tick {self.sim.tick}: final state hash {digest} ({verdict})")
+
+    def show_message(self, text, seconds=2):
+        """Show a short status line over the game for a few seconds."""
+        self.message = text
+        self.message_until = pygame.time.get_ticks() + seconds * 1000
+
+    def toggle_ranges(self):
+        """Switch between showing every tower's range and only the selected or hovered tower's."""
+        self.show_all_ranges = not self.show_all_ranges
+        if self.show_all_ranges:
+            self.show_message("Showing all tower ranges")
+        else:
+            self.show_message("Showing ranges for the selected or hovered tower")
+
+    def quicksave(self):
+        """Save the current game to ``QUICKSAVE_PATH``."""
+        save_game(self.sim, QUICKSAVE_PATH)
+        self.show_message(f"Saved wave {self.sim.wave} to {QUICKSAVE_PATH}")
+
+    def quickload(self):
+        """Replace the current game with the one in ``QUICKSAVE_PATH``."""
+        if self.playback is not None or self.recording is not None:
+            self.show_message("Quickload is off while recording or replaying")
+            return
+        try:
+            sim = load_game(QUICKSAVE_PATH)
+        except (OSError, ValueError) as error:
+            self.show_message(f"Could not load {QUICKSAVE_PATH}: {error}")
+            return
+        self.sim = sim
+        # The schedule holds the old game's towers; a loaded game buys no layout upgrades
+        self.layout_schedule = None
+        self.selected_tower_type = None
+        self.selected_tower = None
+        self.stop_turbo()
+        self.show_message(f"Loaded wave {sim.wave} from {QUICKSAVE_PATH}")
+
+    def save_recording(self):
+        """Write the recording (if any) to ``record_path``."""
+        if self.recording is None:
+            return
+        self.recording.finish(self.sim)
+        self.recording.save(self.record_path)
+        print(f"Recorded {len(self.recording.commands)} commands over {self.sim.tick} ticks to {self.record_path}")
 
     def draw(self):
         """
@@ -430,16 +467,19 @@ class Game:
             pygame.draw.line(self.screen, GRAY, PATH[i], PATH[i + 1], 36)
             pygame.draw.line(self.screen, STEEL_BLUE, PATH[i], PATH[i + 1], 30)
 
-        # Draw towers
-        for tower in self.towers:
-            tower.draw(self.screen)
+        # Draw towers (range discs for all of them, or just the selected and hovered one)
+        mouse_pos = pygame.mouse.get_pos()
+        hovered_tower = self.sim.tower_at(*mouse_pos) if mouse_pos[1] < 620 else None
+        for tower in self.sim.towers:
+            show_range = self.show_all_ranges or tower is self.selected_tower or tower is hovered_tower
+            tower.draw(self.screen, show_range)
 
         # Draw enemies
-        for enemy in self.enemies:
+        for enemy in self.sim.enemies:
             enemy.draw(self.screen)
 
         # Draw projectiles
-        for projectile in self.projectiles:
+        for projectile in self.sim.projectiles:
             projectile.draw(self.screen)
 
         # Draw UI background (adjusted for 720p height)
@@ -470,46 +510,73 @@ class Game:
 
         # Draw stats (compact, on the right side)
         stats_x = 420
-        money_text = self.small_font.render(f"${self.money}", True, NEON_GREEN)
-        lives_text = self.tiny_font.render(f"Lives: {self.lives}", True, RED if self.lives < 5 else WHITE)
-        wave_text = self.tiny_font.render(f"Wave {self.wave}", True, YELLOW)
-
-        self.screen.blit(money_text, (stats_x, 630))
-        self.screen.blit(lives_text, (stats_x, 657))
-        self.screen.blit(wave_text, (stats_x, 675))
+        lives_color = RED if self.sim.lives < 5 else WHITE
+        draw_counter(self.screen, self.small_font, "$", self.sim.money, NEON_GREEN, (stats_x, 630))
+        draw_counter(self.screen, self.tiny_font, "Lives: ", self.sim.lives, lives_color, (stats_x, 657))
+        draw_counter(self.screen, self.tiny_font, "Wave ", self.sim.wave, YELLOW, (stats_x, 675))
 
         # Draw fullscreen button (top-right corner)
         fs_button_rect = pygame.Rect(SCREEN_WIDTH - 35, 5, 30, 30)
         pygame.draw.rect(self.screen, LIGHT_GRAY, fs_button_rect)
         pygame.draw.rect(self.screen, WHITE, fs_button_rect, 2)
         fs_icon = "□" if not self.fullscreen else "⊡"
-        fs_text = self.small_font.render(fs_icon, True, WHITE)
+        fs_text = render_text(self.small_font, fs_icon, WHITE)
         self.screen.blit(fs_text, (SCREEN_WIDTH - 28, 8))
 
-        # Draw speed control (right side, between rows)
-        speed_x = 510
+        # Draw speed control (right of the restart button)
+        speed_x = 760
         speed_y = 638
-        speed_label = self.tiny_font.render("Speed:", True, WHITE)
+        speed_label = render_text(self.tiny_font, "Speed:", WHITE)
         self.screen.blit(speed_label, (speed_x, speed_y))
 
-        # Speed buttons (1x, 2x, 3x)
-        for i, speed in enumerate([1, 2, 3]):
-            btn_x = speed_x + 43 + i * 28
+        # Speed buttons (one per SPEED_OPTIONS entry)
+        for i, speed in enumerate(SPEED_OPTIONS):
+            btn_x = speed_x + 43 + i * 36
             btn_color = NEON_GREEN if self.game_speed == speed else GRAY
-            pygame.draw.rect(self.screen, btn_color, (btn_x, speed_y - 2, 25, 18))
-            pygame.draw.rect(self.screen, WHITE, (btn_x, speed_y - 2, 25, 18), 1)
-            speed_text = self.tiny_font.render(f"{speed}x", True, BLACK)
+            pygame.draw.rect(self.screen, btn_color, (btn_x, speed_y - 2, 33, 18))
+            pygame.draw.rect(self.screen, WHITE, (btn_x, speed_y - 2, 33, 18), 1)
+            speed_text = render_text(self.tiny_font, f"{speed}x", BLACK)
             self.screen.blit(speed_text, (btn_x + 4, speed_y))
 
+        # Turbo button (after the speed buttons)
+        turbo_x = speed_x + 43 + len(SPEED_OPTIONS) * 36
+        pygame.draw.rect(self.screen, ORANGE, (turbo_x, speed_y - 2, 50, 18))
+        pygame.draw.rect(self.screen, WHITE, (turbo_x, speed_y - 2, 50, 18), 1)
+        turbo_text = render_text(self.tiny_font, "TURBO", BLACK)
+        self.screen.blit(turbo_text, (turbo_x + 4, speed_y))
+
+        # Playback progress
+        if self.playback is not None:
+            replay_text = self.tiny_font.render(
+                f"REPLAY  tick {self.sim.tick} / {self.playback.end_tick}", True, YELLOW
+            )
+            self.screen.blit(replay_text, (10, 10))
+
+        # Status message (quicksave/quickload)
+        if self.message and pygame.time.get_ticks() < self.message_until:
+            message_text = render_text(self.small_font, self.message, NEON_GREEN)
+            self.screen.blit(message_text, message_text.get_rect(center=(SCREEN_WIDTH // 2, 20)))
+
+        # Lag report: the simulation could not keep up with the chosen speed
+        if self.timestep.lagging:
+            # Counts change nearly every frame, so don't fill the text cache with them
+            lag_text = self.tiny_font.render(
+                f"LAG: {self.timestep.dropped_ticks} ticks dropped, "
+                f"{self.timestep.skipped_renders} frames skipped",
+                True,
+                RED,
+            )
+            self.screen.blit(lag_text, (speed_x, speed_y + 24))
+
         # Auto-advance checkbox
         auto_x = 685
         auto_y = 638
         checkbox_size = 13
         pygame.draw.rect(self.screen, WHITE, (auto_x, auto_y, checkbox_size, checkbox_size), 2)
-        if self.auto_advance:
+        if self.sim.auto_advance:
             pygame.draw.line(self.screen, NEON_GREEN, (auto_x + 2, auto_y + 6), (auto_x + 5, auto_y + 10), 2)
             pygame.draw.line(self.screen, NEON_GREEN, (auto_x + 5, auto_y + 10), (auto_x + 11, auto_y + 2), 2)
-        auto_label = self.tiny_font.render("Auto", True, WHITE)
+        auto_label = render_text(self.tiny_font, "Auto", WHITE)
         self.screen.blit(auto_label, (auto_x + 17, auto_y))
 
         # Draw restart button (below auto-advance)
@@ -518,12 +585,22 @@ class Game:
         restart_button_rect = pygame.Rect(restart_x, restart_y, 80, 30)
         pygame.draw.rect(self.screen, (180, 50, 50), restart_button_rect)
         pygame.draw.rect(self.screen, WHITE, restart_button_rect, 2)
-        restart_text = self.tiny_font.render("RESTART", True, WHITE)
+        restart_text = render_text(self.tiny_font, "RESTART", WHITE)
         self.screen.blit(restart_text, (restart_x + 12, restart_y + 8))
 
+        # Next wave preview (between waves)
+        if self.sim.wave_ready and not self.sim.game_over:
+            plan = self.sim.next_wave_plan()
+            preview_text = render_text(self.tiny_font, f"Next: {len(plan)} enemies", YELLOW)
+            self.screen.blit(preview_text, (510, 632))
+            counts = [f"{count} {name.replace('_', ' ')}" for name, count in plan.counts()]
+            for row in range(0, min(len(counts), 6), 2):
+                row_text = render_text(self.tiny_font, ", ".join(counts[row:row + 2]), WHITE)
+                self.screen.blit(row_text, (510, 648 + row * 7))
+
         # Draw wave button (right side, below row 2)
-        if not self.wave_in_progress and len(self.enemies) == 0 and not self.auto_advance:
-            button_text = self.tiny_font.render("START WAVE", True, BLACK)
+        if self.sim.wave_ready and not self.sim.auto_advance:
+            button_text = render_text(self.tiny_font, "START WAVE", BLACK)
             button_rect = pygame.Rect(510, 695, 120, 22)
             pygame.draw.rect(self.screen, NEON_GREEN, button_rect)
             pygame.draw.rect(self.screen, WHITE, button_rect, 2)
@@ -536,7 +613,7 @@ class Game:
             panel_x = tower.x + 40
             panel_y = tower.y - 60
             panel_w = 140
-            panel_h = 80
+            panel_h = 104
 
             # Keep panel on screen
             if panel_x + panel_w > SCREEN_WIDTH:
@@ -548,46 +625,51 @@ class Game:
             pygame.draw.rect(self.screen, YELLOW, (panel_x, panel_y, panel_w, panel_h), 2)
 
             # Tower info
-            info_text = self.tiny_font.render(f"{tower.name} Lv.{tower.level}", True, WHITE)
+            info_text = render_text(self.tiny_font, f"{tower.name} Lv.{tower.level}", WHITE)
             self.screen.blit(info_text, (panel_x + 5, panel_y + 5))
 
             # Stats
-            dmg_text = self.tiny_font.render(f"DMG: {int(tower.damage)}", True, WHITE)
-            rng_text = self.tiny_font.render(f"RNG: {int(tower.range)}", True, WHITE)
+            dmg_text = render_text(self.tiny_font, f"DMG: {int(tower.damage)}", WHITE)
+            rng_text = render_text(self.tiny_font, f"RNG: {int(tower.range)}", WHITE)
             self.screen.blit(dmg_text, (panel_x + 5, panel_y + 22))
             self.screen.blit(rng_text, (panel_x + 5, panel_y + 37))
 
+            # Targeting mode button (click to cycle)
+            pygame.draw.rect(self.screen, (60, 60, 90), (panel_x + 5, panel_y + 54, panel_w - 10, 20))
+            pygame.draw.rect(self.screen, CYAN, (panel_x + 5, panel_y + 54, panel_w - 10, 20), 1)
+            target_text = render_text(self.tiny_font, f"Target: {tower.targeting_mode.title()}", WHITE)
+            self.screen.blit(target_text, (panel_x + 10, panel_y + 57))
+
             # Upgrade button
             upgrade_cost = tower.get_upgrade_cost()
             if upgrade_cost:
-                can_afford_upgrade = self.money >= upgrade_cost
+                can_afford_upgrade = self.sim.money >= upgrade_cost
                 btn_color = NEON_GREEN if can_afford_upgrade else (60, 60, 60)
-                pygame.draw.rect(self.screen, btn_color, (panel_x + 5, panel_y + 54, panel_w - 10, 20))
+                pygame.draw.rect(self.screen, btn_color, (panel_x + 5, panel_y + 78, panel_w - 10, 20))
 
                 # Draw semi-transparent overlay if can't afford
                 if not can_afford_upgrade:
                     overlay = pygame.Surface((panel_w - 10, 20), pygame.SRCALPHA)
                     pygame.draw.rect(overlay, (0, 0, 0, 100), (0, 0, panel_w - 10, 20))
-                    self.screen.blit(overlay, (panel_x + 5, panel_y + 54))
+                    self.screen.blit(overlay, (panel_x + 5, panel_y + 78))
 
                 text_color = BLACK if can_afford_upgrade else RED
-                upgrade_text = self.tiny_font.render(f"UPGRADE ${upgrade_cost}", True, text_color)
-                self.screen.blit(upgrade_text, (panel_x + 10, panel_y + 57))
+                upgrade_text = render_text(self.tiny_font, f"UPGRADE ${upgrade_cost}", text_color)
+                self.screen.blit(upgrade_text, (panel_x + 10, panel_y + 81))
             else:
-                max_text = self.tiny_font.render("MAX LEVEL!", True, YELLOW)
-                self.screen.blit(max_text, (panel_x + 20, panel_y + 57))
+                max_text = render_text(self.tiny_font, "MAX LEVEL!", YELLOW)
+                self.screen.blit(max_text, (panel_x + 20, panel_y + 81))
 
         # Draw range indicator when placing tower
         if self.selected_tower_type:
-            mouse_pos = pygame.mouse.get_pos()
             if mouse_pos[1] < 620:  # Only show in play area
-                # Get tower stats to show range
-                temp_tower = create_tower(self.selected_tower_type, mouse_pos[0], mouse_pos[1])
-                # Draw range circle (semi-transparent)
-                range_surface = pygame.Surface((SCREEN_WIDTH, 620), pygame.SRCALPHA)
-                pygame.draw.circle(range_surface, (255, 255, 255, 40), mouse_pos, int(temp_tower.range))
-                pygame.draw.circle(range_surface, (255, 255, 255, 80), mouse_pos, int(temp_tower.range), 2)
-                self.screen.blit(range_surface, (0, 0))
+                # A new tower's range is its class's level 1 range
+                tower_range = int(TOWER_CLASSES[self.selected_tower_type].base_range)
+                # Draw range circle (semi-transparent), clipped to the play area
+                range_surface = circle_overlay(tower_range, WHITE, 40, outline_alpha=80)
+                self.screen.set_clip((0, 0, SCREEN_WIDTH, 620))
+                self.screen.blit(range_surface, (mouse_pos[0] - tower_range, mouse_pos[1] - tower_range))
+                self.screen.set_clip(None)
 
         # Draw restart confirmation dialog
         if self.show_restart_confirmation:
@@ -605,11 +687,11 @@ class Game:
             pygame.draw.rect(self.screen, YELLOW, (dialog_x, dialog_y, dialog_w, dialog_h), 3)
 
             # Warning text
-            warning_text = self.small_font.render("Restart Game?", True, YELLOW)
+            warning_text = render_text(self.small_font, "Restart Game?", YELLOW)
             warning_rect = warning_text.get_rect(center=(SCREEN_WIDTH // 2, dialog_y + 30))
             self.screen.blit(warning_text, warning_rect)
 
-            message_text = self.tiny_font.render("All progress will be lost!", True, WHITE)
+            message_text = render_text(self.tiny_font, "All progress will be lost!", WHITE)
             message_rect = message_text.get_rect(center=(SCREEN_WIDTH // 2, dialog_y + 60))
             self.screen.blit(message_text, message_rect)
 
@@ -620,7 +702,7 @@ class Game:
             yes_btn_h = 40
             pygame.draw.rect(self.screen, (180, 50, 50), (yes_btn_x, yes_btn_y, yes_btn_w, yes_btn_h))
             pygame.draw.rect(self.screen, WHITE, (yes_btn_x, yes_btn_y, yes_btn_w, yes_btn_h), 2)
-            yes_text = self.small_font.render("YES", True, WHITE)
+            yes_text = render_text(self.small_font, "YES", WHITE)
             yes_rect = yes_text.get_rect(center=(yes_btn_x + yes_btn_w // 2, yes_btn_y + yes_btn_h // 2))
             self.screen.blit(yes_text, yes_rect)
 
@@ -631,13 +713,13 @@ class Game:
             no_btn_h = 40
             pygame.draw.rect(self.screen, (50, 150, 50), (no_btn_x, no_btn_y, no_btn_w, no_btn_h))
             pygame.draw.rect(self.screen, WHITE, (no_btn_x, no_btn_y, no_btn_w, no_btn_h), 2)
-            no_text = self.small_font.render("NO", True, WHITE)
+            no_text = render_text(self.small_font, "NO", WHITE)
             no_rect = no_text.get_rect(center=(no_btn_x + no_btn_w // 2, no_btn_y + no_btn_h // 2))
             self.screen.blit(no_text, no_rect)
 
         # Game over
-        if self.lives <= 0:
-            game_over_text = self.font.render(f"GAME OVER! Score: {self.score}", True, RED)
+        if self.sim.game_over:
+            game_over_text = render_text(self.font, f"GAME OVER! Score: {self.sim.score}", RED)
             text_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             pygame.draw.rect(self.screen, WHITE, text_rect.inflate(20, 20))
             self.screen.blit(game_over_text, text_rect)
@@ -659,7 +741,7 @@ class Game:
             selected: Whether the button is currently selected
             cost: Tower cost in money
         """
-        can_afford = self.money >= cost
+        can_afford = self.sim.money >= cost
 
         # Dim the color if can't afford
         if not can_afford:
@@ -680,8 +762,8 @@ class Game:
         text_color = WHITE if can_afford else GRAY
         cost_color = RED if not can_afford else WHITE
 
-        text_surface = self.tiny_font.render(text, True, text_color)
-        cost_surface = self.tiny_font.render(cost_text, True, cost_color)
+        text_surface = render_text(self.tiny_font, text, text_color)
+        cost_surface = render_text(self.tiny_font, cost_text, cost_color)
 
         text_rect = text_surface.get_rect(center=(x + width // 2, y + height // 2 - 8))
         cost_rect = cost_surface.get_rect(center=(x + width // 2, y + height // 2 + 10))
@@ -700,11 +782,21 @@ class Game:
         - Frame rate control
         """
         running = True
+        elapsed = 1 / FPS
 
         while running:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F5:
+                    self.quicksave()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                    self.quickload()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_r:
+                    self.toggle_ranges()
+                elif event.type == pygame.MOUSEBUTTONDOWN and self.turbo:
+                    # Any click leaves turbo mode (and is not passed on to the hidden UI)
+                    self.stop_turbo()
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     pos = pygame.mouse.get_pos()
 
@@ -748,15 +840,21 @@ class Game:
                             continue
 
                         # Check speed buttons
-                        for i, speed in enumerate([1, 2, 3]):
-                            btn_x = 553 + i * 28
-                            if btn_x < pos[0] < btn_x + 25 and 636 < pos[1] < 654:
-                                self.game_speed = speed
+                        for i, speed in enumerate(SPEED_OPTIONS):
+                            btn_x = 803 + i * 36
+                            if btn_x < pos[0] < btn_x + 33 and 636 < pos[1] < 654:
+                                self.command("speed", speed)
                                 continue
 
+                        # Check turbo button
+                        turbo_x = 803 + len(SPEED_OPTIONS) * 36
+                        if turbo_x < pos[0] < turbo_x + 50 and 636 < pos[1] < 654:
+                            self.start_turbo()
+                            continue
+
                         # Check auto-advance checkbox
                         if 685 < pos[0] < 698 and 638 < pos[1] < 651:
-                            self.auto_advance = not self.auto_advance
+                            self.command("auto", not self.sim.auto_advance)
                             continue
 
                         # Check upgrade button click
@@ -769,29 +867,43 @@ class Game:
                             if panel_y < 0:
                                 panel_y = 10
 
-                            # Check if clicked upgrade button
+                            # Check if clicked targeting mode button
                             if (panel_x + 5 < pos[0] < panel_x + 135 and
                                 panel_y + 54 < pos[1] < panel_y + 74):
+                                self.handle_targeting_mode()
+                                continue
+
+                            # Check if clicked upgrade button
+                            if (panel_x + 5 < pos[0] < panel_x + 135 and
+                                panel_y + 78 < pos[1] < panel_y + 98):
                                 self.handle_upgrade()
                                 continue
 
                         # Check start wave button
                         if (510 < pos[0] < 630 and 695 < pos[1] < 717 and
-                            not self.wave_in_progress and len(self.enemies) == 0):
-                            self.spawn_wave()
+                            self.sim.wave_ready):
+                            self.command("wave")
                         else:
                             self.handle_click(pos)
 
                     elif event.button == 3:  # Right click
                         self.handle_click(pos, right_click=True)
 
-            if self.lives > 0:
-                # Run update multiple times based on game speed
-                for _ in range(self.game_speed):
-                    self.update()
+            if self.turbo:
+                self.run_turbo_frame()
+                elapsed = self.clock.tick(FPS) / 1000
+                await asyncio.sleep(0)
+                continue
 
-            self.draw()
-            self.clock.tick(FPS)
+            # Run as many fixed ticks as the real time since the last frame calls for
+            ticks = self.timestep.advance(elapsed, self.game_speed)
+            update_seconds = self.timestep.run(ticks, self.update, lambda: self.sim.game_over)
+
+            # Skip the render when updates alone used up the frame
+            if self.timestep.should_render(update_seconds):
+                self.draw()
+            elapsed = self.clock.tick(FPS) / 1000
             await asyncio.sleep(0)
 
+        self.save_recording()
         pygame.quit()
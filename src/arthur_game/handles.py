@@ -0,0 +1,50 @@
+"""Generational handles for simulation entities.
+
+A handle is a (slot, generation) pair. When an entity is released its slot's
+generation is bumped, so stale handles (e.g. held by an in-flight projectile)
+resolve to None instead of keeping the dead entity around.
+"""
+
+from collections import namedtuple
+
+Handle = namedtuple("Handle", ["slot", "generation"])
+
+
+class HandleTable:
+    """Slot map from handles to live entities."""
+
+    def __init__(self):
+        self._entities = []
+        self._generations = []
+        self._free = []
+
+    def __len__(self):
+        return len(self._entities) - len(self._free)
+
+    def insert(self, entity):
+        """Register ``entity`` and return its new handle (also stored as ``entity.handle``)."""
+        if self._free:
+            slot = self._free.pop()
+            self._entities[slot] = entity
+        else:
+            slot = len(self._entities)
+            self._entities.append(entity)
+            self._generations.append(0)
+        handle = Handle(slot, self._generations[slot])
+        entity.handle = handle
+        return handle
+
+    def get(self, handle):
+        """Return the entity for ``handle``, or None if it has been released."""
+        if handle is None or self._generations[handle.slot] != handle.generation:
+            return None
+        return self._entities[handle.slot]
+
+    def release(self, handle):
+        """Free the entity's slot; existing handles to it stop resolving."""
+        slot = handle.slot
+        if self._generations[slot] != handle.generation:
+            return
+        self._generations[slot] += 1
+        self._entities[slot] = None
+        self._free.append(slot)
@@ -0,0 +1,168 @@
+"""Tower layout files.
+
+A layout lists towers to place (type, position, level, targeting mode) and,
+optionally, an upgrade order: upgrades bought once a given wave is reached.
+Layouts are JSON::
+
+    {
+        "towers": [
+            {"type": "missile", "x": 400, "y": 360, "level": 2, "mode": "first"},
+            {"type": "freeze", "x": 560, "y": 450}
+        ],
+        "upgrades": [{"wave": 12, "tower": 0}]
+    }
+
+``level`` defaults to 1 and ``mode`` to "first"; ``tower`` in an upgrade is
+an index into ``towers``. Positions, waves and indices are integers (replays
+store placements as 16-bit values). The batch simulator and the placement solver read
+and write this format, and ``arthur-game --layout FILE`` starts a game with it.
+"""
+
+import json
+from collections import namedtuple
+
+from .towers import TARGETING_MODES, TOWER_CLASSES
+
+TowerSpec = namedtuple("TowerSpec", ["tower_type", "x", "y", "level", "mode"])
+UpgradeStep = namedtuple("UpgradeStep", ["wave", "tower"])
+
+# Range of a replay command argument (a signed 16-bit value)
+COORDINATE_RANGE = (-2 ** 15, 2 ** 15 - 1)
+
+
+def _integer(entry, name, default=None):
+    """Read an integer field from a layout entry (bools don't count)."""
+    value = entry.get(name, default) if default is not None else entry[name]
+    if type(value) is not int:
+        raise ValueError(f"Layout {name} must be an integer, got {value!r}")
+    return value
+
+
+class Layout:
+    """
+    Towers to place at the start of a game, plus upgrades to buy later.
+
+    Attributes:
+        towers: List of ``TowerSpec``, placed in order
+        upgrades: List of ``UpgradeStep``, bought in order
+    """
+
+    def __init__(self, towers=None, upgrades=None):
+        self.towers = list(towers or [])
+        self.upgrades = list(upgrades or [])
+
+    def cost(self):
+        """Money needed to place every tower at its starting level."""
+        total = 0
+        for spec in self.towers:
+            tower_class = TOWER_CLASSES[spec.tower_type]
+            total += tower_class.cost
+            for level in range(1, spec.level):
+                total += int(tower_class.cost * (1.5 ** level))
+        return total
+
+    def to_dict(self):
+        """JSON-ready form of the layout."""
+        return {
+            "towers": [
+                {"type": spec.tower_type, "x": spec.x, "y": spec.y, "level": spec.level, "mode": spec.mode}
+                for spec in self.towers
+            ],
+            "upgrades": [{"wave": step.wave, "tower": step.tower} for step in self.upgrades],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a layout from its JSON form, validating every field."""
+        towers = []
+        for entry in data.get("towers", []):
+            spec = TowerSpec(
+                entry["type"],
+                _integer(entry, "x"),
+                _integer(entry, "y"),
+                _integer(entry, "level", 1),
+                entry.get("mode", "first"),
+            )
+            if spec.tower_type not in TOWER_CLASSES:
+                raise ValueError(f"Unknown tower type in layout: {spec.tower_type}")
+            if spec.mode not in TARGETING_MODES:
+                raise ValueError(f"Unknown targeting mode in layout: {spec.mode}")
+            if not 1 <= spec.level <= 3:
+                raise ValueError(f"Tower level must be 1-3, got {spec.level}")
+            low, high = COORDINATE_RANGE
+            if not (low <= spec.x <= high and low <= spec.y <= high):
+                raise ValueError(f"Tower position out of range: ({spec.x}, {spec.y})")
+            towers.append(spec)
+        upgrades = []
+        for entry in data.get("upgrades", []):
+            step = UpgradeStep(_integer(entry, "wave"), _integer(entry, "tower"))
+            if not 0 <= step.tower < len(towers):
+                raise ValueError(f"Upgrade refers to missing tower {step.tower}")
+            upgrades.append(step)
+        return cls(towers, upgrades)
+
+    @classmethod
+    def load(cls, path):
+        """Read a layout file."""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    def save(self, path):
+        """Write the layout file."""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write("\n")
+
+    def place(self, sim):
+        """
+        Buy and place the layout's towers (and their starting levels) in ``sim``.
+
+        Towers on illegal spots or beyond the budget are skipped.
+
+        Returns:
+            List parallel to ``towers``: the placed tower, or None if it was skipped
+        """
+        placed = []
+        for spec in self.towers:
+            tower = sim.place_tower(spec.tower_type, spec.x, spec.y)
+            if tower is not None:
+                while tower.level < spec.level and sim.upgrade_tower(tower):
+                    pass
+                sim.set_targeting_mode(tower, spec.mode)
+            placed.append(tower)
+        return placed
+
+
+class UpgradeSchedule:
+    """
+    Buys a layout's upgrade order as a game goes on.
+
+    Each step waits until its wave is reached and the money is there; later
+    steps wait for earlier ones, so the order is kept.
+    """
+
+    def __init__(self, layout, placed, upgrade=None):
+        """
+        Args:
+            layout: ``Layout`` whose upgrade order to follow
+            placed: Towers parallel to ``layout.towers`` (as returned by ``Layout.place``)
+            upgrade: Optional ``upgrade(tower)`` returning whether it bought the
+                upgrade (default: ``sim.upgrade_tower``; the game passes one that
+                goes through its recorded commands)
+        """
+        self.steps = layout.upgrades
+        self.placed = placed
+        self.upgrade = upgrade
+        self.position = 0
+
+    def update(self, sim):
+        """Buy every upgrade that is due and affordable; call once per tick."""
+        while self.position < len(self.steps):
+            step = self.steps[self.position]
+            if step.wave > sim.wave:
+                return
+            tower = self.placed[step.tower]
+            if tower is not None and tower.get_upgrade_cost() is not None:
+                if not (self.upgrade or sim.upgrade_tower)(tower):
+                    return  # Not affordable yet
+            self.position += 1
@@ -2,13 +2,23 @@
 
 import asyncio
 import argparse
+import sys
+import time
 import pygame
+from arthur_game import commands
+from arthur_game.economy import money_by_wave
 from arthur_game.game import Game
+from arthur_game.layout import Layout
+from arthur_game.replay import Replay, check_settings, run_headless, state_hash
+from arthur_game.savestate import load_game
 
 
 def estimate_money_by_wave(wave: int) -> int:
     """
-    Estimate cumulative money earned by a given wave, assuming 90% kill rate.
+    Estimate the money a player has when reaching a given wave, assuming 90% kill rate.
+
+    Reads the table generated by ``python -m arthur_game.economy`` from the real
+    wave plans (see ``economy.money_by_wave``).
 
     Args:
         wave: The wave number to calculate up to
@@ -16,52 +26,49 @@ def estimate_money_by_wave(wave: int) -> int:
     Returns:
         Estimated total money (starting money + earnings from all previous waves)
     """
-    if wave <= 1:
-        return 200  # Starting money
-
-    total_money = 200  # Starting money
-
-    # Simulate earnings for each wave from 1 to wave-1
-    for w in range(1, wave):
-        if w == 50:
-            # Wave 50: 1 king (500) + 10 elite minions (avg ~35 each)
-            enemies_count = 11
-            avg_reward = (500 + 10 * 35) / 11  # ~77
-        else:
-            # Reduced by 35%: (5 + wave * 2) * 0.65 = 3 + wave * 1.3
-            enemies_count = max(3, int(3 + w * 1.3))
-
-            # Average reward based on wave composition
-            if w >= 10:
-                # Mix includes UFOs (25), bosses (30), shields (15), scouts (8), tanks (18), normal (6)
-                avg_reward = 12  # Weighted average
-            elif w >= 7:
-                # Mix includes bosses, shields, scouts, tanks, normal
-                avg_reward = 11
-            elif w >= 5:
-                # Mix includes shields, scouts, tanks, normal
-                avg_reward = 10
-            elif w >= 3:
-                # Mix includes tanks and normal
-                avg_reward = 9
-            else:
-                # Mostly normal
-                avg_reward = 6
-
-        # 90% kill rate (10% escape)
-        wave_earnings = int(enemies_count * avg_reward * 0.9)
-        total_money += wave_earnings
-
-    return total_money
-
-
-async def async_main(starting_wave: int = 1, starting_money: int = 200):
+    return money_by_wave(wave)
+
+
+async def async_main(
+    starting_wave: int = 1,
+    starting_money: int = 200,
+    seed: int = None,
+    record_path: str = None,
+    playback: Replay = None,
+    load_path: str = None,
+    layout: Layout = None,
+    show_all_ranges: bool = True,
+):
     """Run the game asynchronously."""
     pygame.init()
-    game = Game(starting_wave=starting_wave, starting_money=starting_money)
+    game = Game(
+        starting_wave=starting_wave,
+        starting_money=starting_money,
+        seed=seed,
+        record_path=record_path,
+        playback=playback,
+        load_path=load_path,
+        layout=layout,
+        show_all_ranges=show_all_ranges,
+    )
     await game.run()
 
 
+def replay_headless(replay):
+    """Play back a replay without a display and report its final state hash."""
+    start = time.perf_counter()
+    sim = run_headless(replay)
+    seconds = time.perf_counter() - start
+    digest = state_hash(sim)
+    print(f"Replayed {sim.tick} ticks (wave {sim.wave}, {len(replay.commands)} commands) in {seconds:.2f}s")
+    if not replay.final_hash:
+        print(f"Final state hash: {digest}")
+    elif digest == replay.final_hash:
+        print(f"Final state hash: {digest} (matches recording)")
+    else:
+        print(f"Final state hash: {digest} (DIFFERS from recording {replay.final_hash})")
+
+
 def main():
     """Entry point for the game (wraps async function)."""
     parser = argparse.ArgumentParser(description="Arthur's Tower Defense Game")
@@ -77,13 +84,105 @@ def main():
         default=None,
         help="Starting money amount (default: auto-calculated based on wave with 90%% kill rate)",
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed; the same seed and moves replay the same game (default: random)",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="FILE",
+        default=None,
+        help="Record every command of the game to a replay file (saved on exit)",
+    )
+    parser.add_argument(
+        "--load",
+        metavar="FILE",
+        default=None,
+        help="Start from a save file (F5 in game quicksaves to quicksave.atds)",
+    )
+    parser.add_argument(
+        "--layout",
+        metavar="FILE",
+        default=None,
+        help="Start with the towers and upgrade order of a layout file (e.g. from the solve command)",
+    )
+    parser.add_argument(
+        "--focus-ranges",
+        action="store_true",
+        help="Only show the range of the selected or hovered tower (R in game toggles this)",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="FILE",
+        default=None,
+        help="Play back a replay file recorded with --record",
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="With --replay: run without a window as fast as possible and print the final state hash",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    simulate_parser = subparsers.add_parser(
+        "simulate", help="Play a tower layout headless across many seeds (see simulate --help)"
+    )
+    commands.add_simulate_arguments(simulate_parser)
+    solve_parser = subparsers.add_parser(
+        "solve", help="Search for a strong tower layout for a budget and wave range (see solve --help)"
+    )
+    commands.add_solve_arguments(solve_parser)
 
     args = parser.parse_args()
 
+    if args.command == "simulate":
+        from arthur_game import batch
+        sys.exit(batch.simulate_main(args))
+    if args.command == "solve":
+        from arthur_game import solver
+        sys.exit(solver.solve_main(args))
+
+    if args.layout and (args.replay or args.load):
+        print("Error: --layout can't be combined with --replay or --load")
+        return
+
+    if args.replay:
+        try:
+            replay = Replay.load(args.replay)
+        except (OSError, ValueError) as error:
+            print(f"Error: Can't load replay {args.replay}: {error}")
+            return
+        if args.headless:
+            replay_headless(replay)
+        else:
+            asyncio.run(async_main(playback=replay, show_all_ranges=not args.focus_ranges))
+        return
+    if args.headless:
+        print("Error: --headless needs --replay")
+        return
+    if args.load:
+        if args.record:
+            print("Error: --record can't be combined with --load")
+            return
+        # Check the file before opening the window (the game loads it again, and on restarts)
+        try:
+            load_game(args.load)
+        except (OSError, ValueError) as error:
+            print(f"Error: Can't load save file {args.load}: {error}")
+            return
+        asyncio.run(async_main(load_path=args.load, show_all_ranges=not args.focus_ranges))
+        return
+
     # Validate inputs
     if args.wave < 1:
         print("Error: Wave must be at least 1")
         return
+    # Save files (and replays) store the seed in 64 bits
+    if args.seed is not None and not -2**63 <= args.seed < 2**63:
+        print("Error: Seed must fit in 64 bits")
+        return
 
     # Auto-calculate money if not provided and wave > 1
     if args.money is None:
@@ -95,8 +194,32 @@ def main():
         if starting_money < 0:
             print("Error: Money cannot be negative")
             return
+    if args.record:
+        # Checked now, not when the recording is saved at the end of the game
+        try:
+            check_settings(args.wave, starting_money, args.seed)
+        except ValueError as error:
+            print(f"Error: Can't record this game: {error}")
+            return
 
-    asyncio.run(async_main(starting_wave=args.wave, starting_money=starting_money))
+    layout = None
+    if args.layout:
+        try:
+            layout = Layout.load(args.layout)
+        except (OSError, ValueError, KeyError) as error:
+            print(f"Error: Can't load layout {args.layout}: {error}")
+            return
+        if layout.cost() > starting_money:
+            print(f"Warning: the layout costs ${layout.cost()}; towers past ${starting_money} are skipped")
+
+    asyncio.run(async_main(
+        starting_wave=args.wave,
+        starting_money=starting_money,
+        seed=args.seed,
+        record_path=args.record,
+        layout=layout,
+        show_all_ranges=not args.focus_ranges,
+    ))
 
 
 if __name__ == "__main__":
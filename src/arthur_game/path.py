@@ -0,0 +1,75 @@
+"""Arc-length parameterization of the enemy path.
+
+Enemies track their position as a single distance travelled along ``PATH``;
+the tables here turn that distance back into screen coordinates.
+"""
+
+import bisect
+import math
+
+from .constants import PATH
+
+
+def _measure(points):
+    """Return (cumulative vertex distances, unit direction of each segment)."""
+    starts = [0.0]
+    directions = []
+    for (x1, y1), (x2, y2) in zip(points, points[1:]):
+        length = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+        starts.append(starts[-1] + length)
+        directions.append(((x2 - x1) / length, (y2 - y1) / length))
+    return starts, directions
+
+
+# VERTEX_DISTANCES[i] is the distance along the path at PATH[i]
+VERTEX_DISTANCES, SEGMENT_DIRECTIONS = _measure(PATH)
+PATH_LENGTH = VERTEX_DISTANCES[-1]
+LAST_SEGMENT = len(PATH) - 2
+
+
+def segment_at(distance):
+    """Return the index of the path segment containing ``distance``."""
+    index = bisect.bisect_right(VERTEX_DISTANCES, distance) - 1
+    return min(max(index, 0), LAST_SEGMENT)
+
+
+def point_at(distance):
+    """Return the (x, y) position ``distance`` pixels along the path."""
+    index = segment_at(distance)
+    x, y = PATH[index]
+    dx, dy = SEGMENT_DIRECTIONS[index]
+    offset = distance - VERTEX_DISTANCES[index]
+    return x + dx * offset, y + dy * offset
+
+
+def intervals_within(cx, cy, radius):
+    """
+    Return the stretches of path that lie within ``radius`` of (cx, cy).
+
+    Since enemies always sit on the path, an enemy is in range of a circle
+    exactly when its distance falls inside one of these intervals.
+
+    Returns:
+        Sorted, non-overlapping list of (start_distance, end_distance) tuples
+    """
+    intervals = []
+    for index, (dx, dy) in enumerate(SEGMENT_DIRECTIONS):
+        x, y = PATH[index]
+        start = VERTEX_DISTANCES[index]
+        length = VERTEX_DISTANCES[index + 1] - start
+        # Solve |(x, y) + t * (dx, dy) - (cx, cy)|^2 <= radius^2 for t in [0, length]
+        half_b = dx * (x - cx) + dy * (y - cy)
+        c = (x - cx)**2 + (y - cy)**2 - radius * radius
+        disc = half_b * half_b - c
+        if disc < 0:
+            continue
+        root = math.sqrt(disc)
+        t0 = max(0.0, -half_b - root)
+        t1 = min(length, -half_b + root)
+        if t0 > t1:
+            continue
+        if intervals and intervals[-1][1] >= start + t0:
+            intervals[-1] = (intervals[-1][0], start + t1)
+        else:
+            intervals.append((start + t0, start + t1))
+    return intervals
@@ -0,0 +1,40 @@
+"""Legal tower spots.
+
+``candidate_spots`` lists the grid points a tower may go on: inside the play
+area, clear of the path the way ``Simulation.can_place_tower`` checks it, and
+close enough to the path to shoot at it. The placement solver searches over
+these spots and the benchmarks build their boards from them.
+"""
+
+from .constants import PATH
+from .path import intervals_within
+
+# Grid step and reach used to pick the spots towers may go on
+SPOT_SPACING = 20
+SPOT_REACH = 150
+# Play area towers can be placed in (the tower panel starts at y=620)
+PLAY_AREA = (20, 20, 1260, 600)
+# Minimum distances enforced by Simulation.can_place_tower
+PATH_CLEARANCE = 50
+TOWER_SPACING = 40
+
+
+def candidate_spots(spacing=SPOT_SPACING, reach=SPOT_REACH):
+    """
+    Grid points a tower may be placed on.
+
+    A spot must be inside the play area, clear of the path (as
+    ``Simulation.can_place_tower`` checks it) and within ``reach`` of the path.
+
+    Returns:
+        List of (x, y) tuples
+    """
+    left, top, right, bottom = PLAY_AREA
+    spots = []
+    for x in range(left, right + 1, spacing):
+        for y in range(top, bottom + 1, spacing):
+            if any((x - px)**2 + (y - py)**2 < PATH_CLEARANCE**2 for px, py in PATH):
+                continue
+            if intervals_within(x, y, reach):
+                spots.append((x, y))
+    return spots
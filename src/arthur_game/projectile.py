@@ -8,33 +8,49 @@ from .constants import YELLOW, BLACK
 class Projectile:
     """Represents a projectile fired by a tower."""
 
-    def __init__(self, x, y, target, damage, color=YELLOW, speed=8, tower_level=1, tower_type="basic"):
+    def __init__(self, x, y, target, damage, color=YELLOW, speed=8, tower_level=1, tower_type="basic", source=None):
         self.x = x
         self.y = y
-        self.target = target
+        # Resolved through Simulation.enemy_handles; None if the target is already gone
+        self.target_handle = target.handle if target is not None else None
         self.damage = damage
         self.color = color
         self.speed = speed
         self.radius = 5
         self.tower_level = tower_level
         self.tower_type = tower_type
+        self.source = source  # Tower that fired it (credited with its kills), if known
+        self.alive = True
+        self.handle = None
 
-    def move(self):
-        """Move projectile toward target. Returns True if hit or target is dead."""
-        if self.target.health <= 0:
-            return True  # Target dead, remove projectile
+    def move(self, target):
+        """
+        Move projectile toward its target.
 
-        dx = self.target.x - self.x
-        dy = self.target.y - self.y
-        distance = math.sqrt(dx**2 + dy**2)
+        Args:
+            target: The enemy ``target_handle`` resolves to, or None if it is gone
+
+        Returns:
+            True if the projectile hit or its target is dead
+        """
+        if target is None or not target.alive:
+            return True  # Target dead, remove projectile
 
-        if distance < self.speed:
+        if self.reaches(target):
             return True  # Hit target
 
+        dx = target.x - self.x
+        dy = target.y - self.y
+        distance = math.sqrt(dx**2 + dy**2)
+
         self.x += (dx / distance) * self.speed
         self.y += (dy / distance) * self.speed
         return False
 
+    def reaches(self, target):
+        """Whether ``target`` is close enough to be hit this tick."""
+        return math.sqrt((target.x - self.x)**2 + (target.y - self.y)**2) < self.speed
+
     def draw(self, screen):
         """Draw the projectile on screen."""
         pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
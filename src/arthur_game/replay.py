@@ -0,0 +1,253 @@
+"""Command recording and replay.
+
+Everything the player does that changes the game (placing and upgrading towers,
+changing targeting modes, starting waves, toggling auto-advance, changing speed)
+is a ``Command`` stamped with the simulation tick it happened on. Because each
+game's randomness comes from its seed, the starting settings plus the command
+list are enough to rebuild the whole game, either in the window or headless as
+fast as the simulation can run.
+
+Replay files are a short header followed by the zlib-compressed commands,
+10 bytes each before compression.
+"""
+
+import hashlib
+import struct
+import zlib
+from collections import namedtuple
+
+from .simulation import Simulation
+from .towers import TARGETING_MODES, TOWER_CLASSES
+
+MAGIC = b"ATDR"
+VERSION = 1
+# magic, version, wave, money, seed, auto_advance, end tick, final state hash
+_HEADER = struct.Struct("<4sBiiqBI32s")
+# tick, opcode, small argument, two int16 arguments
+_COMMAND = struct.Struct("<IBBhh")
+
+COMMAND_KINDS = ("place", "upgrade", "target", "wave", "auto", "speed")
+_TOWER_TYPES = tuple(TOWER_CLASSES)
+
+Command = namedtuple("Command", ["tick", "kind", "args"])
+Command.__doc__ = """
+A player command applied before the simulation update of ``tick``.
+
+``args`` by kind: place (tower_type, x, y), upgrade (tower_index,),
+target (tower_index, mode), wave (), auto (enabled,), speed (multiplier,).
+Towers are referred to by their index in ``Simulation.towers``.
+"""
+
+
+def apply_command(sim, command):
+    """
+    Apply a command's effect on the simulation.
+
+    Speed commands only change how fast a display plays the game, so they are
+    a no-op here (``Game`` handles them).
+
+    Args:
+        sim: The ``Simulation`` to change
+        command: ``Command`` to apply
+
+    Returns:
+        True if the command changed the game (a placement or upgrade can fail)
+    """
+    kind, args = command.kind, command.args
+    if kind == "place":
+        return sim.place_tower(*args) is not None
+    if kind == "upgrade":
+        return sim.upgrade_tower(sim.towers[args[0]])
+    if kind == "target":
+        sim.set_targeting_mode(sim.towers[args[0]], args[1])
+    elif kind == "wave":
+        sim.spawn_wave()
+    elif kind == "auto":
+        sim.auto_advance = bool(args[0])
+    elif kind != "speed":
+        raise ValueError(f"Unknown command: {kind}")
+    return True
+
+
+def state_hash(sim):
+    """
+    Hash the simulation state, to check that a replay ended where the recording did.
+
+    Numbers that may be stored as int or float (positions, health) are hashed as
+    floats, so equal states hash alike whether or not they went through a save
+    file or the NumPy enemy store.
+
+    Returns:
+        Hex SHA-256 digest of the tick, economy, towers and enemies
+    """
+    state = (
+        sim.tick,
+        sim.wave,
+        sim.lives,
+        sim.money,
+        sim.score,
+        sim.spawn_count,
+        sim.wave_in_progress,
+        sim.auto_advance,
+        tuple((t.tower_type, float(t.x), float(t.y), t.level, t.targeting_mode) for t in sim.towers),
+        tuple((e.spawn_order, float(e.health), float(e.distance), e.slow_timer) for e in sim.enemies),
+        sim.rng.getstate(),
+    )
+    return hashlib.sha256(repr(state).encode()).hexdigest()
+
+
+def check_settings(wave, money, seed):
+    """
+    Raise ValueError if starting settings don't fit in a replay file's header.
+
+    Args:
+        wave: Starting wave (32-bit)
+        money: Starting money (32-bit)
+        seed: Simulation seed (64-bit), or None if the game picks one
+    """
+    if not -2**31 <= wave < 2**31:
+        raise ValueError(f"Recorded games must start at a 32-bit wave, got {wave}")
+    if not -2**31 <= money < 2**31:
+        raise ValueError(f"Recorded games must start with 32-bit money, got {money}")
+    if seed is not None and not -2**63 <= seed < 2**63:
+        raise ValueError(f"Replay seeds must fit in 64 bits, got {seed}")
+
+
+def _encode(command):
+    """Pack a command into its fixed-size binary record."""
+    kind, args = command.kind, command.args
+    small, a, b = 0, 0, 0
+    if kind == "place":
+        small, a, b = _TOWER_TYPES.index(args[0]), args[1], args[2]
+    elif kind == "upgrade":
+        a = args[0]
+    elif kind == "target":
+        small, a = TARGETING_MODES.index(args[1]), args[0]
+    elif kind in ("auto", "speed"):
+        small = int(args[0])
+    return _COMMAND.pack(command.tick, COMMAND_KINDS.index(kind), small, a, b)
+
+
+def _decode(tick, opcode, small, a, b):
+    """Unpack a binary record into a ``Command``."""
+    kind = COMMAND_KINDS[opcode]
+    if kind == "place":
+        args = (_TOWER_TYPES[small], a, b)
+    elif kind == "upgrade":
+        args = (a,)
+    elif kind == "target":
+        args = (a, TARGETING_MODES[small])
+    elif kind == "auto":
+        args = (bool(small),)
+    elif kind == "speed":
+        args = (small,)
+    else:
+        args = ()
+    return Command(tick, kind, args)
+
+
+class Replay:
+    """
+    A recorded game: starting settings plus every command, in order.
+
+    Attributes:
+        wave: Starting wave
+        money: Starting money
+        seed: Simulation seed
+        auto_advance: Whether auto-advance was on at the start
+        commands: List of ``Command`` in the order they were issued
+        end_tick: Tick the recording stopped at
+        final_hash: ``state_hash`` of the game when the recording stopped ("" until finished)
+    """
+
+    def __init__(self, wave, money, seed, auto_advance=False, commands=None, end_tick=0, final_hash=""):
+        """
+        Raises:
+            ValueError: If the starting settings don't fit in a replay file (see ``check_settings``)
+        """
+        check_settings(wave, money, seed)
+        self.wave = wave
+        self.money = money
+        self.seed = seed
+        self.auto_advance = auto_advance
+        self.commands = commands if commands is not None else []
+        self.end_tick = end_tick
+        self.final_hash = final_hash
+
+    @classmethod
+    def start(cls, sim):
+        """Begin recording a game from the current (starting) state of ``sim``."""
+        return cls(sim.initial_wave, sim.initial_money, sim.seed, sim.auto_advance)
+
+    def record(self, command):
+        """Append a command issued during the game."""
+        self.commands.append(command)
+
+    def finish(self, sim):
+        """Stamp the recording with the tick and state it ended on."""
+        self.end_tick = sim.tick
+        self.final_hash = state_hash(sim)
+
+    def new_simulation(self, **kwargs):
+        """Create a simulation in this recording's starting state (extra kwargs go to ``Simulation``)."""
+        sim = Simulation(starting_wave=self.wave, starting_money=self.money, seed=self.seed, **kwargs)
+        sim.auto_advance = self.auto_advance
+        return sim
+
+    def save(self, path):
+        """Write the replay file."""
+        header = _HEADER.pack(
+            MAGIC, VERSION, self.wave, self.money, self.seed, self.auto_advance,
+            self.end_tick, bytes.fromhex(self.final_hash) if self.final_hash else bytes(32),
+        )
+        body = zlib.compress(b"".join(_encode(command) for command in self.commands), 9)
+        with open(path, "wb") as f:
+            f.write(header + body)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a replay file written by ``save``.
+
+        Raises:
+            OSError: If the file can't be read
+            ValueError: If it isn't a replay of this version, or is corrupt or truncated
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path} is not a replay file")
+        magic, version, wave, money, seed, auto_advance, end_tick, digest = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a replay file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version {version} in {path}")
+        try:
+            body = zlib.decompress(data[_HEADER.size:])
+            commands = [_decode(*fields) for fields in _COMMAND.iter_unpack(body)]
+        except (zlib.error, struct.error, IndexError) as error:
+            # Bad compressed data, a cut-off record, or an unknown opcode/type/mode
+            raise ValueError(f"{path} is a corrupt replay file") from error
+        final_hash = digest.hex() if any(digest) else ""
+        return cls(wave, money, seed, bool(auto_advance), commands, end_tick, final_hash)
+
+
+def run_headless(replay, **kwargs):
+    """
+    Replay a recording without a display, as fast as the simulation runs.
+
+    Args:
+        replay: ``Replay`` to play back
+        **kwargs: Extra ``Simulation`` options (e.g. ``numpy_enemies=True``)
+
+    Returns:
+        The simulation, stopped at the recording's end tick
+    """
+    sim = replay.new_simulation(**kwargs)
+    for command in replay.commands:
+        while sim.tick < command.tick:
+            sim.update()
+        apply_command(sim, command)
+    while sim.tick < replay.end_tick:
+        sim.update()
+    return sim
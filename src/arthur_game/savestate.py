@@ -0,0 +1,246 @@
+"""Binary save states.
+
+A save holds everything needed to resume a game on the exact tick it was
+saved: economy and wave counters, the current wave plan, both random streams,
+and every tower, enemy and projectile. The file is a short versioned header followed by a
+zlib-compressed body of fixed-size ``struct`` records, so loading a late-game
+scene takes a few milliseconds.
+
+Saves are taken between ticks, when dead enemies and spent projectiles have
+already been culled. References between entities (a tower's kept target, a
+projectile's target) are stored as indexes into the enemy list.
+"""
+
+import struct
+import zlib
+
+from .enemy import Enemy
+from .enemy_store import ENEMY_TYPE_CODES
+from .projectile import Projectile
+from .simulation import Simulation
+from .towers import TARGETING_MODES, TOWER_CLASSES, create_tower
+from .waves import ARCHETYPE_NAMES, SpawnEntry, WavePlan
+
+MAGIC = b"ATDS"
+VERSION = 3
+_HEADER = struct.Struct("<4sB")
+
+# tick, money, lives, wave, score, kills, spawn_count, spawn_interval, wave_tick,
+# plan_cursor, wave_in_progress, auto_advance, initial_wave, initial_money,
+# seed, has initial_seed, plan wave (-1: no plan), plan length
+_STATE = struct.Struct("<qqiiqqqiqiBBiiqBiI")
+# Wave plan entry: tick, archetype, health, speed, reward
+_SPAWN = struct.Struct("<qBddi")
+# Mersenne Twister state: version, 624 words + position, has gauss_next, gauss_next
+_RNG = struct.Struct("<B625IBd")
+_COUNTS = struct.Struct("<III")
+# type, x, y, level, targeting mode, placed_tick, ready_tick, shot_tick (-1: never),
+# target_scan_tick, target enemy index (-1: none), target_angle, kills
+_TOWER = struct.Struct("<BddBBqqqqidq")
+# type, health, max_health, speed, reward, color, shield, distance, x, y,
+# spawn_order, slow_timer, animation_frame, immune_to_freeze, immune_to_knockback
+_ENEMY = struct.Struct("<BdddiBBBBdddqqqBB")
+# x, y, damage, color, speed, tower_level, tower_type, target enemy index (-1: gone),
+# source tower index (-1: unknown)
+_PROJECTILE = struct.Struct("<dddBBBdBBii")
+
+_TOWER_TYPES = tuple(TOWER_CLASSES)
+_ENEMY_TYPES = {code: name for name, code in ENEMY_TYPE_CODES.items()}
+
+
+def _pack_rng(rng):
+    version, words, gauss_next = rng.getstate()
+    return _RNG.pack(version, *words, gauss_next is not None, gauss_next or 0.0)
+
+
+def _unpack_rng(rng, data, offset):
+    fields = _RNG.unpack_from(data, offset)
+    rng.setstate((fields[0], fields[1:626], fields[627] if fields[626] else None))
+    return offset + _RNG.size
+
+
+def dumps(sim):
+    """
+    Serialize a simulation (between ticks) to bytes.
+
+    Returns:
+        The save file contents
+    """
+    enemy_index = {id(enemy): i for i, enemy in enumerate(sim.enemies)}
+    tower_index = {id(tower): i for i, tower in enumerate(sim.towers)}
+
+    def index_of(enemy):
+        return enemy_index.get(id(enemy), -1) if enemy is not None else -1
+
+    plan = sim.wave_plan
+    parts = [
+        _STATE.pack(
+            sim.tick, sim.money, sim.lives, sim.wave, sim.score, sim.kills, sim.spawn_count,
+            sim.spawn_interval, sim.wave_tick, sim.plan_cursor,
+            sim.wave_in_progress, sim.auto_advance,
+            sim.initial_wave, sim.initial_money, sim.seed, sim.initial_seed is not None,
+            plan.wave if plan is not None else -1, len(plan) if plan is not None else 0,
+        ),
+    ]
+    if plan is not None:
+        parts.extend(
+            _SPAWN.pack(entry.tick, ARCHETYPE_NAMES.index(entry.archetype), entry.health, entry.speed, entry.reward)
+            for entry in plan.entries
+        )
+    parts += [
+        _pack_rng(sim.rng),
+        _pack_rng(sim.fx_rng),
+        _COUNTS.pack(len(sim.towers), len(sim.enemies), len(sim.projectiles)),
+    ]
+    for tower in sim.towers:
+        parts.append(_TOWER.pack(
+            _TOWER_TYPES.index(tower.tower_type), tower.x, tower.y, tower.level,
+            TARGETING_MODES.index(tower.targeting_mode), tower.placed_tick, tower.ready_tick,
+            tower.shot_tick if tower.shot_tick is not None else -1, tower.target_scan_tick,
+            index_of(tower.target), tower.target_angle, tower.kills,
+        ))
+    for enemy in sim.enemies:
+        parts.append(_ENEMY.pack(
+            ENEMY_TYPE_CODES[enemy.enemy_type], enemy.health, enemy.max_health, enemy.speed,
+            enemy.reward, *enemy.color[:3], enemy.shield, enemy.distance, enemy.x, enemy.y,
+            enemy.spawn_order, enemy.slow_timer, enemy.animation_frame,
+            enemy.immune_to_freeze, enemy.immune_to_knockback,
+        ))
+    for projectile in sim.projectiles:
+        parts.append(_PROJECTILE.pack(
+            projectile.x, projectile.y, projectile.damage, *projectile.color[:3],
+            projectile.speed, projectile.tower_level, _TOWER_TYPES.index(projectile.tower_type),
+            index_of(sim.enemy_handles.get(projectile.target_handle)),
+            tower_index.get(id(projectile.source), -1),
+        ))
+    return _HEADER.pack(MAGIC, VERSION) + zlib.compress(b"".join(parts), 1)
+
+
+def loads(data, **kwargs):
+    """
+    Rebuild a simulation from bytes written by ``dumps``.
+
+    Args:
+        data: Save file contents
+        **kwargs: Extra ``Simulation`` options (e.g. ``numpy_enemies=True``)
+
+    Returns:
+        A ``Simulation`` that continues exactly where the saved one left off
+
+    Raises:
+        ValueError: If ``data`` isn't a save of this version, or is corrupt or truncated
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Not a save file")
+    magic, version = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a save file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported save version {version}")
+    try:
+        return _load_body(zlib.decompress(data[_HEADER.size:]), kwargs)
+    except (zlib.error, struct.error, IndexError) as error:
+        # Bad compressed data, records cut short, or codes/indexes out of range
+        raise ValueError("Corrupt save file") from error
+
+
+def _load_body(body, kwargs):
+    """Rebuild the simulation from a decompressed save body (see ``loads``)."""
+    (tick, money, lives, wave, score, kills, spawn_count, spawn_interval, wave_tick,
+     plan_cursor, wave_in_progress, auto_advance, initial_wave, initial_money,
+     seed, has_initial_seed, plan_wave, plan_length) = _STATE.unpack_from(body)
+    sim = Simulation(
+        starting_wave=initial_wave,
+        starting_money=initial_money,
+        seed=seed if has_initial_seed else None,
+        **kwargs,
+    )
+    sim.seed = seed
+    sim.clock.tick = tick
+    sim.money = money
+    sim.lives = lives
+    sim.wave = wave
+    sim.score = score
+    sim.kills = kills
+    sim.spawn_count = spawn_count
+    sim.spawn_interval = spawn_interval
+    sim.wave_tick = wave_tick
+    sim.plan_cursor = plan_cursor
+    sim.wave_in_progress = bool(wave_in_progress)
+    sim.auto_advance = bool(auto_advance)
+
+    offset = _STATE.size
+    if plan_wave >= 0:
+        sim.wave_plan = WavePlan(plan_wave, [
+            SpawnEntry(spawn_tick, ARCHETYPE_NAMES[archetype], health, speed, reward)
+            for spawn_tick, archetype, health, speed, reward
+            in _SPAWN.iter_unpack(body[offset:offset + plan_length * _SPAWN.size])
+        ])
+        offset += plan_length * _SPAWN.size
+
+    offset = _unpack_rng(sim.rng, body, offset)
+    offset = _unpack_rng(sim.fx_rng, body, offset)
+    tower_count, enemy_count, projectile_count = _COUNTS.unpack_from(body, offset)
+    offset += _COUNTS.size
+
+    tower_records = list(_TOWER.iter_unpack(body[offset:offset + tower_count * _TOWER.size]))
+    offset += tower_count * _TOWER.size
+    enemy_records = _ENEMY.iter_unpack(body[offset:offset + enemy_count * _ENEMY.size])
+    offset += enemy_count * _ENEMY.size
+    projectile_records = _PROJECTILE.iter_unpack(body[offset:offset + projectile_count * _PROJECTILE.size])
+
+    enemies = []
+    for (type_code, health, max_health, speed, reward, r, g, b, shield, distance, x, y,
+         spawn_order, slow_timer, animation_frame, immune_to_freeze, immune_to_knockback) in enemy_records:
+        enemy = Enemy(max_health, speed, reward, (r, g, b), _ENEMY_TYPES[type_code], bool(shield))
+        enemy.health = health
+        enemy.distance = distance
+        enemy.x = x
+        enemy.y = y
+        enemy.spawn_order = spawn_order
+        enemy.slow_timer = slow_timer
+        enemy.animation_frame = animation_frame
+        enemy.immune_to_freeze = bool(immune_to_freeze)
+        enemy.immune_to_knockback = bool(immune_to_knockback)
+        enemies.append(sim.insert_enemy(enemy))
+
+    for (type_index, x, y, level, mode, placed_tick, ready_tick, shot_tick,
+         target_scan_tick, target, target_angle, kills) in tower_records:
+        tower = create_tower(_TOWER_TYPES[type_index], x, y)
+        tower.level = level
+        tower.update_stats()
+        tower.targeting_mode = TARGETING_MODES[mode]
+        tower.placed_tick = placed_tick
+        tower.ready_tick = ready_tick
+        tower.shot_tick = shot_tick if shot_tick >= 0 else None
+        tower.target_scan_tick = target_scan_tick
+        tower.target = enemies[target] if target >= 0 else None
+        tower.target_angle = target_angle
+        tower.kills = kills
+        sim.add_tower(tower)
+
+    for (x, y, damage, r, g, b, speed, tower_level, tower_type, target, source) in projectile_records:
+        projectile = Projectile(
+            x, y, enemies[target] if target >= 0 else None, damage, (r, g, b),
+            speed, tower_level, _TOWER_TYPES[tower_type],
+            sim.towers[source] if source >= 0 else None,
+        )
+        sim.projectile_handles.insert(projectile)
+        sim.projectiles.append(projectile)
+
+    # Targeting between ticks reads the progress order; rebuild it like update() does
+    sim.enemy_grid.rebuild(sim.enemies)
+    sim.enemy_progress.refresh()
+    return sim
+
+
+def save_game(sim, path):
+    """Write a save file for ``sim``."""
+    with open(path, "wb") as f:
+        f.write(dumps(sim))
+
+
+def load_game(path, **kwargs):
+    """Load a save file written by ``save_game`` (extra kwargs go to ``Simulation``)."""
+    with open(path, "rb") as f:
+        return loads(f.read(), **kwargs)
@@ -0,0 +1,73 @@
+"""Tick clock and cooldown scheduling for the simulation.
+
+Towers store absolute "ready at tick N" timestamps instead of counting down
+every tick. ``CooldownScheduler`` keeps the cooling towers in a heap keyed by
+that tick, so each update only touches the towers that can actually fire.
+"""
+
+import bisect
+import heapq
+
+
+class TickClock:
+    """
+    Simulation tick counter, shared with the towers so their timers can be derived from it.
+
+    Attributes:
+        tick: Number of updates run so far
+    """
+
+    def __init__(self):
+        self.tick = 0
+
+
+class CooldownScheduler:
+    """
+    Tracks which towers are ready to fire.
+
+    Ready towers stay in a list (in placement order, so shots resolve in the
+    same order as iterating ``Simulation.towers``) until they fire; then they
+    sleep in a heap until their ``ready_tick``.
+    """
+
+    def __init__(self):
+        self._heap = []  # (ready_tick, placement order, tower)
+        self._ready = []  # (placement order, tower), sorted
+        self._order = {}  # tower -> placement order
+        self._count = 0
+
+    def __len__(self):
+        return len(self._order)
+
+    def add(self, tower):
+        """Start tracking a newly placed tower (it is ready to fire immediately)."""
+        order = self._count
+        self._count += 1
+        self._order[tower] = order
+        self._push(tower, order)
+
+    def _push(self, tower, order):
+        """Queue ``tower`` by its ready tick; ``wake`` moves it to the ready list."""
+        heapq.heappush(self._heap, (tower.ready_tick, order, tower))
+
+    def wake(self, tick):
+        """
+        Move every tower whose cooldown has expired by ``tick`` into the ready list.
+
+        Returns:
+            List of ready towers, in placement order
+        """
+        heap = self._heap
+        while heap and heap[0][0] <= tick:
+            _, order, tower = heapq.heappop(heap)
+            bisect.insort(self._ready, (order, tower), key=lambda entry: entry[0])
+        return [tower for _, tower in self._ready]
+
+    def sleep(self, towers):
+        """Move towers that just fired from the ready list back into the heap."""
+        if not towers:
+            return
+        fired = set(towers)
+        self._ready = [entry for entry in self._ready if entry[1] not in fired]
+        for tower in towers:
+            self._push(tower, self._order[tower])
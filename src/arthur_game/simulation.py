@@ -0,0 +1,470 @@
+"""
+Simulation engine for Arthur's Tower Defense.
+
+Holds the game state and rules (spawning, movement, shooting, projectile hits)
+with no dependency on the pygame display, so waves can be stepped headless.
+"""
+
+import math
+import random
+
+from .constants import PATH
+from .enemy_store import EnemyStore
+from .handles import HandleTable
+from .hits import HitBuffer, snapshot
+from .scheduler import CooldownScheduler, TickClock
+from .spatial import SpatialHash
+from . import targeting
+from .targeting import ProgressIndex
+from .towers import TARGETING_MODES, TOWER_CLASSES, create_tower
+from .waves import SPAWN_INTERVAL, compile_wave, make_enemy
+
+
+def random_streams(seed):
+    """
+    Create the simulation and cosmetic random streams for a game.
+
+    Args:
+        seed: Game seed
+
+    Returns:
+        Tuple of (simulation rng, cosmetic rng), independent ``random.Random`` instances
+    """
+    return random.Random(seed), random.Random(f"fx:{seed}")
+
+
+class Simulation:
+    """
+    Display-free game state and update rules.
+
+    The pygame ``Game`` wraps a simulation for rendering and input; tools that only
+    need the rules (balancing runs, regression runs) can drive one directly.
+
+    Attributes:
+        money: Current player money
+        lives: Remaining player lives
+        wave: Current wave number
+        score: Current game score
+        kills: Number of enemies killed so far
+        enemies: List of active enemies (dead ones are culled at the end of each tick)
+        enemy_handles: ``HandleTable`` resolving projectile targets to enemies
+        enemy_grid: Spatial hash of ``enemies`` used for area queries
+        enemy_progress: ``enemies`` ordered by distance along the path, used for targeting
+        towers: List of placed towers
+        projectiles: List of active projectiles
+        projectile_handles: ``HandleTable`` of active projectiles
+        spawn_interval: Ticks between enemy spawns in built-in waves
+        waves: Dict of wave number to ``WavePlan`` replacing built-in waves (e.g. from a data file)
+        wave_plan: ``WavePlan`` of the current (or last) wave, or None before the first wave
+        plan_cursor: Index of the next entry of ``wave_plan`` to spawn
+        wave_tick: Ticks since the current wave started
+        wave_in_progress: Whether a wave is currently active
+        auto_advance: Whether to automatically start next wave
+        initial_money: Starting money, kept for restarts
+        initial_wave: Starting wave, kept for restarts
+        clock: ``TickClock`` counting updates; towers derive their timers from it
+        cooldowns: ``CooldownScheduler`` tracking which towers can fire
+        retarget_interval: Ticks a ready tower keeps a valid target before scanning again
+        hit_buffer: ``HitBuffer`` collecting the tick's hits, or None to resolve each hit at once
+        hit_record: Per-tick state snapshots when recording hits, else None
+        knockbacks: Number of times an enemy was pushed back so far (lets batched
+            hit resolution notice that positions changed under its planned queries)
+        spawn_count: Number of enemies spawned so far (next ``Enemy.spawn_order``)
+        enemy_store: ``EnemyStore`` holding enemy data in NumPy arrays, or None
+        batched_targeting: Whether targets are picked for all towers in one NumPy pass
+        seed: Seed of this game's random streams
+        initial_seed: Seed passed in (None means a fresh one per game), kept for restarts
+        rng: ``random.Random`` for simulation decisions (enemy spawns)
+        fx_rng: Separate ``random.Random`` for cosmetic effects, so drawing never
+            changes the simulation outcome
+    """
+
+    def __init__(
+        self,
+        starting_wave: int = 1,
+        starting_money: int = 200,
+        numpy_enemies: bool = False,
+        batched_targeting: bool = False,
+        retarget_interval: int = 1,
+        batched_hits: bool = False,
+        record_hits: bool = False,
+        seed: int = None,
+        waves: dict = None,
+    ):
+        """
+        Initialize the simulation.
+
+        Args:
+            starting_wave: Initial wave number (default: 1)
+            starting_money: Initial money amount (default: 200)
+            numpy_enemies: Keep enemy data in NumPy arrays and move all enemies in
+                one vectorized pass (requires NumPy; default: False)
+            batched_targeting: Pick every tower's target from one tower x enemy
+                distance matrix instead of per-tower progress index queries
+                (requires NumPy; default: False)
+            retarget_interval: How many ticks a tower that is ready to fire keeps
+                shooting its current target (while it is alive and in range)
+                before scanning again. 1 re-checks the targeting mode on every
+                shot, exactly like scanning every tick (default: 1)
+            batched_hits: Resolve each tick's hits per tower type (default: False)
+            record_hits: Keep a per-tick state snapshot in ``hit_record`` (default: False)
+            seed: Seed for the random streams; the same seed and inputs replay the
+                same game (default: None, pick a random seed)
+            waves: Dict of wave number to ``WavePlan`` used instead of the built-in
+                waves, e.g. from ``waves.load_wave_file`` (default: None)
+        """
+        self.money = starting_money
+        self.lives = 20
+        self.wave = starting_wave
+        self.score = 0
+        self.kills = 0
+        self.clock = TickClock()
+        self.cooldowns = CooldownScheduler()
+
+        # Store initial values for reset
+        self.initial_money = starting_money
+        self.initial_wave = starting_wave
+        self.initial_seed = seed
+
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng, self.fx_rng = random_streams(self.seed)
+
+        self.enemies = []
+        self.enemy_handles = HandleTable()
+        self.towers = []
+        self.projectiles = []
+        self.projectile_handles = HandleTable()
+        self.enemy_grid = SpatialHash()  # Rebuilt every tick after enemies move
+        self.enemy_store = EnemyStore() if numpy_enemies else None
+        self.enemy_progress = ProgressIndex(self.enemy_store)
+        self.spawn_count = 0
+        self.batched_targeting = batched_targeting
+        if batched_targeting:
+            targeting.require_numpy()
+        self.retarget_interval = retarget_interval
+        self.hit_buffer = HitBuffer() if batched_hits else None
+        self.hit_record = [] if record_hits else None
+        self.knockbacks = 0
+
+        self.spawn_interval = SPAWN_INTERVAL
+        self.waves = waves if waves is not None else {}
+        self.wave_plan = None
+        self.plan_cursor = 0
+        self.wave_tick = 0
+        self._next_plan = None  # Cached next_wave_plan()
+        self.wave_in_progress = False
+        self.auto_advance = False
+
+    @property
+    def tick(self):
+        """Number of updates run so far."""
+        return self.clock.tick
+
+    @property
+    def game_over(self):
+        """Whether the player has run out of lives."""
+        return self.lives <= 0
+
+    @property
+    def wave_ready(self):
+        """Whether a new wave can be started right now."""
+        return not self.wave_in_progress and len(self.enemies) == 0
+
+    @property
+    def enemies_to_spawn(self):
+        """Number of enemies left to spawn in the current wave."""
+        if self.wave_plan is None or not self.wave_in_progress:
+            return 0
+        return len(self.wave_plan) - self.plan_cursor
+
+    def _plan_wave(self, rng):
+        """Plan the current wave number, drawing any rolls from ``rng``."""
+        if self.wave in self.waves:
+            return self.waves[self.wave]
+        return compile_wave(self.wave, rng, self.spawn_interval)
+
+    def next_wave_plan(self):
+        """
+        Preview the plan of the wave that ``spawn_wave`` would start next.
+
+        The rolls come from a copy of the simulation rng, so previewing never
+        changes the game; the real wave will match the preview exactly.
+        """
+        if self._next_plan is None or self._next_plan.wave != self.wave:
+            fork = random.Random()
+            fork.setstate(self.rng.getstate())
+            self._next_plan = self._plan_wave(fork)
+        return self._next_plan
+
+    def spawn_wave(self):
+        """Start spawning a new wave of enemies."""
+        if self.wave_ready:
+            self.wave_in_progress = True
+            self.wave_plan = self._plan_wave(self.rng)
+            self._next_plan = None
+            self.plan_cursor = 0
+            self.wave_tick = 0
+            if self.enemy_store is not None:
+                self.enemy_store.reserve(self.enemy_store.count + len(self.wave_plan))
+
+    def can_place_tower(self, x, y):
+        """Check that (x, y) is clear of the path and of other towers."""
+        for px, py in PATH:
+            if math.sqrt((x - px)**2 + (y - py)**2) < 50:
+                return False
+
+        for other_tower in self.towers:
+            if math.sqrt((x - other_tower.x)**2 + (y - other_tower.y)**2) < 40:
+                return False
+
+        return True
+
+    def place_tower(self, tower_type, x, y):
+        """
+        Buy and place a tower if it is affordable and the spot is free.
+
+        Args:
+            tower_type: Key into ``TOWER_CLASSES`` (e.g. "basic", "tesla")
+            x: X position of the tower
+            y: Y position of the tower
+
+        Returns:
+            The placed tower, or None if it could not be placed
+        """
+        tower = create_tower(tower_type, x, y)
+        if self.money < tower.cost or not self.can_place_tower(x, y):
+            return None
+        tower.placed_tick = self.clock.tick
+        self.add_tower(tower)
+        self.money -= tower.cost
+        return tower
+
+    def add_tower(self, tower):
+        """Put a tower on the board without charging for it or checking its spot."""
+        tower.clock = self.clock
+        tower.fx_rng = self.fx_rng
+        self.towers.append(tower)
+        self.cooldowns.add(tower)
+
+    def tower_at(self, x, y, radius=30):
+        """Return the first tower within ``radius`` of (x, y), or None."""
+        for tower in self.towers:
+            if math.sqrt((x - tower.x)**2 + (y - tower.y)**2) < radius:
+                return tower
+        return None
+
+    def upgrade_tower(self, tower):
+        """
+        Buy the next upgrade level for a tower.
+
+        Returns:
+            True if the tower was upgraded, False otherwise
+        """
+        cost = tower.get_upgrade_cost()
+        if cost and self.money >= cost:
+            if tower.upgrade():
+                self.money -= cost
+                return True
+        return False
+
+    def set_targeting_mode(self, tower, mode):
+        """Choose which in-range enemy a tower shoots at (see ``TARGETING_MODES``)."""
+        if mode not in TARGETING_MODES:
+            raise ValueError(f"Unknown targeting mode: {mode}")
+        tower.targeting_mode = mode
+        tower.target = None
+
+    def enemies_near(self, x, y, radius):
+        """Return live enemies within ``radius`` of (x, y), in list order."""
+        return [enemy for enemy in self.enemy_grid.query(x, y, radius) if enemy.alive]
+
+    def add_enemy(self, enemy):
+        """Add a newly spawned enemy to the active list."""
+        enemy.spawn_order = self.spawn_count
+        self.spawn_count += 1
+        return self.insert_enemy(enemy)
+
+    def insert_enemy(self, enemy):
+        """
+        Add an enemy that already has its ``spawn_order`` (e.g. one loaded from a save).
+
+        Returns:
+            The enemy as stored (an ``EnemyView`` when using the NumPy store)
+        """
+        if self.enemy_store is not None:
+            enemy = self.enemy_store.add(enemy)
+        self.enemy_handles.insert(enemy)
+        self.enemies.append(enemy)
+        self.enemy_progress.add(enemy)
+        return enemy
+
+    def damage_enemy(self, enemy, damage):
+        """
+        Damage a live enemy, killing it (and paying its reward) if its health runs out.
+
+        Returns:
+            True if this hit killed the enemy
+        """
+        if enemy.take_damage(damage) and enemy.alive:
+            self.money += enemy.reward
+            self.score += enemy.reward
+            self.kills += 1
+            self._retire_enemy(enemy)
+            return True
+        return False
+
+    def _retire_enemy(self, enemy):
+        """Mark an enemy dead; it stays in ``enemies`` until the end-of-tick cull."""
+        enemy.alive = False
+        if self.enemy_store is not None:
+            self.enemy_store.release(enemy)
+
+    def knock_back(self, enemy, amount):
+        """Push an enemy back along the path and keep the spatial index in sync."""
+        enemy.push_back(amount)
+        self.enemy_grid.move(enemy)
+        self.knockbacks += 1
+
+    def _cull(self):
+        """Drop dead enemies and spent projectiles in one pass and free their handles."""
+        survivors = []
+        if self.enemy_store is not None:
+            # Store slots are in list order; read the flags in one go, not per view
+            flags = self.enemy_store.alive[:self.enemy_store.count].tolist()
+        else:
+            flags = [enemy.alive for enemy in self.enemies]
+        for enemy, alive in zip(self.enemies, flags):
+            if alive:
+                survivors.append(enemy)
+            else:
+                self.enemy_handles.release(enemy.handle)
+        self.enemies = survivors
+        if self.enemy_store is not None:
+            self.enemy_store.compact()
+
+        in_flight = []
+        for projectile in self.projectiles:
+            if projectile.alive:
+                in_flight.append(projectile)
+            else:
+                self.projectile_handles.release(projectile.handle)
+        self.projectiles = in_flight
+
+    def _keeps_target(self, tower):
+        """Whether a tower can keep its current target without scanning again."""
+        target = tower.target
+        return (
+            target is not None
+            and self.tick - tower.target_scan_tick < self.retarget_interval
+            and target.alive
+            and tower.in_range(target)
+        )
+
+    def _batched_targets(self, towers):
+        """Return each tower's target (or None) using one distance-matrix pass."""
+        store = self.enemy_store
+        enemies = self.enemies
+        if store is not None:
+            n = store.count
+            columns = (
+                store.x[:n], store.y[:n], store.distance[:n], store.health[:n], store.speed[:n], store.alive[:n],
+            )
+        else:
+            columns = (
+                [enemy.x for enemy in enemies],
+                [enemy.y for enemy in enemies],
+                [enemy.distance for enemy in enemies],
+                [enemy.health for enemy in enemies],
+                [enemy.speed for enemy in enemies],
+                [enemy.alive for enemy in enemies],
+            )
+        picks = targeting.pick_targets(towers, *columns)
+        return [enemies[i] if i >= 0 else None for i in picks]
+
+    def update(self):
+        """
+        Advance the simulation by one tick.
+
+        This includes:
+        - Spawning enemies in waves
+        - Moving enemies along the path
+        - Updating towers and shooting
+        - Moving and checking projectile hits
+        - Applying special effects based on tower types
+        """
+        self.clock.tick += 1
+
+        # Auto-advance: automatically start next wave
+        if self.auto_advance and self.wave_ready:
+            self.spawn_wave()
+
+        # Spawn wave
+        if self.wave_in_progress:
+            self.wave_tick += 1
+            entries = self.wave_plan.entries
+            while self.plan_cursor < len(entries) and entries[self.plan_cursor].tick <= self.wave_tick:
+                self.add_enemy(make_enemy(entries[self.plan_cursor]))
+                self.plan_cursor += 1
+
+            if self.plan_cursor == len(entries) and len(self.enemies) == 0:
+                self.wave_in_progress = False
+                self.wave += 1
+                self.money += 50  # Wave completion bonus
+
+        # Move enemies
+        if self.enemy_store is not None:
+            store = self.enemy_store
+            # Escaped enemies come back already marked dead
+            self.lives -= len(store.advance())
+            # Store slots are in list order (both are compacted at the end of each tick)
+            self.enemy_grid.rebuild(self.enemies, store.x[:store.count].tolist(), store.y[:store.count].tolist())
+        else:
+            for enemy in self.enemies:
+                if enemy.move():
+                    self.lives -= 1
+                    self._retire_enemy(enemy)
+            self.enemy_grid.rebuild(self.enemies)
+        self.enemy_progress.refresh()
+
+        # Only towers that can fire this tick look for a target
+        ready = self.cooldowns.wake(self.tick)
+        rescan = [tower for tower in ready if not self._keeps_target(tower)]
+        if self.batched_targeting:
+            found = self._batched_targets(rescan)
+        else:
+            found = [self.enemy_progress.select(tower) for tower in rescan]
+        for tower, target in zip(rescan, found):
+            tower.target = target
+            tower.target_scan_tick = self.tick
+
+        # Shoot
+        fired = []
+        for tower in ready:
+            if tower.target:
+                projectile = tower.shoot(tower.target)
+                if projectile:
+                    self.projectile_handles.insert(projectile)
+                    self.projectiles.append(projectile)
+                    fired.append(tower)
+        self.cooldowns.sleep(fired)
+
+        # Move projectiles and check hits; each tower class applies its own effects.
+        # Hits that move enemies are applied at once even when buffering, since the
+        # projectiles after them steer by where the enemies are now
+        for projectile in self.projectiles:
+            target = self.enemy_handles.get(projectile.target_handle)
+            if projectile.move(target):
+                projectile.alive = False
+                if target is None or not target.alive:
+                    continue
+                tower_class = TOWER_CLASSES[projectile.tower_type]
+                if self.hit_buffer is not None and not tower_class.moves_enemies:
+                    self.hit_buffer.add(projectile, target)
+                else:
+                    tower_class.apply_hit(self, projectile, target)
+        if self.hit_buffer is not None:
+            self.hit_buffer.resolve(self, TOWER_CLASSES)
+
+        self._cull()
+        if self.hit_record is not None:
+            self.hit_record.append(snapshot(self))
@@ -0,0 +1,412 @@
+"""Tower placement solver.
+
+``arthur-game solve`` searches for a strong layout (towers, starting levels,
+targeting modes and an upgrade order) for a budget and wave range, and writes
+it as a layout file that ``simulate`` and the game (``--layout``) can use.
+
+The search is a genetic algorithm. Each candidate is a list of tower genes
+(a ``TowerSpec`` plus the waves its upgrades are bought on); new candidates
+come from crossing two tournament winners and mutating the child (move a
+tower to a nearby spot, change its type, level or mode, add or drop towers
+and upgrades), then repairing it to legal, affordable placements. Towers only
+go on spots clear of the path that can reach it (see ``placement.candidate_spots``).
+
+Candidates are scored by playing them headless through the wave range on a
+fixed set of seeds, in parallel on a ``ProcessPoolExecutor``. Two things keep
+the search fast:
+
+- Every score is cached by the layout's canonical form, so a candidate that
+  reappears (elites, repeated crossovers) is never played again.
+- A run stops early once even a perfect finish could no longer beat the
+  worst member of the elite, the score a candidate needs to survive.
+
+A score counts cleared waves first, then lives kept, then money left unspent
+by the layout (see ``score_run``).
+"""
+
+import random
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .batch import parse_wave_range, run_layout
+from .economy import money_by_wave
+from .layout import Layout, TowerSpec, UpgradeStep
+from .placement import TOWER_SPACING, candidate_spots
+from .towers import TARGETING_MODES, TOWER_CLASSES
+
+# Highest level a tower can be upgraded to
+MAX_LEVEL = 3
+
+# Weights of the score terms; each outranks everything below it
+WAVE_WEIGHT = 1000
+LIFE_WEIGHT = 10
+STARTING_LIVES = 20
+
+TowerGene = namedtuple("TowerGene", ["spec", "upgrade_waves"])
+TowerGene.__doc__ = "One tower of a candidate: its ``TowerSpec`` and the waves its upgrades are bought on."
+
+Evaluation = namedtuple("Evaluation", ["score", "cut"])
+Evaluation.__doc__ = """
+Result of playing a candidate.
+
+``score`` is the mean per-seed score, or for a ``cut`` run an upper bound on it
+that was already too low to matter.
+"""
+
+
+def genes_cost(genes):
+    """Money needed to place every gene's tower at its starting level."""
+    return Layout([gene.spec for gene in genes]).cost()
+
+
+def to_layout(genes):
+    """Turn a candidate into a ``Layout``; upgrades are ordered by wave, then tower."""
+    towers = [gene.spec for gene in genes]
+    steps = sorted(
+        (wave, index) for index, gene in enumerate(genes) for wave in gene.upgrade_waves
+    )
+    return Layout(towers, [UpgradeStep(wave, index) for wave, index in steps])
+
+
+def from_layout(layout):
+    """Turn a ``Layout`` into a candidate (the inverse of ``to_layout``)."""
+    waves = [[] for _ in layout.towers]
+    for step in layout.upgrades:
+        waves[step.tower].append(step.wave)
+    return [TowerGene(spec, tuple(sorted(w))) for spec, w in zip(layout.towers, waves)]
+
+
+def canonical(genes):
+    """Cache key of a candidate: the same towers and upgrades in any order give the same key."""
+    return tuple(sorted(genes))
+
+
+def score_run(sim, start_wave, end_wave, layout_cost, budget):
+    """
+    Score one finished (or stopped) run.
+
+    Cleared waves count most, then lives kept; money the layout leaves unspent
+    breaks ties between otherwise equal layouts.
+
+    Args:
+        sim: The simulation after the run
+        start_wave: First wave played
+        end_wave: Last wave played
+        layout_cost: ``Layout.cost()`` of the candidate
+        budget: Starting money
+    """
+    cleared = min(sim.wave, end_wave + 1) - start_wave
+    return cleared * WAVE_WEIGHT + sim.lives * LIFE_WEIGHT + _savings(layout_cost, budget)
+
+
+def _savings(layout_cost, budget):
+    """Tie-break term: the share of the budget left unspent, in [0, 1)."""
+    return (budget - layout_cost) / (budget + 1)
+
+
+def _best_possible(sim, end_wave, start_wave, savings):
+    """Upper bound on a run's score from this point: every remaining wave cleared, no lives lost."""
+    return (end_wave + 1 - start_wave) * WAVE_WEIGHT + sim.lives * LIFE_WEIGHT + savings
+
+
+def evaluate(layout_data, start_wave, end_wave, seeds, budget, threshold=None):
+    """
+    Play a candidate on every seed and average its scores (runs in worker processes).
+
+    Args:
+        layout_data: ``Layout.to_dict()`` of the candidate
+        start_wave: First wave to play
+        end_wave: Last wave to play
+        seeds: Seeds to play, in order
+        budget: Starting money
+        threshold: Mean score the candidate must reach to be useful; once that
+            is out of reach the evaluation stops (default: play everything)
+
+    Returns:
+        ``Evaluation``
+    """
+    layout = Layout.from_dict(layout_data)
+    savings = _savings(layout.cost(), budget)
+    best_per_seed = (end_wave + 1 - start_wave) * WAVE_WEIGHT + STARTING_LIVES * LIFE_WEIGHT + savings
+    needed = None if threshold is None else threshold * len(seeds)
+    total = 0.0
+
+    for index, seed in enumerate(seeds):
+        remaining = len(seeds) - index - 1
+
+        def hopeless(sim):
+            return total + _best_possible(sim, end_wave, start_wave, savings) + remaining * best_per_seed < needed
+
+        sim, _ = run_layout(
+            layout, start_wave, end_wave, seed, budget, stop=hopeless if needed is not None else None
+        )
+        if not sim.game_over and sim.wave <= end_wave:
+            # Stopped early: report the bound that ruled the candidate out
+            bound = total + _best_possible(sim, end_wave, start_wave, savings) + remaining * best_per_seed
+            return Evaluation(bound / len(seeds), True)
+        total += score_run(sim, start_wave, end_wave, layout.cost(), budget)
+        if needed is not None and total + remaining * best_per_seed < needed:
+            return Evaluation((total + remaining * best_per_seed) / len(seeds), True)
+    return Evaluation(total / len(seeds), False)
+
+
+class Solver:
+    """
+    Genetic search for a tower layout.
+
+    Attributes:
+        start_wave: First wave of the range
+        end_wave: Last wave of the range
+        budget: Money available for the layout's starting placements
+        seeds: Seeds every candidate is played on (the same for all, so scores compare fairly)
+        population_size: Candidates per generation
+        elite: Best candidates carried over unchanged each generation
+        rng: ``random.Random`` driving the search
+        spots: Legal tower spots (``candidate_spots``)
+        cache: Canonical candidate -> ``Evaluation``
+        evaluated: Number of candidates actually played
+        cut: How many of those were stopped early
+    """
+
+    def __init__(
+        self,
+        start_wave,
+        end_wave,
+        budget=None,
+        seeds=3,
+        population_size=24,
+        elite=4,
+        tower_types=None,
+        rng=None,
+    ):
+        """
+        Set up a search.
+
+        Args:
+            start_wave: First wave of the range
+            end_wave: Last wave of the range
+            budget: Money for the starting placements (default: calibrated money for ``start_wave``)
+            seeds: Number of seeds each candidate is played on (default: 3)
+            population_size: Candidates per generation (default: 24)
+            elite: Best candidates kept each generation (default: 4)
+            tower_types: Tower types to consider (default: all)
+            rng: ``random.Random`` for the search (default: a new unseeded one)
+        """
+        self.start_wave = start_wave
+        self.end_wave = end_wave
+        self.budget = money_by_wave(start_wave) if budget is None else budget
+        self.seeds = list(range(seeds))
+        self.population_size = population_size
+        self.elite = min(elite, population_size)
+        self.tower_types = list(tower_types or TOWER_CLASSES)
+        self.rng = rng if rng is not None else random.Random()
+        self.spots = candidate_spots()
+        self.cache = {}
+        self.evaluated = 0
+        self.cut = 0
+
+    # Building and changing candidates
+
+    def _random_spec(self):
+        """A level-1 tower of a random type and mode on a random spot."""
+        x, y = self.rng.choice(self.spots)
+        return TowerSpec(self.rng.choice(self.tower_types), x, y, 1, self.rng.choice(TARGETING_MODES))
+
+    def _random_waves(self, spec):
+        """Random upgrade waves for a tower, at most up to ``MAX_LEVEL``."""
+        count = self.rng.randint(0, MAX_LEVEL - spec.level)
+        return tuple(sorted(self.rng.randint(self.start_wave, self.end_wave) for _ in range(count)))
+
+    def random_candidate(self):
+        """Towers on random spots until a placement no longer fits the budget."""
+        genes = []
+        for _ in range(len(self.tower_types) * 4):
+            spec = self._random_spec()
+            if genes_cost(genes) + TOWER_CLASSES[spec.tower_type].cost > self.budget:
+                continue
+            genes.append(TowerGene(spec, self._random_waves(spec)))
+        return self.repair(genes)
+
+    def repair(self, genes):
+        """
+        Make a candidate legal: towers in order, dropping any too close to an
+        earlier one, and dropping towers from the end until it fits the budget.
+        """
+        kept = []
+        for gene in genes:
+            spec = gene.spec
+            if all((spec.x - other.spec.x)**2 + (spec.y - other.spec.y)**2 >= TOWER_SPACING**2 for other in kept):
+                upgrades = tuple(sorted(gene.upgrade_waves))[:MAX_LEVEL - spec.level]
+                kept.append(TowerGene(spec, upgrades))
+        while kept and genes_cost(kept) > self.budget:
+            kept.pop()
+        return kept
+
+    def crossover(self, first, second):
+        """A child taking each tower from one parent or the other, interleaved."""
+        child = [gene for gene in first if self.rng.random() < 0.5]
+        child += [gene for gene in second if self.rng.random() < 0.5]
+        self.rng.shuffle(child)
+        return child
+
+    def _nearby_spot(self, x, y):
+        """A legal spot close to (x, y)."""
+        near = [spot for spot in self.spots if abs(spot[0] - x) <= 60 and abs(spot[1] - y) <= 60]
+        return self.rng.choice(near or self.spots)
+
+    def mutate(self, genes):
+        """Apply one random change to a copy of a candidate."""
+        genes = list(genes)
+        choice = self.rng.random()
+        if not genes or choice < 0.15:
+            genes.append(TowerGene(self._random_spec(), ()))
+            return genes
+        index = self.rng.randrange(len(genes))
+        spec, waves = genes[index]
+        if choice < 0.25:
+            del genes[index]
+        elif choice < 0.45:
+            x, y = self._nearby_spot(spec.x, spec.y)
+            spec = spec._replace(x=x, y=y)
+        elif choice < 0.6:
+            spec = spec._replace(tower_type=self.rng.choice(self.tower_types))
+        elif choice < 0.7:
+            spec = spec._replace(level=self.rng.randint(1, MAX_LEVEL))
+        elif choice < 0.8:
+            spec = spec._replace(mode=self.rng.choice(TARGETING_MODES))
+        else:
+            waves = self._random_waves(spec)
+        if choice >= 0.25:
+            genes[index] = TowerGene(spec, waves)
+        return genes
+
+    # Scoring
+
+    def threshold(self, scored):
+        """Score a new candidate must beat to matter: the worst of the current elite."""
+        if len(scored) < self.elite:
+            return None
+        return sorted((evaluation.score for evaluation, _ in scored), reverse=True)[self.elite - 1]
+
+    def score(self, candidates, pool, threshold):
+        """
+        Score candidates, playing only those not in the cache.
+
+        Args:
+            candidates: List of candidates
+            pool: ``ProcessPoolExecutor``, or None to play them in this process
+            threshold: Passed on to ``evaluate`` for early cutoff
+
+        Returns:
+            List of (``Evaluation``, candidate), parallel to ``candidates``
+        """
+        pending = {}
+        for genes in candidates:
+            key = canonical(genes)
+            if key not in self.cache and key not in pending:
+                pending[key] = to_layout(genes).to_dict()
+
+        args = (self.start_wave, self.end_wave, self.seeds, self.budget, threshold)
+        if pool is None:
+            results = {key: evaluate(data, *args) for key, data in pending.items()}
+        else:
+            futures = {key: pool.submit(evaluate, data, *args) for key, data in pending.items()}
+            results = {key: future.result() for key, future in futures.items()}
+        for evaluation in results.values():
+            self.evaluated += 1
+            self.cut += evaluation.cut
+        self.cache.update(results)
+        return [(self.cache[canonical(genes)], genes) for genes in candidates]
+
+    def _tournament(self, scored, size=3):
+        """Pick the best of a few random scored candidates."""
+        return max(self.rng.sample(scored, min(size, len(scored))), key=lambda item: item[0].score)[1]
+
+    def run(self, generations=20, jobs=None, initial=None, on_generation=None):
+        """
+        Run the search.
+
+        Args:
+            generations: Generations to breed after the first
+            jobs: Worker processes (default: CPU count); 1 plays candidates in this process
+            initial: Optional candidates (e.g. ``from_layout`` of an existing layout) to seed the
+                first generation with
+            on_generation: Called with (generation, best ``Evaluation``, best candidate) after each
+                generation is scored
+
+        Returns:
+            Tuple of (best ``Evaluation``, best candidate as a ``Layout``)
+        """
+        population = [self.repair(genes) for genes in (initial or [])]
+        while len(population) < self.population_size:
+            population.append(self.random_candidate())
+
+        pool = None if jobs == 1 else ProcessPoolExecutor(max_workers=jobs)
+        try:
+            scored = self.score(population, pool, None)
+            for generation in range(generations + 1):
+                scored.sort(key=lambda item: item[0].score, reverse=True)
+                if on_generation is not None:
+                    on_generation(generation, *scored[0])
+                if generation == generations:
+                    break
+                elite = scored[:self.elite]
+                children = []
+                while len(children) < self.population_size - len(elite):
+                    child = self.crossover(self._tournament(scored), self._tournament(scored))
+                    children.append(self.repair(self.mutate(child)))
+                scored = elite + self.score(children, pool, self.threshold(scored))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        best_evaluation, best = max(scored, key=lambda item: item[0].score)
+        return best_evaluation, to_layout(best)
+
+
+def solve_main(args):
+    """Run the ``solve`` subcommand with parsed ``args``."""
+    try:
+        start_wave, end_wave = parse_wave_range(args.waves)
+        if args.jobs is not None and args.jobs < 1:
+            raise ValueError(f"--jobs must be at least 1, got {args.jobs}")
+        tower_types = args.towers.split(",") if args.towers else None
+        for tower_type in tower_types or ():
+            if tower_type not in TOWER_CLASSES:
+                raise ValueError(f"Unknown tower type: {tower_type}")
+        initial = [from_layout(Layout.load(args.start))] if args.start else None
+    except (OSError, ValueError, KeyError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+
+    solver = Solver(
+        start_wave,
+        end_wave,
+        budget=args.money,
+        seeds=args.seeds,
+        population_size=args.population,
+        elite=args.elite,
+        tower_types=tower_types,
+        rng=random.Random(args.search_seed),
+    )
+    start = time.perf_counter()
+
+    def report(generation, evaluation, genes):
+        seconds = time.perf_counter() - start
+        print(
+            f"generation {generation}: best {evaluation.score:.1f} with {len(genes)} towers "
+            f"(${genes_cost(genes)} of ${solver.budget}); {solver.evaluated} played, "
+            f"{solver.cut} cut early, {solver.evaluated / seconds:.1f} candidates/s",
+            file=sys.stderr,
+        )
+
+    evaluation, layout = solver.run(args.generations, args.jobs, initial, on_generation=report)
+    layout.save(args.output)
+    print(
+        f"Wrote {args.output}: {len(layout.towers)} towers, {len(layout.upgrades)} upgrades, "
+        f"score {evaluation.score:.1f} on waves {start_wave}-{end_wave}",
+        file=sys.stderr,
+    )
+    return 0
@@ -0,0 +1,112 @@
+"""Uniform-grid spatial hash for radius queries over enemies."""
+
+from .constants import TILE_SIZE
+
+
+class SpatialHash:
+    """
+    Buckets entities with ``x``/``y`` attributes into square grid cells.
+
+    Radius queries only look at the cells overlapping the query circle, so their
+    cost depends on how crowded that area is rather than on the total number of
+    entities. Results come back in the order the entities were given to
+    ``rebuild`` (i.e. list order), so "first enemy" rules are unchanged.
+
+    Positions are snapshotted at ``rebuild``; anything that moves an entity
+    mid-tick must call ``move`` so queries see the new position.
+
+    Attributes:
+        cell_size: Width and height of a grid cell in pixels
+    """
+
+    def __init__(self, cell_size=TILE_SIZE * 2):
+        self.cell_size = cell_size
+        self._cells = {}  # cell key -> list of [entity, x, y] entries
+        self._entry = {}  # entity -> its [entity, x, y] entry
+        self._rank = {}  # entity -> position in the list given to rebuild()
+
+    def _key(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def rebuild(self, entities, xs=None, ys=None):
+        """
+        Re-bucket all entities from scratch (call once per tick after movement).
+
+        Args:
+            entities: Entities to index, in list order
+            xs: Optional sequence of x positions parallel to ``entities``; lets
+                array-backed callers skip per-entity attribute lookups
+            ys: Optional sequence of y positions parallel to ``entities``
+        """
+        if xs is None:
+            xs = [entity.x for entity in entities]
+            ys = [entity.y for entity in entities]
+        size = self.cell_size
+        self._cells = cells = {}
+        self._entry = entry_of = {}
+        for entity, x, y in zip(entities, xs, ys):
+            entry = [entity, x, y]
+            key = (int(x // size), int(y // size))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [entry]
+            else:
+                bucket.append(entry)
+            entry_of[entity] = entry
+        self._rank = dict(zip(entities, range(len(entities))))
+
+    def remove(self, entity):
+        """Drop an entity from the index."""
+        entry = self._entry.pop(entity, None)
+        if entry is not None:
+            self._cells[self._key(entry[1], entry[2])].remove(entry)
+            del self._rank[entity]
+
+    def move(self, entity):
+        """Update the indexed position of an entity that moved since the last rebuild."""
+        entry = self._entry.get(entity)
+        if entry is None:
+            return
+        old_key = self._key(entry[1], entry[2])
+        entry[1] = entity.x
+        entry[2] = entity.y
+        key = self._key(entry[1], entry[2])
+        if key != old_key:
+            self._cells[old_key].remove(entry)
+            self._cells.setdefault(key, []).append(entry)
+
+    def _candidates(self, x, y, radius):
+        """Yield entities within ``radius`` of (x, y), in no particular order."""
+        cells = self._cells
+        size = self.cell_size
+        radius_sq = radius * radius
+        min_cx = int((x - radius) // size)
+        max_cx = int((x + radius) // size)
+        min_cy = int((y - radius) // size)
+        max_cy = int((y + radius) // size)
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for entity, ex, ey in bucket:
+                    if (ex - x)**2 + (ey - y)**2 <= radius_sq:
+                        yield entity
+
+    def query(self, x, y, radius):
+        """Return all entities within ``radius`` of (x, y), in list order."""
+        found = list(self._candidates(x, y, radius))
+        found.sort(key=self._rank.__getitem__)
+        return found
+
+    def first_within(self, x, y, radius):
+        """Return the earliest entity (in list order) within ``radius`` of (x, y), or None."""
+        rank = self._rank
+        best = None
+        best_rank = None
+        for entity in self._candidates(x, y, radius):
+            entity_rank = rank[entity]
+            if best is None or entity_rank < best_rank:
+                best = entity
+                best_rank = entity_rank
+        return best
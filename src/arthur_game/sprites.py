@@ -0,0 +1,123 @@
+"""Pre-rendered sprites and animation frames.
+
+Enemies and towers, whose looks depend only on a few attributes and an
+animation tick, are drawn once onto transparent sprites that are then
+blitted every frame after that. Sprites are baked lazily, the first time
+each one is shown, and kept for the rest of the process.
+
+Sprites use premultiplied alpha: translucent layers (glows, auras, shields)
+are composited onto the sprite with ``blend``, and the finished sprite is
+blitted with ``BLEND_PREMULTIPLIED``, which puts it on the screen exactly as
+drawing its layers there one by one would.
+
+Translucent circle overlays (tower ranges, the placement preview) are cached
+per look by ``circle_overlay`` and blitted with ordinary alpha blending.
+"""
+
+import pygame
+
+# Animation ticks after which the baked frames repeat. The enemy animations use
+# sin/cos of the tick times 0.05-0.15 radians, so 628 ticks (about 2 * pi / 0.01)
+# holds a whole number of their cycles and the loop joins up smoothly. The alien
+# king's energy rings don't fit and use their own period (enemy.RING_PERIOD).
+ANIMATION_PERIOD = 628
+
+# Circle overlays, keyed by (radius, color, alpha, outline alpha); see circle_overlay
+_CIRCLE_OVERLAYS = {}
+
+
+def blend(target, surface, position):
+    """
+    Composite a translucent (straight alpha) surface onto ``target``.
+
+    Works on opaque targets such as the screen and on sprites being baked.
+    """
+    target.blit(surface.premul_alpha(), position, special_flags=pygame.BLEND_PREMULTIPLIED)
+
+
+def bake(draw, half_size):
+    """
+    Draw a sprite once and crop it to its visible pixels.
+
+    Args:
+        draw: ``draw(surface, x, y)`` drawing the look centered on (x, y)
+        half_size: Half the width and height of the canvas it is drawn on
+
+    Returns:
+        Tuple of (surface, (dx, dy)); (dx, dy) is the sprite's top-left corner
+        relative to its center
+    """
+    half_size = int(half_size)
+    canvas = pygame.Surface((half_size * 2, half_size * 2), pygame.SRCALPHA)
+    draw(canvas, half_size, half_size)
+    bounds = canvas.get_bounding_rect()
+    if bounds.width == 0:
+        bounds = pygame.Rect(0, 0, 1, 1)
+    return canvas.subsurface(bounds).copy(), (bounds.x - half_size, bounds.y - half_size)
+
+
+def blit(screen, sprite, x, y):
+    """Draw a baked ``(surface, (dx, dy))`` sprite centered on (x, y)."""
+    surface, (dx, dy) = sprite
+    screen.blit(surface, (int(x) + dx, int(y) + dy), special_flags=pygame.BLEND_PREMULTIPLIED)
+
+
+class SpriteSheet:
+    """
+    Lazily baked animation frames of one look.
+
+    Attributes:
+        draw: ``draw(surface, x, y, tick)`` drawing the look centered on (x, y)
+            as it appears on animation ``tick``
+        half_size: Half the width and height of the canvas a frame is drawn on;
+            frames are cropped to what was actually drawn
+        step: Animation ticks each baked frame stands for
+        frames: List of (surface, (dx, dy)) or None for frames not baked yet;
+            (dx, dy) is the frame's top-left corner relative to the center
+    """
+
+    def __init__(self, draw, half_size, step=2, period=ANIMATION_PERIOD):
+        self.draw = draw
+        self.half_size = int(half_size)
+        self.step = step
+        self.frames = [None] * (period // step)
+
+    def frame(self, tick):
+        """Return (surface, (dx, dy)) for animation ``tick``, baking it if needed."""
+        index = (tick // self.step) % len(self.frames)
+        frame = self.frames[index]
+        if frame is None:
+            tick = index * self.step
+            frame = self.frames[index] = bake(lambda surface, x, y: self.draw(surface, x, y, tick), self.half_size)
+        return frame
+
+    def blit(self, screen, x, y, tick):
+        """Draw the frame for ``tick`` centered on (x, y)."""
+        blit(screen, self.frame(tick), x, y)
+
+
+def circle_overlay(radius, color, alpha, outline_alpha=None):
+    """
+    Translucent disc of ``radius``, drawn once per look.
+
+    Blit it at (x - radius, y - radius) to center it on (x, y).
+
+    Args:
+        radius: Circle radius in pixels (rounded down)
+        color: RGB color
+        alpha: Opacity of the disc, 0-255
+        outline_alpha: Opacity of a 2 pixel outline, or None for no outline
+
+    Returns:
+        The cached (straight alpha) surface; don't draw on it
+    """
+    radius = int(radius)
+    key = (radius, tuple(color), alpha, outline_alpha)
+    surface = _CIRCLE_OVERLAYS.get(key)
+    if surface is None:
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (*color, alpha), (radius, radius), radius)
+        if outline_alpha is not None:
+            pygame.draw.circle(surface, (*color, outline_alpha), (radius, radius), radius, 2)
+        _CIRCLE_OVERLAYS[key] = surface
+    return surface
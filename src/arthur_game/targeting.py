@@ -0,0 +1,200 @@
+"""Target selection helpers shared by the simulation.
+
+``ProgressIndex`` keeps enemies ordered by how far along the path they are, so a
+tower's pick becomes a range query over the path intervals its range covers.
+``pick_targets`` is the batched alternative: it computes the tower x enemy
+squared-distance matrix in one NumPy operation and picks each tower's target
+from its row. Both follow ``Tower.target_key``. NumPy is optional, so the
+progress index stays the default for the pygbag build.
+"""
+
+import bisect
+from operator import attrgetter
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+_distance = attrgetter("distance")
+
+# Path intervals are widened by this much so float error at the edge of a
+# tower's range never drops an enemy; Tower.in_range makes the exact call
+_INTERVAL_SLACK = 1e-6
+
+
+def require_numpy():
+    """Raise ImportError if batched targeting cannot be used."""
+    if np is None:
+        raise ImportError("Batched targeting requires NumPy (pip install numpy)")
+
+
+class ProgressIndex:
+    """
+    Enemies sorted by distance travelled along the path.
+
+    ``refresh`` re-sorts after movement (dropping dead enemies), which is when
+    towers pick targets. Enemies rarely overtake each other, so the list is
+    almost always already sorted and the (adaptive) re-sort is a single linear
+    pass. Mid-tick changes such as knockbacks are picked up by the next refresh.
+
+    With an ``EnemyStore``, ``refresh`` sorts the store's arrays instead, since
+    reading every ``EnemyView`` property goes through NumPy one value at a time.
+    """
+
+    def __init__(self, store=None):
+        """
+        Args:
+            store: ``EnemyStore`` whose views are the enemies, or None for plain enemies
+        """
+        self._store = store
+        self._order = []
+        self._keys = []
+
+    def __len__(self):
+        return len(self._order)
+
+    def add(self, enemy):
+        """Track a newly spawned enemy (placed by the next ``refresh``)."""
+        self._order.append(enemy)
+
+    def refresh(self):
+        """Drop dead enemies and restore sorted order after every enemy has moved."""
+        store = self._store
+        if store is not None:
+            n = store.count
+            slots = np.flatnonzero(store.alive[:n])
+            distances = store.distance[slots]
+            order = np.argsort(distances, kind="stable")
+            views = store.views
+            self._order = [views[slot] for slot in slots[order].tolist()]
+            self._keys = distances[order].tolist()
+            return
+        self._order = [enemy for enemy in self._order if enemy.alive]
+        self._order.sort(key=_distance)
+        self._keys = [enemy.distance for enemy in self._order]
+
+    def in_range(self, tower):
+        """Yield (lo, hi) index ranges of the enemies inside each of the tower's path intervals."""
+        keys = self._keys
+        for start, end in tower.path_intervals:
+            lo = bisect.bisect_left(keys, start - _INTERVAL_SLACK)
+            hi = bisect.bisect_right(keys, end + _INTERVAL_SLACK, lo)
+            if lo < hi:
+                yield lo, hi
+
+    def select(self, tower):
+        """Return the target for ``tower`` according to its targeting mode, or None."""
+        order = self._order
+        mode = tower.targeting_mode
+        if mode == "first":
+            # Furthest along is at the top of the last non-empty interval
+            for lo, hi in reversed(list(self.in_range(tower))):
+                for index in range(hi - 1, lo - 1, -1):
+                    if tower.in_range(order[index]):
+                        return self._earliest_tied(tower, index, lo - 1, -1)
+            return None
+        if mode == "last":
+            for lo, hi in self.in_range(tower):
+                for index in range(lo, hi):
+                    if tower.in_range(order[index]):
+                        return self._earliest_tied(tower, index, hi, 1)
+            return None
+
+        best = None
+        best_key = None
+        key = tower.target_key
+        for lo, hi in self.in_range(tower):
+            for enemy in order[lo:hi]:
+                if not tower.in_range(enemy):
+                    continue
+                enemy_key = key(enemy)
+                if best is None or enemy_key > best_key:
+                    best = enemy
+                    best_key = enemy_key
+        return best
+
+    def _earliest_tied(self, tower, index, stop, step):
+        """Return the earliest-spawned in-range enemy at the same distance as ``order[index]``."""
+        order = self._order
+        keys = self._keys
+        best = order[index]
+        other = index + step
+        while other != stop and keys[other] == keys[index]:
+            enemy = order[other]
+            if enemy.spawn_order < best.spawn_order and tower.in_range(enemy):
+                best = enemy
+            other += step
+        return best
+
+
+def _scores(mode, dist_sq, distances, healths, speeds):
+    """Per-enemy score matrix for a mode (higher is better), shaped like ``dist_sq``."""
+    if mode == "first":
+        row = distances
+    elif mode == "last":
+        row = -distances
+    elif mode == "strongest":
+        row = healths
+    elif mode == "weakest":
+        row = -healths
+    elif mode == "fastest":
+        row = speeds
+    else:  # closest
+        return -dist_sq
+    return np.broadcast_to(row, dist_sq.shape)
+
+
+def pick_targets(towers, enemy_xs, enemy_ys, distances, healths, speeds, alive=None):
+    """
+    Pick every tower's target in one batched pass.
+
+    Args:
+        towers: List of towers
+        enemy_xs: Enemy x positions, in list order
+        enemy_ys: Enemy y positions, in list order
+        distances: Enemy distances along the path, in list order
+        healths: Enemy health values, in list order
+        speeds: Enemy speeds, in list order
+        alive: Optional alive flags, in list order; dead enemies are never picked
+
+    Returns:
+        List with one entry per tower: the index of its target in the enemy
+        list, or -1 if no enemy is in range
+    """
+    if not towers:
+        return []
+    if len(enemy_xs) == 0:
+        return [-1] * len(towers)
+    enemy_xs = np.asarray(enemy_xs, dtype="float64")
+    enemy_ys = np.asarray(enemy_ys, dtype="float64")
+    distances = np.asarray(distances, dtype="float64")
+    healths = np.asarray(healths, dtype="float64")
+    speeds = np.asarray(speeds, dtype="float64")
+
+    count = len(towers)
+    tower_xs = np.fromiter((tower.x for tower in towers), dtype="float64", count=count)
+    tower_ys = np.fromiter((tower.y for tower in towers), dtype="float64", count=count)
+    ranges = np.fromiter((tower.range for tower in towers), dtype="float64", count=count)
+
+    dist_sq = (tower_xs[:, None] - enemy_xs[None, :])**2
+    dist_sq += (tower_ys[:, None] - enemy_ys[None, :])**2
+    in_range = dist_sq <= (ranges * ranges)[:, None]
+    if alive is not None:
+        in_range &= np.asarray(alive, dtype=bool)[None, :]
+
+    picks = np.full(count, -1)
+    modes = [tower.targeting_mode for tower in towers]
+    for mode in set(modes):
+        rows = np.array([i for i, m in enumerate(modes) if m == mode])
+        mask = in_range[rows]
+        scores = np.where(mask, _scores(mode, dist_sq[rows], distances, healths, speeds), -np.inf)
+        best = scores.max(axis=1, keepdims=True)
+        # Ties go to the enemy furthest along the path, then to the one that
+        # spawned first (i.e. earliest in list order), as in Tower.target_key
+        tied = mask & (scores == best)
+        tied_distances = np.where(tied, distances, -np.inf)
+        choice = (tied_distances == tied_distances.max(axis=1, keepdims=True)).argmax(axis=1)
+        has_target = mask.any(axis=1)
+        picks[rows[has_target]] = choice[has_target]
+    return picks.tolist()
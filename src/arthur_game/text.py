@@ -0,0 +1,118 @@
+"""Shared fonts and cached text rendering.
+
+Loading a font and rendering text are slow next to blitting, and the HUD and
+tower labels show the same few strings frame after frame. ``get_font`` hands
+out one ``Font`` per (name, size) for the whole process, ``render_text`` keeps
+recently rendered strings in an LRU cache, and ``draw_counter`` draws numbers
+that change often (money, lives, wave) from a ``GlyphAtlas`` of pre-rendered
+digits, so a new value costs a few blits instead of a render.
+
+Everything here needs ``pygame.font`` initialized, and stays valid until
+pygame is shut down.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+# Rendered strings kept by render_text; the HUD shows well under a hundred at once
+TEXT_CACHE_SIZE = 512
+# Characters in a counter's glyph atlas
+DIGITS = "0123456789-"
+
+# Fonts keyed by (name, size); see get_font
+_FONTS = {}
+# Rendered text keyed by (font, text, color), least recently used first
+_TEXT_CACHE = OrderedDict()
+# Glyph atlases keyed by (font, color); see draw_counter
+_ATLASES = {}
+
+
+def get_font(size, name=None):
+    """
+    Return the shared font of ``size`` (loading it on first use).
+
+    Args:
+        size: Font size in pixels
+        name: Font file, or None for pygame's default font
+    """
+    key = (name, size)
+    font = _FONTS.get(key)
+    if font is None:
+        font = _FONTS[key] = pygame.font.Font(name, size)
+    return font
+
+
+def render_text(font, text, color):
+    """
+    Antialiased ``font.render(text, True, color)``, cached.
+
+    The returned surface is shared; blit it but don't draw on it.
+    """
+    key = (font, text, tuple(color))
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        surface = _TEXT_CACHE[key] = font.render(text, True, color)
+        if len(_TEXT_CACHE) > TEXT_CACHE_SIZE:
+            _TEXT_CACHE.popitem(last=False)
+    else:
+        _TEXT_CACHE.move_to_end(key)
+    return surface
+
+
+class GlyphAtlas:
+    """
+    Characters of one font and color, rendered once and drawn glyph by glyph.
+
+    Glyphs are placed at whole-pixel advances, so a number can sit up to a
+    pixel off from where rendering the whole string would put it; in exchange
+    digits keep their places as the value changes.
+
+    Attributes:
+        glyphs: Dict of character -> rendered surface
+        advances: Dict of character -> pixels from its left edge to the next glyph's
+    """
+
+    def __init__(self, font, color, characters=DIGITS):
+        self.glyphs = {char: font.render(char, True, color) for char in characters}
+        self.advances = {char: metrics[4] for char, metrics in zip(characters, font.metrics(characters))}
+
+    def draw(self, screen, text, position):
+        """
+        Draw ``text`` (made of atlas characters) with its top-left corner at ``position``.
+
+        Returns:
+            The x coordinate just past the last glyph
+        """
+        x, y = position
+        for char in text:
+            screen.blit(self.glyphs[char], (x, y))
+            x += self.advances[char]
+        return x
+
+
+def draw_counter(screen, font, label, value, color, position):
+    """
+    Draw ``label`` followed by the integer ``value``, e.g. ("Lives: ", 17).
+
+    The label comes from ``render_text`` and the digits from the font's glyph
+    atlas for ``color``.
+
+    Args:
+        screen: Surface to draw on
+        font: Font from ``get_font``
+        label: Text before the number (may be empty)
+        value: Integer to show
+        color: RGB color
+        position: Top-left corner (x, y)
+    """
+    x, y = position
+    if label:
+        label_surface = render_text(font, label, color)
+        screen.blit(label_surface, (x, y))
+        x += label_surface.get_width()
+    key = (font, tuple(color))
+    atlas = _ATLASES.get(key)
+    if atlas is None:
+        atlas = _ATLASES[key] = GlyphAtlas(font, color)
+    atlas.draw(screen, str(value), (x, y))
@@ -0,0 +1,143 @@
+"""Fixed-timestep scheduling for the game loop.
+
+The simulation always advances in ticks of ``1 / FPS`` game seconds.
+``FixedTimestep`` turns the real time that passed between frames (scaled by
+the game speed) into a whole number of ticks, so a slow frame is caught up on
+the next one instead of slowing the game down.
+"""
+
+import time
+
+from .constants import FPS
+
+# Most real time (seconds) a frame may try to catch up on; anything beyond is dropped
+MAX_CATCH_UP_SECONDS = 0.25
+# Renders skipped in a row before one is forced, so the screen never freezes
+MAX_SKIPPED_RENDERS = 5
+# Most real time (seconds) one frame spends on updates before handling input again
+MAX_UPDATE_SECONDS = 0.1
+
+
+class FixedTimestep:
+    """
+    Accumulates real time and hands out simulation ticks.
+
+    Attributes:
+        tick_rate: Simulation ticks per game second
+        max_catch_up: Real seconds of backlog kept before time is dropped
+        accumulator: Game seconds not yet turned into ticks
+        dropped_ticks: Total ticks dropped by the catch-up cap
+        skipped_renders: Total renders skipped because updates fell behind
+        last_lag_frame: ``frames`` value when lag was last detected, or None
+        frames: Number of frames seen so far
+    """
+
+    def __init__(self, tick_rate=FPS, max_catch_up=MAX_CATCH_UP_SECONDS, max_skipped_renders=MAX_SKIPPED_RENDERS):
+        self.tick_rate = tick_rate
+        self.max_catch_up = max_catch_up
+        self.max_skipped_renders = max_skipped_renders
+        self.accumulator = 0.0
+        self.dropped_ticks = 0
+        self.skipped_renders = 0
+        self.last_lag_frame = None
+        self.frames = 0
+        self._skipped_in_a_row = 0
+
+    def reset(self):
+        """Forget any accumulated backlog (e.g. after a pause or speed change)."""
+        self.accumulator = 0.0
+
+    def advance(self, elapsed, speed):
+        """
+        Add a frame's worth of real time and return how many ticks to run.
+
+        Args:
+            elapsed: Real seconds since the previous frame
+            speed: Game speed multiplier
+
+        Returns:
+            Number of simulation ticks to run this frame
+        """
+        self.frames += 1
+        tick_seconds = 1 / self.tick_rate
+        self.accumulator += elapsed * speed
+
+        limit = self.max_catch_up * speed
+        if self.accumulator > limit:
+            self.dropped_ticks += int((self.accumulator - limit) / tick_seconds)
+            self.accumulator = limit
+            self.last_lag_frame = self.frames
+
+        ticks = int(self.accumulator / tick_seconds)
+        self.accumulator -= ticks * tick_seconds
+        return ticks
+
+    def run(self, ticks, update, done=lambda: False):
+        """
+        Run up to ``ticks`` updates within ``MAX_UPDATE_SECONDS`` of real time.
+
+        Args:
+            ticks: Ticks handed out by ``advance``
+            update: Callable advancing the simulation by one tick
+            done: Callable returning True when updates should stop (e.g. game over)
+
+        Returns:
+            Real seconds spent updating
+        """
+        start = time.perf_counter()
+        for ran in range(ticks):
+            if done():
+                break
+            if time.perf_counter() - start > MAX_UPDATE_SECONDS:
+                self.give_back(ticks - ran)
+                break
+            update()
+        return time.perf_counter() - start
+
+    def run_for(self, seconds, update, done=lambda: False):
+        """
+        Run updates back to back for ``seconds`` of real time (turbo mode).
+
+        Args:
+            seconds: Real time budget for this frame
+            update: Callable advancing the simulation by one tick
+            done: Callable returning True when updates should stop
+
+        Returns:
+            Number of ticks run
+        """
+        deadline = time.perf_counter() + seconds
+        ticks = 0
+        while not done() and time.perf_counter() < deadline:
+            update()
+            ticks += 1
+        return ticks
+
+    def give_back(self, ticks):
+        """Return ticks a frame ran out of time for; they are retried (or dropped) next frame."""
+        self.accumulator += ticks / self.tick_rate
+
+    def should_render(self, update_seconds):
+        """
+        Decide whether to draw this frame.
+
+        Args:
+            update_seconds: Real time the frame's updates took
+
+        Returns:
+            False if the updates alone used up the frame budget (so drawing
+            would put the game further behind), unless too many renders in a
+            row have already been skipped
+        """
+        if update_seconds > 1 / self.tick_rate and self._skipped_in_a_row < self.max_skipped_renders:
+            self._skipped_in_a_row += 1
+            self.skipped_renders += 1
+            self.last_lag_frame = self.frames
+            return False
+        self._skipped_in_a_row = 0
+        return True
+
+    @property
+    def lagging(self):
+        """Whether ticks were dropped or renders skipped within the last second of frames."""
+        return self.last_lag_frame is not None and self.frames - self.last_lag_frame < self.tick_rate
@@ -13,6 +13,7 @@ from .constants import (
     NEON_GREEN, STEEL_BLUE
 )
 from .projectile import Projectile
+from .text import get_font, render_text
 
 
 class Tower:
@@ -525,6 +526,5 @@ class Tower:
         # Draw level indicator
         if self.level > 1:
             star_text = "★" * self.level
-            font = pygame.font.Font(None, 16)
-            level_surf = font.render(star_text, True, YELLOW)
+            level_surf = render_text(get_font(16), star_text, YELLOW)
             screen.blit(level_surf, (int(self.x - 12), int(self.y + 22)))
@@ -1,6 +1,6 @@
 """Tower classes for Arthur's Tower Defense game."""
 
-from .base import Tower
+from .base import Tower, TARGETING_MODES
 from .laser_tower import LaserTower
 from .freeze_tower import FreezeTower
 from .sniper_tower import SniperTower
@@ -33,6 +33,7 @@ def create_tower(tower_type, x, y):
 
 __all__ = [
     "Tower",
+    "TARGETING_MODES",
     "LaserTower",
     "FreezeTower",
     "SniperTower",
@@ -2,8 +2,24 @@
 
 import pygame
 import math
+import random
 from ..constants import WHITE, BLACK, GRAY, YELLOW
+from ..hits import clustered_candidates, planned_query
+from ..path import intervals_within
 from ..projectile import Projectile
+from ..scheduler import TickClock
+from ..sprites import bake, blit, circle_overlay
+from ..text import get_font, render_text
+
+# Which in-range enemy a tower shoots at; "first" is the enemy furthest along the path
+TARGETING_MODES = ("first", "last", "strongest", "weakest", "closest", "fastest")
+
+# Half the canvas size tower layers are baked on (cropped afterwards)
+LAYER_HALF_SIZE = 80
+# Baked tower layers, keyed by (tower class, level, layer, state); see Tower.draw
+_LAYER_SPRITES = {}
+# Level glows, keyed by (size, color)
+_GLOW_SPRITES = {}
 
 
 class Tower:
@@ -18,17 +34,32 @@ class Tower:
     base_fire_rate = 30
     cost = 50
     projectile_color = YELLOW
+    shoot_flash_ticks = 8  # How long the muzzle flash shows after a shot
+    moves_enemies = False  # Whether hits push enemies along the path (never buffered, see Simulation.update)
+    bob_scale = 1.0  # How much of the idle bob the body follows (heavy towers bob less)
+    layers = ("body",)  # Cached layers, drawn in order around draw_live (see draw)
 
     def __init__(self, x, y):
         self.x = x
         self.y = y
         self.level = 1
         self.target_angle = 0
+        self.targeting_mode = "first"
+        self.target = None  # Kept between scans, see Simulation.retarget_interval
+        self.target_scan_tick = 0
+        self.kills = 0  # Enemies killed by this tower's hits (direct and area effects)
         self.update_stats()
-        self.cooldown = 0
         self.size = 22
-        self.animation_frame = 0
-        self.shoot_flash = 0
+        # Timers are absolute ticks on the simulation clock (which replaces this
+        # one when the tower is placed); cooldown, animation_frame and
+        # shoot_flash are derived from them
+        self.clock = TickClock()
+        self.placed_tick = 0
+        self.ready_tick = 0
+        self.shot_tick = None
+        # Random source for cosmetic effects only; placing the tower swaps in the
+        # simulation's fx_rng so effects are reproducible per game
+        self.fx_rng = random
 
     def update_stats(self):
         """Update tower stats based on current level."""
@@ -36,6 +67,7 @@ class Tower:
         self.range = self.base_range * level_multiplier
         self.damage = self.base_damage * level_multiplier
         self.fire_rate = self.base_fire_rate
+        self._path_intervals = None  # Range changed, recompute lazily
 
     def get_upgrade_cost(self):
         """Calculate the cost to upgrade this tower."""
@@ -51,40 +83,176 @@ class Tower:
             return True
         return False
 
-    def find_target(self, enemies):
-        """Find the first enemy within range."""
-        for enemy in enemies:
-            dist = math.sqrt((enemy.x - self.x)**2 + (enemy.y - self.y)**2)
-            if dist <= self.range:
-                return enemy
+    @property
+    def path_intervals(self):
+        """Stretches of path (as distance intervals) covered by this tower's range."""
+        if self._path_intervals is None:
+            self._path_intervals = intervals_within(self.x, self.y, self.range)
+        return self._path_intervals
+
+    def in_range(self, enemy):
+        """Whether ``enemy`` is within this tower's range."""
+        return (enemy.x - self.x)**2 + (enemy.y - self.y)**2 <= self.range * self.range
+
+    def target_key(self, enemy):
+        """
+        Sort key for target selection: the in-range enemy with the largest key is shot.
+
+        Ties go to the enemy furthest along the path, then to the one that
+        spawned first.
+        """
+        mode = self.targeting_mode
+        if mode == "first":
+            return (enemy.distance, -enemy.spawn_order)
+        if mode == "last":
+            return (-enemy.distance, -enemy.spawn_order)
+        if mode == "strongest":
+            primary = enemy.health
+        elif mode == "weakest":
+            primary = -enemy.health
+        elif mode == "fastest":
+            primary = enemy.speed
+        else:  # closest
+            primary = -((enemy.x - self.x)**2 + (enemy.y - self.y)**2)
+        return (primary, enemy.distance, -enemy.spawn_order)
+
+    def find_target(self, enemies, grid=None):
+        """
+        Find the in-range enemy to shoot according to ``targeting_mode``.
+
+        Args:
+            enemies: List of active enemies
+            grid: Optional ``SpatialHash`` of the same enemies; when given, only
+                the grid cells overlapping the tower's range are examined
+        """
+        if grid is not None:
+            candidates = grid.query(self.x, self.y, self.range)
+        else:
+            candidates = [enemy for enemy in enemies if self.in_range(enemy)]
+        if not candidates:
+            return None
+        return max(candidates, key=self.target_key)
+
+    @property
+    def cooldown(self):
+        """Ticks left until the tower can fire again (0 when ready)."""
+        return max(0, self.ready_tick - self.clock.tick)
+
+    @property
+    def animation_frame(self):
+        """Ticks since the tower was placed, for idle animations."""
+        return self.clock.tick - self.placed_tick
+
+    @property
+    def shoot_flash(self):
+        """Ticks of muzzle flash left (0 when not flashing)."""
+        if self.shot_tick is None:
+            return 0
+        return max(0, self.shoot_flash_ticks - (self.clock.tick - self.shot_tick))
+
+    @classmethod
+    def apply_hit(cls, sim, projectile, target, nearby=None):
+        """
+        Resolve a projectile of this tower type hitting a live enemy.
+
+        Deals the direct damage, then applies the tower's special effect.
+
+        Args:
+            sim: The ``Simulation`` being updated
+            projectile: The projectile that hit
+            target: The enemy it hit
+            nearby: Area query ``nearby(x, y, radius)`` for the effect to use
+                (default: ``sim.enemies_near``)
+
+        Returns:
+            True if the direct hit killed the target
+        """
+        kills_before = sim.kills
+        killed = sim.damage_enemy(target, projectile.damage)
+        cls.on_hit(sim, projectile, target, killed, nearby or sim.enemies_near)
+        if projectile.source is not None:
+            projectile.source.kills += sim.kills - kills_before
+        return killed
+
+    @classmethod
+    def apply_hits(cls, sim, hits):
+        """
+        Resolve a batch of (projectile, target) hits from towers of this type, in order.
+
+        Area effects that land close together share one spatial query (see
+        ``hits.clustered_candidates``) instead of querying once per hit. The
+        shared candidates are gathered before any hit is applied, so once a hit
+        in the batch has knocked an enemy back, later area effects query
+        ``sim.enemies_near`` directly and see it where it landed.
+        """
+        impacts = []
+        planned = []
+        for projectile, target in hits:
+            radius = cls.area_radius(projectile)
+            if radius is None:
+                planned.append(None)
+            else:
+                planned.append(len(impacts))
+                impacts.append((*cls.area_center(projectile, target), radius))
+        candidates = clustered_candidates(sim, impacts) if impacts else []
+        knockbacks = sim.knockbacks
+
+        for (projectile, target), index in zip(hits, planned):
+            if not target.alive:
+                continue
+            if not projectile.reaches(target):
+                # Knocked away by an earlier hit this tick; keep chasing it
+                projectile.alive = True
+                continue
+            nearby = None
+            if index is not None and sim.knockbacks == knockbacks:
+                nearby = planned_query(sim, impacts[index], candidates[index])
+            cls.apply_hit(sim, projectile, target, nearby)
+
+    @classmethod
+    def area_radius(cls, projectile):
+        """Radius of the area this hit's effect looks at, or None if it has none."""
         return None
 
+    @classmethod
+    def area_center(cls, projectile, target):
+        """Where this hit's area effect will be centred (the target, by default)."""
+        return target.x, target.y
+
+    @classmethod
+    def on_hit(cls, sim, projectile, target, killed, nearby):
+        """
+        Special effect applied after a direct hit (none by default).
+
+        Args:
+            sim: The ``Simulation`` being updated
+            projectile: The projectile that hit
+            target: The enemy it hit (may have just died)
+            killed: Whether the direct hit killed ``target``
+            nearby: ``nearby(x, y, radius)`` returns the live enemies in that
+                circle, in list order
+        """
+
     def shoot(self, target):
         """Create and return a projectile aimed at the target. Returns None if on cooldown."""
-        if self.cooldown <= 0:
+        now = self.clock.tick
+        if now >= self.ready_tick:
             # Reset cooldown
-            self.cooldown = self.fire_rate
+            self.ready_tick = now + self.fire_rate
 
             # Calculate angle to target (for rotating turrets)
             dx = target.x - self.x
             dy = target.y - self.y
             self.target_angle = math.atan2(dy, dx)
 
-            self.shoot_flash = 8
+            self.shot_tick = now
             return Projectile(
                 self.x, self.y, target, self.damage,
-                self.projectile_color, tower_level=self.level, tower_type=self.tower_type
+                self.projectile_color, tower_level=self.level, tower_type=self.tower_type,
+                source=self,
             )
         return None
 
-    def update(self):
-        """Update tower cooldown and animation."""
-        if self.cooldown > 0:
-            self.cooldown -= 1
-        self.animation_frame += 1
-        if self.shoot_flash > 0:
-            self.shoot_flash -= 1
-
     def draw_barrel_lines(self, screen, start_x, start_y, end_x, end_y, color, base_width=4):
         """Draw multiple parallel lines for barrel based on tower level."""
         if self.level == 1:
@@ -115,20 +283,85 @@ class Tower:
                            (start_x - perp_x, start_y - perp_y),
                            (end_x - perp_x, end_y - perp_y), base_width)
 
-    def draw(self, screen):
-        """Draw the tower. Override in subclasses for unique visuals."""
-        # Base animation
+    def draw(self, screen, show_range=True):
+        """
+        Draw the tower, with its translucent range disc unless ``show_range`` is False.
+
+        Everything that only changes with the level and a little animation
+        state comes from cached sprites: the level glow, then the "body" layer,
+        then (if the tower has one) the "top" layer. Parts that follow the aim,
+        such as barrels and beams, are drawn live by ``draw_live`` between the
+        two. Subclasses give their look through ``draw_layer``, ``layer_state``
+        and ``draw_live``.
+        """
+        if show_range:
+            self.draw_range(screen)
+
+        # Idle bob animation (subtle up-down movement)
         bob_offset = math.sin(self.animation_frame * 0.1) * 2
-        y_pos = self.y + bob_offset
-        base_color = GRAY
+        if self.level > 1:
+            self.draw_glow(screen, self.y + bob_offset)
+
+        y_pos = self.y + bob_offset * self.bob_scale
+        self.blit_layer(screen, "body", y_pos)
+        self.draw_live(screen, y_pos)
+        if "top" in self.layers:
+            self.blit_layer(screen, "top", y_pos)
+
+        self.draw_level(screen)
+
+    def draw_range(self, screen):
+        """Draw the translucent range circle."""
+        range_surface = circle_overlay(self.range, self.color, 30)
+        screen.blit(range_surface, (int(self.x - self.range), int(self.y - self.range)))
+
+    def draw_glow(self, screen, y):
+        """Draw the glow of an upgraded tower (white at level 2, yellow at level 3) centered on (x, y)."""
+        level_glow = (255, 255, 100) if self.level == 3 else (200, 200, 200)
+        glow_surface = _GLOW_SPRITES.get((self.size, level_glow))
+        if glow_surface is None:
+            glow_surface = pygame.Surface((self.size * 4, self.size * 4), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surface, (*level_glow, 40),
+                             (self.size * 2, self.size * 2), self.size * 2)
+            _GLOW_SPRITES[(self.size, level_glow)] = glow_surface
+        screen.blit(glow_surface, (int(self.x - self.size * 2), int(y - self.size * 2)))
+
+    def blit_layer(self, screen, layer, y):
+        """Draw a cached layer centered on (x, y), baking it on first use."""
+        state = self.layer_state(layer)
+        key = (type(self), self.level, layer, state)
+        sprite = _LAYER_SPRITES.get(key)
+        if sprite is None:
+            sprite = _LAYER_SPRITES[key] = bake(
+                lambda surface, x, y: self.draw_layer(surface, layer, x, y, state), LAYER_HALF_SIZE
+            )
+        blit(screen, sprite, self.x, y)
+
+    def layer_state(self, layer):
+        """
+        What else besides the class and level a layer's look depends on right now.
+
+        Must be hashable and take few distinct values (e.g. whether the muzzle
+        flash shows, or an animation phase rounded to a few steps), since each
+        value is baked into its own sprite.
+        """
+        return None
+
+    def draw_layer(self, surface, layer, x, y, state):
+        """
+        Draw one cached layer centered on (x, y), as ``layer_state`` returned ``state``.
+
+        Only called when the sprite is baked, so it can be as detailed as it likes.
+        """
+        pygame.draw.circle(surface, self.color, (int(x), int(y)), self.size)
+        pygame.draw.circle(surface, WHITE, (int(x), int(y)), self.size, 2)
 
-        # Simple circle representation (override in subclasses)
-        pygame.draw.circle(screen, self.color, (int(self.x), int(y_pos)), self.size)
-        pygame.draw.circle(screen, WHITE, (int(self.x), int(y_pos)), self.size, 2)
+    def draw_live(self, screen, y_pos):
+        """Draw the parts that follow the aim (barrels, beams, flashes), between the body and top layers."""
 
-        # Draw level indicator
+    def draw_level(self, screen):
+        """Draw the level stars under an upgraded tower."""
         if self.level > 1:
             star_text = "★" * self.level
-            font = pygame.font.Font(None, 16)
-            level_surf = font.render(star_text, True, YELLOW)
+            level_surf = render_text(get_font(16), star_text, YELLOW)
             screen.blit(level_surf, (int(self.x - 12), int(self.y + 22)))
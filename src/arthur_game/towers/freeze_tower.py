@@ -18,58 +18,49 @@ class FreezeTower(Tower):
     cost = 75
     projectile_color = CYAN
 
-    def draw(self, screen):
-        """Draw the freeze tower with hexagonal mech design."""
-        # Draw range circle (semi-transparent)
-        range_surface = pygame.Surface((int(self.range * 2), int(self.range * 2)), pygame.SRCALPHA)
-        pygame.draw.circle(range_surface, (*self.color, 30),
-                          (int(self.range), int(self.range)), int(self.range))
-        screen.blit(range_surface, (int(self.x - self.range), int(self.y - self.range)))
+    @classmethod
+    def area_radius(cls, projectile):
+        """Level 3 freezes everything within 100 pixels of the target."""
+        return 100 if projectile.tower_level == 3 else None
 
-        base_color = (self.color[0]//2, self.color[1]//2, self.color[2]//2)
-        level_glow = (255, 255, 100) if self.level == 3 else (200, 200, 200) if self.level == 2 else None
-
-        # Idle bob animation (subtle up-down movement)
-        bob_offset = math.sin(self.animation_frame * 0.1) * 2
+    @classmethod
+    def on_hit(cls, sim, projectile, target, killed, nearby):
+        """Slow the target; level 3 also slows everything around it."""
+        target.slow(90)
+        # Level 3: Area freeze
+        if projectile.tower_level == 3:
+            for enemy in nearby(target.x, target.y, 100):
+                enemy.slow(60)
 
-        # Draw level 3 glow
-        if level_glow:
-            glow_surface = pygame.Surface((self.size * 4, self.size * 4), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (*level_glow, 40),
-                             (self.size * 2, self.size * 2), self.size * 2)
-            screen.blit(glow_surface, (int(self.x - self.size * 2), int(self.y + bob_offset - self.size * 2)))
+    def layer_state(self, layer):
+        """The emitter crystals glow while the shot flash shows."""
+        return self.shoot_flash > 0
 
-        # Freeze mech - hexagonal with freeze emitters
-        y_pos = self.y + bob_offset
+    def draw_layer(self, surface, layer, x, y, flashing):
+        """Hexagonal mech with three freeze emitters."""
+        base_color = (self.color[0]//2, self.color[1]//2, self.color[2]//2)
         # Base
-        pygame.draw.circle(screen, base_color, (int(self.x), int(y_pos + 8)), 10)
+        pygame.draw.circle(surface, base_color, (int(x), int(y + 8)), 10)
         # Body - hexagon (cartoon style with rounded edges)
         body_size = self.size + (self.level * 2)
-        pygame.draw.circle(screen, self.color, (int(self.x), int(y_pos)), body_size + 2)
+        pygame.draw.circle(surface, self.color, (int(x), int(y)), body_size + 2)
         points = []
         for i in range(6):
             angle = i * math.pi / 3
-            px = self.x + body_size * math.cos(angle)
-            py = y_pos + body_size * math.sin(angle)
+            px = x + body_size * math.cos(angle)
+            py = y + body_size * math.sin(angle)
             points.append((px, py))
-        pygame.draw.polygon(screen, self.color, points)
-        pygame.draw.polygon(screen, WHITE, points, 2)
+        pygame.draw.polygon(surface, self.color, points)
+        pygame.draw.polygon(surface, WHITE, points, 2)
         # Freeze emitters (3 crystals with glow)
         for i in range(3):
             angle = i * (2 * math.pi / 3)
-            crystal_x = self.x + (body_size + 8) * math.cos(angle)
-            crystal_y = y_pos + (body_size + 8) * math.sin(angle)
+            crystal_x = x + (body_size + 8) * math.cos(angle)
+            crystal_y = y + (body_size + 8) * math.sin(angle)
             # Glow effect
-            if self.shoot_flash > 0:
-                pygame.draw.circle(screen, WHITE, (int(crystal_x), int(crystal_y)), 7)
-            pygame.draw.circle(screen, CYAN, (int(crystal_x), int(crystal_y)), 5)
-            pygame.draw.circle(screen, WHITE, (int(crystal_x), int(crystal_y)), 2)
+            if flashing:
+                pygame.draw.circle(surface, WHITE, (int(crystal_x), int(crystal_y)), 7)
+            pygame.draw.circle(surface, CYAN, (int(crystal_x), int(crystal_y)), 5)
+            pygame.draw.circle(surface, WHITE, (int(crystal_x), int(crystal_y)), 2)
         # Cartoon face
-        pygame.draw.circle(screen, WHITE, (int(self.x), int(y_pos)), 4)
-
-        # Draw level indicator
-        if self.level > 1:
-            star_text = "★" * self.level
-            font = pygame.font.Font(None, 16)
-            level_surf = font.render(star_text, True, YELLOW)
-            screen.blit(level_surf, (int(self.x - 12), int(self.y + 22)))
+        pygame.draw.circle(surface, WHITE, (int(x), int(y)), 4)
@@ -4,6 +4,12 @@ import pygame
 import math
 from .base import Tower
 from ..constants import WHITE, YELLOW
+from ..path import point_at
+
+# Ring turn per animation tick
+RING_SPEED = 0.05
+# Cached ring positions between two turns where the rings look the same
+RING_STEPS = 64
 
 
 class QuantumTower(Tower):
@@ -17,46 +23,73 @@ class QuantumTower(Tower):
     base_fire_rate = 100
     cost = 750
     projectile_color = (255, 235, 100)
+    bob_scale = 1.5  # More dramatic floating
+    layers = ("body", "top")
+    knockback_distance = 300  # Pixels a hit target is pushed back along the path
+    area_knockback_distance = 150  # Level 3: push-back for nearby enemies
+    moves_enemies = True
+
+    @classmethod
+    def area_radius(cls, projectile):
+        """Level 3 pushes back enemies within 80 pixels of the target."""
+        return 80 if projectile.tower_level == 3 else None
 
-    def draw(self, screen):
-        """Draw the quantum tower with floating sphere and rings."""
-        # Draw range circle (semi-transparent)
-        range_surface = pygame.Surface((int(self.range * 2), int(self.range * 2)), pygame.SRCALPHA)
-        pygame.draw.circle(range_surface, (*self.color, 30),
-                          (int(self.range), int(self.range)), int(self.range))
-        screen.blit(range_surface, (int(self.x - self.range), int(self.y - self.range)))
+    @classmethod
+    def area_center(cls, projectile, target):
+        """The area push-back is centred where the target lands after its own knockback."""
+        if target.immune_to_knockback:
+            return target.x, target.y
+        return point_at(max(0.0, target.distance - cls.knockback_distance))
 
-        base_color = (self.color[0]//2, self.color[1]//2, self.color[2]//2)
-        level_glow = (255, 255, 100) if self.level == 3 else (200, 200, 200) if self.level == 2 else None
+    @classmethod
+    def on_hit(cls, sim, projectile, target, killed, nearby):
+        """Teleport the target back along the path; level 3 also pushes back enemies nearby."""
+        # Push enemy back on the path (unless immune to knockback)
+        if not target.immune_to_knockback:
+            sim.knock_back(target, cls.knockback_distance)
+        # Level 3: Area teleport
+        if projectile.tower_level == 3:
+            for enemy in nearby(target.x, target.y, 80):
+                if enemy != target and not enemy.immune_to_knockback:
+                    sim.knock_back(enemy, cls.area_knockback_distance)
 
-        # Idle bob animation (subtle up-down movement)
-        bob_offset = math.sin(self.animation_frame * 0.1) * 2
+    def layer_state(self, layer):
+        """The rings' turn (rounded to ``RING_STEPS`` steps) for the body, the core pulse size for the top."""
+        if layer == "top":
+            core_pulse = abs(math.sin(self.animation_frame * 0.1))
+            return int(8 * (0.5 + core_pulse * 0.5))
+        # The rings look the same again after turning by pi
+        turn = (self.animation_frame * RING_SPEED) / math.pi
+        return int(round(turn * RING_STEPS)) % RING_STEPS
 
-        # Draw level 3 glow
-        if level_glow:
-            glow_surface = pygame.Surface((self.size * 4, self.size * 4), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (*level_glow, 40),
-                             (self.size * 2, self.size * 2), self.size * 2)
-            screen.blit(glow_surface, (int(self.x - self.size * 2), int(self.y + bob_offset - self.size * 2)))
+    def draw_layer(self, surface, layer, x, y, state):
+        """Floating golden sphere with rings; the glowing core goes on top."""
+        if layer == "top":
+            # Glowing core (golden)
+            core_size = state
+            pygame.draw.circle(surface, WHITE, (int(x), int(y)), core_size)
+            pygame.draw.circle(surface, (255, 235, 100), (int(x), int(y)), core_size - 2)
+            return
 
-        # Quantum disruptor - floating golden sphere with rings
-        y_pos = self.y + bob_offset * 1.5  # More dramatic floating
         # Quantum rings (rotating) - golden
         body_size = self.size + (self.level * 3)
+        ring_turn = state / RING_STEPS * math.pi
         for i in range(3):
-            ring_angle = self.animation_frame * 0.05 + i * math.pi / 3
+            ring_angle = ring_turn + i * math.pi / 3
             ring_radius = body_size + 8 + i * 4
             # Draw ring as ellipse for 3D effect
             for angle_step in range(0, 360, 30):
                 angle = math.radians(angle_step)
-                x1 = self.x + ring_radius * math.cos(angle) * math.cos(ring_angle)
-                y1 = y_pos + ring_radius * math.sin(angle) * 0.3
-                pygame.draw.circle(screen, (200, 150, 0), (int(x1), int(y1)), 2)
+                x1 = x + ring_radius * math.cos(angle) * math.cos(ring_angle)
+                y1 = y + ring_radius * math.sin(angle) * 0.3
+                pygame.draw.circle(surface, (200, 150, 0), (int(x1), int(y1)), 2)
         # Core sphere (cartoon style with golden appearance)
-        pygame.draw.circle(screen, (200, 150, 0), (int(self.x), int(y_pos)), body_size + 3)
-        pygame.draw.circle(screen, self.color, (int(self.x), int(y_pos)), body_size)
-        pygame.draw.circle(screen, WHITE, (int(self.x), int(y_pos)), body_size, 2)
-        # Quantum laser beam when shooting (level-based)
+        pygame.draw.circle(surface, (200, 150, 0), (int(x), int(y)), body_size + 3)
+        pygame.draw.circle(surface, self.color, (int(x), int(y)), body_size)
+        pygame.draw.circle(surface, WHITE, (int(x), int(y)), body_size, 2)
+
+    def draw_live(self, screen, y_pos):
+        """Quantum laser beam when shooting (level-based)."""
         if self.shoot_flash > 0:
             beam_length = self.range
             beam_end_x = self.x + math.cos(self.target_angle) * beam_length
@@ -97,15 +130,3 @@ class QuantumTower(Tower):
                     pygame.draw.line(screen, beam_color,
                                    (self.x - perp_x, y_pos - perp_y),
                                    (beam_end_x - perp_x, beam_end_y - perp_y), width)
-        # Glowing core (golden)
-        core_pulse = abs(math.sin(self.animation_frame * 0.1))
-        core_size = int(8 * (0.5 + core_pulse * 0.5))
-        pygame.draw.circle(screen, WHITE, (int(self.x), int(y_pos)), core_size)
-        pygame.draw.circle(screen, (255, 235, 100), (int(self.x), int(y_pos)), core_size - 2)
-
-        # Draw level indicator
-        if self.level > 1:
-            star_text = "★" * self.level
-            font = pygame.font.Font(None, 16)
-            level_surf = font.render(star_text, True, YELLOW)
-            screen.blit(level_surf, (int(self.x - 12), int(self.y + 22)))
@@ -0,0 +1,227 @@
+"""Wave plans: every spawn of a wave compiled up front.
+
+``compile_wave`` rolls a whole wave's enemy mix when the wave starts and
+returns a ``WavePlan`` of (spawn tick, archetype, health, speed, reward)
+entries; the simulation then just walks the plan with a cursor. Because the
+plan exists before the first spawn, the UI can preview the next wave and the
+NumPy enemy store can be sized for it in advance.
+
+Waves can also come from a JSON data file (see ``load_wave_file``), which
+replaces the built-in wave for every wave number it lists::
+
+    {"waves": {"12": [
+        {"archetype": "tank", "count": 5, "interval": 40},
+        {"archetype": "boss", "count": 1, "health": 5000, "reward": 100}
+    ]}}
+
+Each group spawns ``count`` enemies ``interval`` ticks apart (default: the
+simulation's spawn interval) after the previous group; ``health``, ``speed``
+and ``reward`` default to the archetype's built-in stats for that wave.
+``count``, ``interval`` and ``reward`` must be whole numbers of at least 0, and
+``health`` and ``speed`` positive numbers.
+"""
+
+import json
+import math
+from collections import Counter, namedtuple
+
+from .constants import RED, PURPLE, ORANGE, STEEL_BLUE
+from .enemy import Enemy
+
+# Ticks between spawns in the built-in waves
+SPAWN_INTERVAL = 60
+
+Archetype = namedtuple(
+    "Archetype", ["enemy_type", "color", "shield", "immune"]
+)
+
+# How each archetype looks and behaves; its stats come from ``default_stats``
+ARCHETYPES = {
+    "normal": Archetype("normal", RED, False, False),  # Standard blob alien
+    "shield": Archetype("normal", (100, 150, 255), True, False),  # Shield jellyfish
+    "scout": Archetype("scout", ORANGE, False, False),  # Scout dart ship
+    "tank": Archetype("tank", STEEL_BLUE, False, False),  # Tank beetle
+    "boss": Archetype("boss", PURPLE, False, False),  # Boss battleship
+    "ufo": Archetype("ufo", (180, 180, 200), False, False),  # Flying saucer
+    # Wave 50: the Alien King (immune to freeze and knockback) and its elite escort
+    "alien_king": Archetype("alien_king", (150, 0, 150), False, True),
+    "elite_boss": Archetype("boss", PURPLE, False, False),
+    "elite_ufo": Archetype("ufo", (180, 180, 200), False, False),
+    "elite_tank": Archetype("tank", STEEL_BLUE, False, False),
+}
+ARCHETYPE_NAMES = tuple(ARCHETYPES)
+
+SpawnEntry = namedtuple("SpawnEntry", ["tick", "archetype", "health", "speed", "reward"])
+SpawnEntry.__doc__ = "One planned spawn; ``tick`` counts from the start of the wave."
+
+
+def default_stats(archetype, wave):
+    """
+    Built-in (health, speed, reward) of an archetype on a given wave.
+
+    Speed grows by 10% every 3 waves.
+    """
+    speed_mult = 1 + (wave // 3) * 0.1
+    if archetype == "ufo":
+        health, speed, reward = 120 + wave * 15, 1.8, 25
+    elif archetype == "boss":
+        health, speed, reward = 400 + wave * 50, 0.8, 30
+    elif archetype == "shield":
+        health, speed, reward = 80 + wave * 15, 1.3, 15
+    elif archetype == "scout":
+        health, speed, reward = 30 + wave * 5, 2.5, 8
+    elif archetype == "tank":
+        health, speed, reward = 100 + wave * 20, 1, 18
+    elif archetype == "alien_king":
+        health, speed, reward = 20000, 0.5, 500
+    elif archetype == "elite_boss":
+        health, speed, reward = 800, 0.8, 40
+    elif archetype == "elite_ufo":
+        health, speed, reward = 400, 1.8, 35
+    elif archetype == "elite_tank":
+        health, speed, reward = 600, 1.0, 30
+    else:
+        health, speed, reward = 50 + wave * 10, 1.5, 6
+    return health, speed * speed_mult, reward
+
+
+def _roll_archetype(wave, rng, first):
+    """Pick the archetype of one spawn (the rolls stay in the order the game always used)."""
+    if wave == 50:
+        if first:
+            return "alien_king"
+        roll = rng.random()
+        if roll < 0.4:
+            return "elite_boss"
+        elif roll < 0.7:
+            return "elite_ufo"
+        return "elite_tank"
+
+    if wave >= 10 and rng.random() < 0.2:
+        return "ufo"
+    elif wave >= 7 and rng.random() < 0.15:
+        return "boss"
+    elif wave >= 5 and rng.random() < 0.25:
+        return "shield"
+    elif wave >= 5 and rng.random() < 0.3:
+        return "scout"
+    elif wave >= 3 and rng.random() < 0.2:
+        return "tank"
+    return "normal"
+
+
+def wave_size(wave):
+    """Number of enemies in a built-in wave."""
+    if wave == 50:
+        return 11  # 1 king + 10 minions
+    # Reduced by 35%: (5 + wave * 2) * 0.65 = 3 + wave * 1.3
+    return max(3, int(3 + wave * 1.3))
+
+
+class WavePlan:
+    """
+    Every spawn of one wave, in spawn order.
+
+    Attributes:
+        wave: Wave number
+        entries: Tuple of ``SpawnEntry``, sorted by tick
+    """
+
+    def __init__(self, wave, entries):
+        self.wave = wave
+        self.entries = tuple(entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def counts(self):
+        """Number of enemies per archetype, most common first."""
+        return Counter(entry.archetype for entry in self.entries).most_common()
+
+    def total_health(self):
+        """Sum of the wave's enemy health."""
+        return sum(entry.health for entry in self.entries)
+
+
+def compile_wave(wave, rng, interval=SPAWN_INTERVAL):
+    """
+    Roll a built-in wave's enemy mix and lay out its spawns.
+
+    Args:
+        wave: Wave number
+        rng: ``random.Random`` the archetype rolls are drawn from
+        interval: Ticks between spawns (the first spawn comes one interval in)
+
+    Returns:
+        The ``WavePlan``
+    """
+    entries = []
+    for i in range(wave_size(wave)):
+        archetype = _roll_archetype(wave, rng, first=i == 0)
+        entries.append(SpawnEntry((i + 1) * interval, archetype, *default_stats(archetype, wave)))
+    return WavePlan(wave, entries)
+
+
+def make_enemy(entry):
+    """Build the ``Enemy`` for a planned spawn."""
+    archetype = ARCHETYPES[entry.archetype]
+    enemy = Enemy(entry.health, entry.speed, entry.reward, archetype.color, archetype.enemy_type, archetype.shield)
+    if archetype.immune:
+        enemy.immune_to_knockback = True
+        enemy.immune_to_freeze = True
+    return enemy
+
+
+def _whole_number(group, name, default, wave):
+    """Read an integer field of at least 0 from a wave file group."""
+    value = group.get(name, default)
+    if type(value) is not int or value < 0:
+        raise ValueError(f"Wave {wave}: {name} must be a whole number of at least 0, got {value!r}")
+    return value
+
+
+def _positive_number(group, name, default, wave):
+    """Read a positive, finite number field from a wave file group."""
+    value = group.get(name, default)
+    if type(value) not in (int, float) or not (value > 0 and math.isfinite(value)):
+        raise ValueError(f"Wave {wave}: {name} must be a positive number, got {value!r}")
+    return value
+
+
+def load_wave_file(path, interval=SPAWN_INTERVAL):
+    """
+    Read wave definitions from a JSON data file (format in the module docstring).
+
+    Args:
+        path: File to read
+        interval: Default ticks between spawns for groups that don't set one
+
+    Returns:
+        Dict mapping wave number to ``WavePlan``, for ``Simulation(waves=...)``
+
+    Raises:
+        ValueError: If an archetype is unknown or a value has the wrong type or range
+    """
+    with open(path) as f:
+        data = json.load(f)
+
+    plans = {}
+    for key, groups in data["waves"].items():
+        wave = int(key)
+        entries = []
+        tick = 0
+        for group in groups:
+            archetype = group["archetype"]
+            if archetype not in ARCHETYPES:
+                raise ValueError(f"Unknown archetype in wave {wave}: {archetype}")
+            health, speed, reward = default_stats(archetype, wave)
+            health = _positive_number(group, "health", health, wave)
+            speed = _positive_number(group, "speed", speed, wave)
+            reward = _whole_number(group, "reward", reward, wave)
+            count = _whole_number(group, "count", 1, wave)
+            group_interval = _whole_number(group, "interval", interval, wave)
+            for _ in range(count):
+                tick += group_interval
+                entries.append(SpawnEntry(tick, archetype, health, speed, reward))
+        plans[wave] = WavePlan(wave, entries)
+    return plans